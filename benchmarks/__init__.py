@@ -0,0 +1 @@
+# Pacote de benchmarks do sistema bancário
@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+"""
+Benchmarks do núcleo bancário.
+
+Cobre cadastro e busca no Bank em diferentes escalas, consultas por saldo
+(top-N e faixa), contas distribuídas entre agências, distribuição de
+números de conta, vazão de depósitos, saques e transferências, custo da
+captura de alterações (CDC), geração de extrato, contagem diária de
+transações, leitura do livro-razão, validação de CPF e carga/análise do log
+usadas pelo index.py.
+
+Uso:
+    python -m benchmarks.bench_core
+    python -m benchmarks.bench_core --scales 10000,100000 --compare benchmarks/results/anterior.json
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+import argparse
+import json
+import os
+import random
+import sys
+import threading
+
+from benchmarks.runner import BenchmarkRunner, compare_results, quiet_environment
+from benchmarks.workload import Workload
+from src import Bank
+from src.account_numbers import DEFAULT_BLOCK_SIZE, AccountNumberAllocator
+from src.decorators import configure_log_sinks
+from src.indexes import normalize_search_text
+from src.limits import LimitEngine
+from src.log_analysis import available_backends, load_log_analyzer
+from src.log_rollups import LogRollups, load_rollups
+from src.log_sinks import AsyncFileSink, FileSink, NullSink, RingBufferSink, log_pipeline
+from src.entities import (Account, AccountNumber, Address, AgencyNumber, CPF, Client, DateOfBirth,
+                          Deposit, Withdraw, Transfer)
+
+DEFAULT_SCALES = (10_000, 100_000, 1_000_000)
+DEFAULT_HISTORIES = (1_000, 10_000, 100_000)
+DEFAULT_OPERATIONS = 2_000
+DEFAULT_LOG_LINES = 100_000
+DEFAULT_AGENCIES = 10
+
+# Objetos compartilhados entre clientes para reduzir memória nas escalas grandes
+SHARED_DATE_OF_BIRTH = DateOfBirth("01/01/1990")
+SHARED_ADDRESS = Address("Rua Benchmark", "100", "Centro", "Recife", "PE")
+
+def make_client(index: int) -> Client:
+    """Cria um cliente determinístico com CPF válido."""
+    return Client(
+        name=f"Cliente {index}",
+        cpf=CPF.generate(index + 1),
+        date_of_birth=SHARED_DATE_OF_BIRTH,
+        address=SHARED_ADDRESS
+    )
+
+def build_bank(size: int) -> Bank:
+    """Monta um banco determinístico com `size` clientes, cada um com uma conta."""
+    return Workload(clients=size, seed=0).build_bank()
+
+def samples_for_scale(size: int, budget: int = 2_000_000) -> int:
+    """Número de amostras para operações lineares, limitando o tempo total por escala."""
+    return max(5, min(200, budget // size))
+
+def bench_bank_scale(runner: BenchmarkRunner, scales: List[int]) -> None:
+    """Cadastro e busca de clientes e contas no Bank."""
+    rng = random.Random(42)
+    for size in scales:
+        bank = build_bank(size)
+        samples = samples_for_scale(size)
+
+        new_clients = [make_client(size + index) for index in range(samples)]
+
+        def reset_clients():
+            # Substituir a lista refaz os índices de clientes; a consulta os reconstrói fora da medição
+            bank.clients = bank.clients[:size]
+            bank.has_registered_CPF(bank.clients[0].cpf)
+
+        def register():
+            for client in new_clients:
+                bank.register_client(client)
+
+        runner.measure('bank.register_client', register, samples, setup=reset_clients, scale=size)
+        reset_clients()
+
+        cpfs = [bank.clients[rng.randrange(size)].cpf for _ in range(samples)]
+
+        def search_client():
+            for cpf in cpfs:
+                bank.search_client(cpf)
+
+        runner.measure('bank.search_client', search_client, samples, scale=size)
+
+        # Busca por nome e prefixo de CPF; a primeira consulta constrói o índice de busca
+        def reset_search_index():
+            bank.clients = bank.clients[:size]
+
+        runner.measure('bank.client_search_index[build]',
+                       lambda: bank.search_clients_by_name('silva', limit=1), size,
+                       setup=reset_search_index, scale=size)
+        queries = [normalize_search_text(bank.clients[rng.randrange(size)].name)[:6] for _ in range(samples)]
+        prefixes = [bank.clients[rng.randrange(size)].cpf.cpf[:7] for _ in range(samples)]
+
+        def search_by_name():
+            for query in queries:
+                bank.search_clients_by_name(query)
+
+        def search_by_cpf_prefix():
+            for prefix in prefixes:
+                bank.search_clients_by_cpf_prefix(prefix)
+
+        runner.measure('bank.search_clients_by_name', search_by_name, samples, scale=size)
+        runner.measure('bank.search_clients_by_cpf_prefix', search_by_cpf_prefix, samples, scale=size)
+
+        numbers = [AccountNumber(rng.randrange(size) + 1) for _ in range(samples)]
+
+        def search_account():
+            for number in numbers:
+                bank.search_account(number)
+
+        runner.measure('bank.search_account', search_account, samples, scale=size)
+
+        pairs = [(bank.accounts[int(str(number)) - 1].client.cpf, number) for number in numbers]
+
+        def signin_account():
+            for cpf, number in pairs:
+                bank.signin_account(cpf, number)
+
+        runner.measure('bank.signin_account', signin_account, samples, scale=size)
+
+        def list_accounts():
+            for _ in bank.get_accounts_iterator():
+                pass
+
+        def list_accounts_projected():
+            for _ in bank.get_accounts_iterator(fields=('account_number', 'balance')).pages():
+                pass
+
+        def list_account_summaries():
+            fields = ('account_number', 'last_transaction_at', 'transactions_today', 'totals_by_type')
+            for _ in bank.get_accounts_iterator(fields=fields).pages():
+                pass
+
+        runner.measure('account_iterator.full', list_accounts, size, scale=size)
+        runner.measure('account_iterator.projected_pages', list_accounts_projected, size, scale=size)
+        runner.measure('account_iterator.summary_pages', list_account_summaries, size, scale=size)
+
+        balance_accounts = [bank.accounts[rng.randrange(size)] for _ in range(samples)]
+
+        def update_balances():
+            for account in balance_accounts:
+                account.add_balance(Decimal('1.00'))
+
+        runner.measure('account.add_balance[indexed]', update_balances, samples, scale=size)
+
+        def top_accounts():
+            for _ in range(samples):
+                bank.top_accounts_by_balance(10)
+
+        def balance_range():
+            for _ in range(samples):
+                bank.accounts_with_balance_between(Decimal('1.00'), Decimal('5.00'))
+
+        runner.measure('bank.top_accounts_by_balance', top_accounts, samples, scale=size)
+        runner.measure('bank.accounts_with_balance_between', balance_range, samples, scale=size)
+        del bank
+
+def bench_agencies(runner: BenchmarkRunner, scales: List[int], agencies: int = DEFAULT_AGENCIES) -> None:
+    """Contas distribuídas entre agências: busca, transferência entre agências e consultas por agência."""
+    rng = random.Random(7)
+    agency_numbers = [AgencyNumber(number + 1) for number in range(agencies)]
+    for size in scales:
+        # Sem políticas de limite: as mesmas contas transferem em todas as repetições
+        bank = Bank(limit_engine=LimitEngine(()))
+        for index in range(size):
+            client = make_client(index)
+            bank.clients.append(client)
+            bank.create_account(client, agency_numbers[index % agencies])
+        for account in bank.accounts:
+            account.add_balance(Decimal(rng.randint(0, 100_000)) / 100)
+        samples = samples_for_scale(size)
+
+        keys = [(account.account_number, account.agency_number)
+                for account in (bank.accounts[rng.randrange(size)] for _ in range(samples))]
+
+        def search_account():
+            for account_number, agency_number in keys:
+                bank.search_account(account_number, agency_number)
+
+        runner.measure('bank.search_account[agencies]', search_account, samples, scale=size, agencies=agencies)
+
+        pairs = [(bank.accounts[index], bank.accounts[index + 1]) for index in range(min(samples, size - 1))]
+
+        def transfer_between_agencies():
+            for source, destination in pairs:
+                source.transfer(Decimal('0.01'), destination)
+
+        runner.measure('account.transfer[cross_agency]', transfer_between_agencies, len(pairs),
+                       scale=size, agencies=agencies)
+
+        agency_number = agency_numbers[0]
+
+        def top_accounts_all():
+            for _ in range(samples):
+                bank.top_accounts_by_balance(10)
+
+        def top_accounts_agency():
+            for _ in range(samples):
+                bank.top_accounts_by_balance(10, agency_number)
+
+        def list_agency():
+            for _ in bank.get_accounts_iterator(fields=('account_number', 'balance'),
+                                                agency_number=agency_number).pages():
+                pass
+
+        runner.measure('bank.top_accounts_by_balance[all_agencies]', top_accounts_all, samples,
+                       scale=size, agencies=agencies)
+        runner.measure('bank.top_accounts_by_balance[agency]', top_accounts_agency, samples,
+                       scale=size, agencies=agencies)
+        runner.measure('account_iterator.agency_pages', list_agency, size // agencies, scale=size, agencies=agencies)
+        del bank
+
+def bench_transactions(runner: BenchmarkRunner, operations: int) -> None:
+    """Vazão de depósitos, saques e transferências (uma operação por conta, por causa dos limites)."""
+    state = {}
+
+    def setup():
+        bank = build_bank(operations + 1)
+        for account in bank.accounts:
+            account.add_balance(Decimal('1000.00'))
+        state['accounts'] = bank.accounts
+
+    def deposit():
+        for account in state['accounts'][:operations]:
+            account.deposit(Decimal('10.00'))
+
+    def withdraw():
+        for account in state['accounts'][:operations]:
+            account.withdraw(Decimal('10.00'))
+
+    def transfer():
+        accounts = state['accounts']
+        for index in range(operations):
+            accounts[index].transfer(Decimal('10.00'), accounts[index + 1])
+
+    runner.measure('account.deposit', deposit, operations, setup=setup)
+    runner.measure('account.withdraw', withdraw, operations, setup=setup)
+    def rejected_transfer():
+        # Saldo insuficiente: a falha volta como resultado, sem exceção nem saída no console
+        accounts = state['accounts']
+        for index in range(operations):
+            accounts[index].submit(Transfer(accounts[index], accounts[index + 1], Decimal('5000.00')))
+
+    runner.measure('account.transfer', transfer, operations, setup=setup)
+    runner.measure('account.submit[rejected]', rejected_transfer, operations, setup=setup)
+
+def bench_log_sinks(runner: BenchmarkRunner, operations: int, directory: str) -> None:
+    """Custo dos depósitos com cada configuração de destinos do log de transações."""
+    configurations = {
+        'file': lambda: [FileSink(os.path.join(directory, 'bench-sink.txt'))],
+        'async_file': lambda: [AsyncFileSink(os.path.join(directory, 'bench-async.txt'))],
+        'file,sample=0.1': lambda: [FileSink(os.path.join(directory, 'bench-sampled.txt'), sample_rate=0.1)],
+        'ring': lambda: [RingBufferSink()],
+        'null': lambda: [NullSink()]
+    }
+    state = {}
+
+    def setup(factory):
+        bank = build_bank(operations)
+        configure_log_sinks(*factory())
+        state['accounts'] = bank.accounts
+
+    def deposit():
+        for account in state['accounts']:
+            account.deposit(Decimal('10.00'))
+        log_pipeline.flush()
+
+    try:
+        for name, factory in configurations.items():
+            runner.measure(f'account.deposit[log={name}]', deposit, operations,
+                           setup=lambda factory=factory: setup(factory))
+    finally:
+        # Restaura o destino padrão (log.txt no diretório atual)
+        configure_log_sinks(FileSink())
+
+def bench_cdc(runner: BenchmarkRunner, operations: int, directory: str) -> None:
+    """Custo da captura de alterações (CDC) nos depósitos e vazão do despacho para arquivo."""
+    from src.cdc import ChangeDataCapture, FileSink
+
+    state = {}
+
+    def setup():
+        bank = build_bank(operations)
+        cdc = ChangeDataCapture(capacity=4 * operations)
+        cdc.add_sink(FileSink(os.path.join(directory, 'bench-cdc.jsonl')))
+        cdc.attach(bank)
+        state['accounts'] = bank.accounts
+        state['cdc'] = cdc
+
+    def deposit():
+        for account in state['accounts']:
+            account.deposit(Decimal('10.00'))
+
+    def dispatch():
+        state['cdc'].dispatch_pending()
+
+    runner.measure('account.deposit[cdc]', deposit, operations, setup=setup)
+    # Cada depósito gera dois eventos (saldo e transação)
+    runner.measure('cdc.dispatch_pending[file]', dispatch, 2 * operations,
+                   setup=lambda: (setup(), deposit()))
+
+def build_history(size: int) -> Account:
+    """
+    Cria uma conta com `size` transações já registradas, espalhadas por vários dias.
+
+    As transações são montadas diretamente (sem execute) para contornar o limite
+    diário e isolar o custo de leitura do histórico.
+    """
+    bank = build_bank(2)
+    account, other = bank.accounts
+    start = datetime.now() - timedelta(seconds=size * 60)
+    for index in range(size):
+        kind = index % 3
+        if kind == 0:
+            transaction = Deposit(account, Decimal('50.00'))
+        elif kind == 1:
+            transaction = Withdraw(account, Decimal('10.00'))
+        else:
+            transaction = Transfer(account, other, Decimal('5.00'))
+        transaction._timestamp = start + timedelta(seconds=index * 60)
+        account.add_transaction(transaction)
+    return account
+
+def bench_history(runner: BenchmarkRunner, histories: List[int]) -> None:
+    """Geração de extrato, contagem diária e iteração filtrada sobre históricos longos."""
+    for size in histories:
+        account = build_history(size)
+        runner.measure('account.generate_extract_information_text',
+                       account.generate_extract_information_text, size, history=size)
+        runner.measure('account.get_daily_transactions_count',
+                       account.get_daily_transactions_count, 1, history=size)
+        runner.measure('account.can_perform_transaction_today',
+                       account.can_perform_transaction_today, 1, history=size)
+
+        def iterate_deposits():
+            for _ in account.iterate_transactions('deposit'):
+                pass
+
+        runner.measure('account.iterate_transactions[deposit]', iterate_deposits, size, history=size)
+
+        # Última hora do histórico: o índice temporal evita percorrer as demais transações
+        until = account.transactions[-1]._timestamp + timedelta(seconds=1)
+        since = until - timedelta(hours=1)
+
+        def iterate_last_hour():
+            for _ in account.iterate_transactions('transfer', since=since, until=until):
+                pass
+
+        runner.measure('account.iterate_transactions[transfer,last_hour]', iterate_last_hour, 1, history=size)
+
+        ledger = account.ledger
+
+        def stream_ledger():
+            for _ in ledger.stream():
+                pass
+
+        runner.measure('ledger.stream', stream_ledger, len(ledger), history=size)
+
+def bench_cpf(runner: BenchmarkRunner, operations: int) -> None:
+    """Validação e formatação de CPF."""
+    raw = [str(CPF.generate(index + 1)) for index in range(operations)]
+
+    def validate():
+        for value in raw:
+            CPF(value)
+
+    runner.measure('cpf.validate', validate, operations)
+
+    cpfs = [CPF(value) for value in raw]
+
+    def format_cpf():
+        for cpf in cpfs:
+            str(cpf)
+
+    runner.measure('cpf.format', format_cpf, operations)
+
+def bench_account_numbers(runner: BenchmarkRunner, operations: int, directory: str,
+                          threads: int = 4) -> None:
+    """Distribuição de números de conta: blocos por thread e marca d'água gravada em disco."""
+    state_path = os.path.join(directory, 'bench-account-numbers.json')
+    allocators = {}
+
+    def setup(block_size: int):
+        def prepare():
+            if os.path.exists(state_path):
+                os.remove(state_path)
+            allocators[block_size] = AccountNumberAllocator(block_size, state_path=state_path)
+        return prepare
+
+    for block_size in (1, DEFAULT_BLOCK_SIZE):
+        def allocate(block_size=block_size):
+            allocate_int = allocators[block_size].allocate_int
+            for _ in range(operations):
+                allocate_int()
+
+        runner.measure(f'account_numbers.allocate[block={block_size},persisted]', allocate, operations,
+                       setup=setup(block_size))
+
+    def allocate_threads():
+        allocate_int = allocators[DEFAULT_BLOCK_SIZE].allocate_int
+
+        def worker():
+            for _ in range(operations):
+                allocate_int()
+
+        workers = [threading.Thread(target=worker) for _ in range(threads)]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+
+    runner.measure(f'account_numbers.allocate[threads={threads},persisted]', allocate_threads,
+                   operations * threads, setup=setup(DEFAULT_BLOCK_SIZE))
+
+def write_synthetic_log(path: str, lines: int) -> None:
+    """Grava um log.txt sintético no formato produzido pelo transaction_logger."""
+    rng = random.Random(7)
+    types = ('Deposit', 'Withdraw', 'Transfer')
+    start = datetime(2025, 8, 31, 8, 0, 0)
+    with open(path, 'w', encoding='utf-8') as log_file:
+        for index in range(lines):
+            moment = start + timedelta(seconds=index)
+            account = rng.randrange(1, 1000)
+            record = {
+                'timestamp': moment.strftime('%d/%m/%Y às %H:%M:%S'),
+                'function_name': 'execute',
+                'transaction_type': types[index % 3],
+                'arguments': {'args': [], 'kwargs': {}},
+                'transaction_value': f"{rng.randrange(1, 100000) / 100:.2f}",
+                'account_number': str(account).zfill(8),
+                'client_name': f"Cliente {account}",
+                'return_value': 'True',
+                'status': 'Sucesso' if rng.random() > 0.05 else 'Erro',
+                'duration_seconds': rng.random() / 100,
+                'end_timestamp': moment.strftime('%d/%m/%Y às %H:%M:%S')
+            }
+            log_file.write(json.dumps(record, ensure_ascii=False) + '\n')
+
+def bench_log_analysis(runner: BenchmarkRunner, lines: int, directory: str) -> None:
+    """Carga e análise do log com as funções do index.py."""
+    import index
+
+    path = os.path.join(directory, 'bench-log.txt')
+    write_synthetic_log(path, lines)
+
+    runner.measure('index.carregar_logs', lambda: index.carregar_logs(path), lines, lines=lines)
+    logs = index.carregar_logs(path)
+    runner.measure('index.analisar_logs', lambda: index.analisar_logs(logs), lines, lines=lines)
+    runner.measure('index.filtrar_logs_por_tipo',
+                   lambda: index.filtrar_logs_por_tipo(logs, 'Deposit'), lines, lines=lines)
+    runner.measure('index.filtrar_logs_por_cliente',
+                   lambda: index.filtrar_logs_por_cliente(logs, 'Cliente 1'), lines, lines=lines)
+
+    # Mesmas consultas em cada motor de análise disponível (pandas apenas se instalado)
+    for backend in available_backends():
+        runner.measure(f'log_analysis.load[{backend}]', lambda backend=backend: load_log_analyzer(path, backend),
+                       lines, lines=lines)
+        analyzer = load_log_analyzer(path, backend)
+        runner.measure(f'log_analysis.stats[{backend}]', analyzer.stats, lines, lines=lines)
+        runner.measure(f'log_analysis.filter_by_type[{backend}]',
+                       lambda analyzer=analyzer: analyzer.filter_by_type('Deposit'), lines, lines=lines)
+        runner.measure(f'log_analysis.group_stats[{backend}]',
+                       lambda analyzer=analyzer: analyzer.group_stats('account_number'), lines, lines=lines)
+
+    # Agregados por minuto/hora/dia: construção completa e atualização sem linhas novas
+    runner.measure('log_rollups.rebuild', lambda: LogRollups(path).rebuild(), lines, lines=lines)
+    runner.measure('log_rollups.update[incremental]', lambda: load_rollups(path), lines, lines=lines)
+
+def parse_sizes(text: str) -> List[int]:
+    """Converte '10000,100000' em [10000, 100000]."""
+    return [int(value) for value in text.split(',') if value.strip()]
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks do núcleo bancário")
+    parser.add_argument('--scales', default=','.join(map(str, DEFAULT_SCALES)),
+                        help="Escalas de clientes/contas do Bank (separadas por vírgula)")
+    parser.add_argument('--histories', default=','.join(map(str, DEFAULT_HISTORIES)),
+                        help="Tamanhos de histórico para extrato e contagem diária")
+    parser.add_argument('--operations', type=int, default=DEFAULT_OPERATIONS,
+                        help="Operações por medição de vazão")
+    parser.add_argument('--log-lines', type=int, default=DEFAULT_LOG_LINES,
+                        help="Linhas do log sintético")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições por medição")
+    parser.add_argument('--quick', action='store_true',
+                        help="Usa tamanhos reduzidos (útil para checagens rápidas)")
+    parser.add_argument('--output', help="Arquivo JSON de saída (padrão: benchmarks/results/)")
+    parser.add_argument('--compare', help="Arquivo JSON anterior para detectar regressões")
+    args = parser.parse_args(argv)
+
+    scales = parse_sizes(args.scales)
+    histories = parse_sizes(args.histories)
+    operations = args.operations
+    log_lines = args.log_lines
+    if args.quick:
+        scales, histories, operations, log_lines = [1_000, 10_000], [1_000, 10_000], 500, 10_000
+
+    runner = BenchmarkRunner('core', repeat=args.repeat)
+    with quiet_environment() as directory:
+        bench_bank_scale(runner, scales)
+        bench_agencies(runner, scales)
+        bench_transactions(runner, operations)
+        bench_cdc(runner, operations, directory)
+        bench_account_numbers(runner, operations, directory)
+        bench_log_sinks(runner, operations, directory)
+        bench_history(runner, histories)
+        bench_cpf(runner, operations)
+        bench_log_analysis(runner, log_lines, directory)
+
+    path = runner.save(args.output)
+    print(f"Resultados gravados em {path}", file=sys.stderr)
+
+    if args.compare:
+        for line in compare_results(args.compare, runner.to_dict()):
+            print(line, file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
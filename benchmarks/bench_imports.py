@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmarks de tempo de importação e de custo por chamada nos caminhos quentes.
+
+O tempo de importação é medido em processos novos (cache de módulos vazio);
+o custo por chamada cobre os métodos que antes faziam importações locais
+a cada execução (__str__, iterate_transactions, extrato e listagem de contas).
+
+Uso:
+    python -m benchmarks.bench_imports
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import List
+import argparse
+import subprocess
+import sys
+
+from benchmarks.runner import ROOT_DIRECTORY, BenchmarkRunner, quiet_environment
+
+IMPORT_STATEMENTS = (
+    'import src',
+    'from src import Bank',
+    'from src.entities import CPF',
+    'import index'
+)
+
+def measure_import(statement: str, runs: int) -> List[float]:
+    """
+    Mede o tempo de uma instrução de importação em `runs` processos novos.
+
+    Args:
+        statement (str): Instrução de importação.
+        runs (int): Número de processos.
+
+    Returns:
+        List[float]: Tempo de cada execução, em segundos.
+    """
+    code = ("import time\n"
+            "start = time.perf_counter()\n"
+            f"{statement}\n"
+            "print(time.perf_counter() - start)")
+    timings = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, '-c', code], cwd=ROOT_DIRECTORY,
+                                capture_output=True, text=True, check=True)
+        timings.append(float(output.stdout.strip()))
+    return timings
+
+def bench_import_time(runner: BenchmarkRunner, runs: int) -> None:
+    """Registra o melhor e o tempo médio de importação de cada instrução."""
+    for statement in IMPORT_STATEMENTS:
+        timings = measure_import(statement, runs)
+        best = min(timings)
+        result = {
+            'name': 'import',
+            'params': {'statement': statement},
+            'operations': 1,
+            'best_seconds': best,
+            'mean_seconds': sum(timings) / len(timings),
+            'ops_per_second': 1 / best if best > 0 else None,
+            'microseconds_per_op': best * 1_000_000
+        }
+        runner.results.append(result)
+        print(f"{statement:<40} {best * 1000:>10.2f} ms", file=sys.stderr)
+
+def bench_per_call(runner: BenchmarkRunner, calls: int) -> None:
+    """Custo por chamada dos métodos de apresentação e iteração."""
+    from benchmarks.workload import Workload
+
+    bank = Workload(clients=2, seed=0).build_bank()
+    account, other = bank.accounts
+    account.deposit(Decimal('1000.00'))
+    account.withdraw(Decimal('100.00'))
+    account.transfer(Decimal('50.00'), other)
+    deposit, withdraw, transfer = account.transactions[:3]
+
+    def repeat(func):
+        def run():
+            for _ in range(calls):
+                func()
+        return run
+
+    runner.measure('deposit.__str__', repeat(deposit.__str__), calls)
+    runner.measure('withdraw.__str__', repeat(withdraw.__str__), calls)
+    runner.measure('transfer.__str__', repeat(transfer.__str__), calls)
+    runner.measure('transfer.get_description_for_account[origem]',
+                   repeat(lambda: transfer.get_description_for_account(account)), calls)
+    runner.measure('transfer.get_description_for_account[destino]',
+                   repeat(lambda: transfer.get_description_for_account(other)), calls)
+    runner.measure('account.iterate_transactions[deposit]',
+                   repeat(lambda: list(account.iterate_transactions('deposit'))), calls)
+    runner.measure('account.generate_extract_information_text',
+                   repeat(account.generate_extract_information_text), calls)
+
+    iterator = bank.get_accounts_iterator()
+    info = next(iterator)
+    runner.measure('account_iterator.get_account_info_formatted',
+                   repeat(lambda: iterator.get_account_info_formatted(info)), calls)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmarks de importação e custo por chamada")
+    parser.add_argument('--import-runs', type=int, default=10, help="Processos por instrução de importação")
+    parser.add_argument('--calls', type=int, default=20_000, help="Chamadas por medição")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições por medição")
+    parser.add_argument('--output', help="Arquivo JSON de saída (padrão: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    runner = BenchmarkRunner('imports', repeat=args.repeat)
+    bench_import_time(runner, args.import_runs)
+    with quiet_environment():
+        bench_per_call(runner, args.calls)
+
+    path = runner.save(args.output)
+    print(f"Resultados gravados em {path}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Benchmark de serialização dos registros do log de transações (registros/s).
+
+Compara o json.dumps histórico, o codificador especializado no esquema do
+log (LogRecordEncoder) e, se instalado, o orjson; mede também a formatação
+das datas e o custo do transaction_logger por depósito, com e sem
+políticas de amostragem do log.
+
+Uso:
+    python -m benchmarks.bench_logging
+    python -m benchmarks.bench_logging --records 200000 --accounts 1000
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import List
+import argparse
+import random
+import sys
+
+from benchmarks.runner import BenchmarkRunner, quiet_environment
+from benchmarks.bench_core import build_bank
+from src.decorators import configure_log_policy, configure_log_sinks
+from src.log_encoding import LOG_TIMESTAMP_FORMAT, LogRecordEncoder, TimestampFormatter, orjson, orjson_serializer
+from src.log_policy import LEVEL_WARNING, LogPolicy
+from src.log_sinks import FileSink, RingBufferSink, compact_json_serializer, json_serializer
+
+def make_records(count: int, accounts: int, seed: int = 42) -> List[dict]:
+    """Registros no formato do transaction_logger, com contas e clientes repetidos."""
+    rng = random.Random(seed)
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    records = []
+    for index in range(count):
+        account = rng.randrange(accounts)
+        moment = start + timedelta(milliseconds=index * 10)
+        record = {
+            'timestamp': moment.strftime(LOG_TIMESTAMP_FORMAT),
+            'function_name': 'execute',
+            'transaction_type': rng.choice(('Deposit', 'Withdraw', 'Transfer')),
+            'arguments': {'args': [], 'kwargs': {}},
+            'transaction_value': f"{rng.randint(1, 500)}.00",
+            'account_number': f"{account:08d}",
+            'client_name': f"Cliente {account} São João"
+        }
+        if record['transaction_type'] == 'Transfer':
+            destination = rng.randrange(accounts)
+            record['destination_account'] = f"{destination:08d}"
+            record['destination_client'] = f"Cliente {destination} São João"
+        record['return_value'] = 'True'
+        record['status'] = 'Sucesso'
+        record['duration_seconds'] = rng.random() / 1000
+        record['end_timestamp'] = record['timestamp']
+        records.append(record)
+    return records
+
+def bench_serializers(runner: BenchmarkRunner, records: List[dict]) -> None:
+    """Registros serializados por segundo com cada serializador."""
+    serializers = {
+        'json.dumps': json_serializer,
+        'json.dumps[compact]': compact_json_serializer,
+        'log_record_encoder': LogRecordEncoder()
+    }
+    if orjson is not None:
+        serializers['orjson'] = orjson_serializer
+    for name, serializer in serializers.items():
+        def serialize(serializer=serializer):
+            for record in records:
+                serializer(record)
+        runner.measure(f'log.serialize[{name}]', serialize, len(records), records=len(records))
+
+def bench_timestamps(runner: BenchmarkRunner, count: int) -> None:
+    """Formatação das datas do log: strftime a cada registro vs. texto reaproveitado por segundo."""
+    start = datetime(2025, 1, 1, 9, 0, 0)
+    moments = [start + timedelta(milliseconds=index) for index in range(count)]
+    formatter = TimestampFormatter()
+
+    def with_strftime():
+        for moment in moments:
+            moment.strftime(LOG_TIMESTAMP_FORMAT)
+
+    def with_formatter():
+        for moment in moments:
+            formatter.format(moment)
+
+    runner.measure('log.timestamp[strftime]', with_strftime, count)
+    runner.measure('log.timestamp[formatter]', with_formatter, count)
+
+def bench_logger(runner: BenchmarkRunner, operations: int, directory: str) -> None:
+    """Depósitos com o log em memória e em arquivo, com o serializador padrão e o json.dumps."""
+    configurations = {
+        'ring,json.dumps': lambda: RingBufferSink(serializer=json_serializer),
+        'ring,default': lambda: RingBufferSink(),
+        'file,json.dumps': lambda: FileSink(f'{directory}/bench-logging.txt', serializer=json_serializer),
+        'file,default': lambda: FileSink(f'{directory}/bench-logging.txt')
+    }
+    state = {}
+
+    def setup(factory):
+        configure_log_sinks(factory())
+        state['accounts'] = build_bank(operations).accounts
+
+    def deposit():
+        for account in state['accounts']:
+            account.deposit(Decimal('10.00'))
+
+    try:
+        for name, factory in configurations.items():
+            runner.measure(f'account.deposit[log={name}]', deposit, operations,
+                           setup=lambda factory=factory: setup(factory))
+    finally:
+        configure_log_sinks(FileSink())
+
+def bench_policies(runner: BenchmarkRunner, operations: int, directory: str) -> None:
+    """Depósitos em arquivo com cada política de log (avaliada antes da montagem do registro)."""
+    policies = {
+        'all': lambda: None,
+        'sample=0.01': lambda: LogPolicy(success_sample_rate=0.01),
+        'per_account=1/min': lambda: LogPolicy(max_records_per_account=1),
+        'level=warning': lambda: LogPolicy(level=LEVEL_WARNING)
+    }
+    state = {}
+
+    def setup(factory):
+        configure_log_sinks(FileSink(f'{directory}/bench-policy.txt'))
+        configure_log_policy(factory())
+        # Cinco depósitos por conta, para que o limite por conta tenha efeito
+        state['accounts'] = build_bank(operations // 5).accounts * 5
+
+    def deposit():
+        for account in state['accounts']:
+            account.deposit(Decimal('10.00'))
+
+    try:
+        for name, factory in policies.items():
+            runner.measure(f'account.deposit[policy={name}]', deposit, operations,
+                           setup=lambda factory=factory: setup(factory))
+    finally:
+        configure_log_policy(None)
+        configure_log_sinks(FileSink())
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark da serialização do log de transações")
+    parser.add_argument('--records', type=int, default=100_000, help="Registros serializados por medição")
+    parser.add_argument('--accounts', type=int, default=1_000, help="Contas distintas nos registros")
+    parser.add_argument('--operations', type=int, default=2_000, help="Depósitos por medição do logger")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições por medição")
+    parser.add_argument('--output', help="Arquivo JSON de saída (padrão: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    runner = BenchmarkRunner('logging', repeat=args.repeat)
+    records = make_records(args.records, args.accounts)
+    with quiet_environment() as directory:
+        bench_serializers(runner, records)
+        bench_timestamps(runner, args.records)
+        bench_logger(runner, args.operations, directory)
+        bench_policies(runner, args.operations, directory)
+
+    path = runner.save(args.output)
+    print(f"Resultados gravados em {path}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
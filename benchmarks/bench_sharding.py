@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Benchmark de vazão do banco particionado (ShardedBank) por quantidade de shards.
+
+Mede depósitos enviados em lotes a todos os shards e transferências entre
+shards (duas fases). Em uma máquina com vários núcleos, a vazão dos lotes
+deve crescer com o número de shards.
+
+Uso:
+    python -m benchmarks.bench_sharding
+    python -m benchmarks.bench_sharding --shards 1,2,4,8 --accounts 4000
+"""
+
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import List
+import argparse
+import os
+import sys
+
+from benchmarks.runner import BenchmarkRunner, quiet_environment
+from benchmarks.bench_core import make_client, parse_sizes
+from src.sharding import ShardedBank, shard_for
+
+def bench_shards(runner: BenchmarkRunner, shards: int, accounts: int, batch_size: int) -> None:
+    """Depósitos em lote e transferências entre shards com `shards` processos."""
+    with ShardedBank(shards=shards) as bank:
+        numbers = [bank.create_account(make_client(index)) for index in range(accounts)]
+        batches = [[('deposit', number, Decimal('10.00')) for number in numbers[start:start + batch_size]]
+                   for start in range(0, accounts, batch_size)]
+
+        def deposit_batches():
+            for batch in batches:
+                bank.execute_batch(batch)
+
+        # Cada rodada consome uma transação diária por conta (limite de 10 por dia)
+        runner.measure('sharded.deposit_batch', deposit_batches, accounts,
+                       shards=shards, batch_size=batch_size)
+
+        if shards > 1:
+            pairs = [(number, number + 1) for number in numbers[:-1:2]
+                     if shard_for(number, shards) != shard_for(number + 1, shards)]
+
+            def cross_shard_transfers():
+                for source, destination in pairs:
+                    bank.transfer(source, destination, Decimal('1.00'))
+
+            runner.measure('sharded.transfer[cross_shard]', cross_shard_transfers, len(pairs), shards=shards)
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark do banco particionado")
+    parser.add_argument('--shards', default=','.join(str(value) for value in sorted({1, 2, 4, os.cpu_count() or 1})),
+                        help="Quantidades de shards (separadas por vírgula)")
+    parser.add_argument('--accounts', type=int, default=2_000, help="Contas criadas por configuração")
+    parser.add_argument('--batch-size', type=int, default=500, help="Operações por lote")
+    parser.add_argument('--repeat', type=int, default=3, help="Repetições por medição (máximo 5, pelo limite diário)")
+    parser.add_argument('--output', help="Arquivo JSON de saída (padrão: benchmarks/results/)")
+    args = parser.parse_args(argv)
+
+    runner = BenchmarkRunner('sharding', repeat=min(args.repeat, 5))
+    with quiet_environment():
+        for shards in parse_sizes(args.shards):
+            bench_shards(runner, shards, args.accounts, args.batch_size)
+
+    path = runner.save(args.output)
+    print(f"Resultados gravados em {path}", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,196 @@
+"""
+Infraestrutura comum dos benchmarks: medição, ambiente silencioso e gravação dos resultados.
+"""
+
+from __future__ import annotations
+
+from contextlib import contextmanager, redirect_stdout
+from datetime import datetime
+from typing import Callable, Dict, List, Optional
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+
+ROOT_DIRECTORY = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+RESULTS_DIRECTORY = os.path.join(ROOT_DIRECTORY, 'benchmarks', 'results')
+
+if ROOT_DIRECTORY not in sys.path:
+    sys.path.insert(0, ROOT_DIRECTORY)
+
+def get_git_revision() -> Optional[str]:
+    """
+    Retorna o commit atual do repositório, se disponível.
+
+    Returns:
+        str: Hash curto do commit, ou None fora de um repositório git.
+    """
+    try:
+        output = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'],
+            cwd=ROOT_DIRECTORY, capture_output=True, text=True, check=True
+        )
+        return output.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+@contextmanager
+def quiet_environment():
+    """
+    Executa o bloco em um diretório temporário e com a saída padrão descartada.
+
+    Com o destino padrão do log, as transações gravam `log.txt` no diretório
+    atual; isso mantém o custo real da escrita do log sem poluir o repositório.
+    """
+    from src.entities import Transaction
+
+    previous_directory = os.getcwd()
+    previous_waiting_time = Transaction.processing_waiting_time_in_seconds
+    with tempfile.TemporaryDirectory(prefix='bench-') as directory:
+        os.chdir(directory)
+        Transaction.processing_waiting_time_in_seconds = 0
+        try:
+            with open(os.devnull, 'w', encoding='utf-8') as devnull, redirect_stdout(devnull):
+                yield directory
+        finally:
+            Transaction.processing_waiting_time_in_seconds = previous_waiting_time
+            os.chdir(previous_directory)
+
+class BenchmarkRunner:
+    """
+    Executa benchmarks e acumula resultados em formato legível por máquina.
+
+    Cada resultado registra o nome, os parâmetros, o número de operações,
+    o melhor tempo entre as repetições e as métricas derivadas (ops/s e µs/op).
+    """
+
+    def __init__(self, suite: str, repeat: int = 3):
+        """
+        Inicializa o executor.
+
+        Args:
+            suite (str): Nome da suíte (usado no nome do arquivo de resultados).
+            repeat (int): Número de repetições de cada medição (usa-se o melhor tempo).
+        """
+        self._suite = suite
+        self._repeat = repeat
+        self._results: List[dict] = []
+
+    @property
+    def results(self) -> List[dict]:
+        """Retorna os resultados coletados até o momento."""
+        return self._results
+
+    def measure(self, name: str, func: Callable[[], None], operations: int,
+                setup: Optional[Callable[[], None]] = None, **params) -> dict:
+        """
+        Mede uma função que executa `operations` operações por chamada.
+
+        Args:
+            name (str): Nome do benchmark.
+            func (Callable): Função medida.
+            operations (int): Número de operações realizadas por chamada de `func`.
+            setup (Callable, optional): Preparação executada (fora da medição) antes de cada repetição.
+            **params: Parâmetros registrados junto ao resultado (ex.: escala).
+
+        Returns:
+            dict: Resultado da medição.
+        """
+        timings = []
+        for _ in range(self._repeat):
+            if setup is not None:
+                setup()
+            start = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - start)
+
+        best = min(timings)
+        result = {
+            'name': name,
+            'params': params,
+            'operations': operations,
+            'best_seconds': best,
+            'mean_seconds': sum(timings) / len(timings),
+            'ops_per_second': operations / best if best > 0 else None,
+            'microseconds_per_op': best * 1_000_000 / operations if operations else None
+        }
+        self._results.append(result)
+        self._report(result)
+        return result
+
+    def _report(self, result: dict) -> None:
+        """Exibe um resumo do resultado no stderr (o stdout pode estar silenciado)."""
+        params = ', '.join(f"{key}={value}" for key, value in result['params'].items())
+        print(f"{result['name']:<40} {params:<30} "
+              f"{result['microseconds_per_op']:>12.2f} µs/op "
+              f"{result['ops_per_second']:>14.1f} ops/s", file=sys.stderr)
+
+    def to_dict(self) -> dict:
+        """
+        Retorna os resultados com metadados do ambiente de execução.
+
+        Returns:
+            dict: Documento com metadados e lista de resultados.
+        """
+        return {
+            'suite': self._suite,
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'git_revision': get_git_revision(),
+            'python_version': platform.python_version(),
+            'platform': platform.platform(),
+            'repeat': self._repeat,
+            'results': self._results
+        }
+
+    def save(self, path: Optional[str] = None) -> str:
+        """
+        Grava os resultados em JSON.
+
+        Args:
+            path (str, optional): Caminho do arquivo. Por padrão usa
+                benchmarks/results/<suite>-<data>-<commit>.json.
+
+        Returns:
+            str: Caminho do arquivo gravado.
+        """
+        document = self.to_dict()
+        if path is None:
+            os.makedirs(RESULTS_DIRECTORY, exist_ok=True)
+            stamp = datetime.now().strftime('%Y%m%d-%H%M%S')
+            revision = document['git_revision'] or 'local'
+            path = os.path.join(RESULTS_DIRECTORY, f"{self._suite}-{stamp}-{revision}.json")
+        with open(path, 'w', encoding='utf-8') as result_file:
+            json.dump(document, result_file, ensure_ascii=False, indent=2)
+        return path
+
+def compare_results(baseline_path: str, current: dict, threshold: float = 0.10) -> List[str]:
+    """
+    Compara resultados atuais com um arquivo de referência e aponta regressões.
+
+    Args:
+        baseline_path (str): Arquivo JSON gravado por uma execução anterior.
+        current (dict): Documento atual (BenchmarkRunner.to_dict()).
+        threshold (float): Piora relativa tolerada antes de acusar regressão.
+
+    Returns:
+        List[str]: Linhas descrevendo cada benchmark em comum.
+    """
+    with open(baseline_path, 'r', encoding='utf-8') as baseline_file:
+        baseline = json.load(baseline_file)
+
+    def key(result: dict) -> str:
+        return result['name'] + json.dumps(result['params'], sort_keys=True)
+
+    previous: Dict[str, dict] = {key(result): result for result in baseline['results']}
+    lines = []
+    for result in current['results']:
+        old = previous.get(key(result))
+        if old is None or not old['microseconds_per_op']:
+            continue
+        change = result['microseconds_per_op'] / old['microseconds_per_op'] - 1
+        flag = 'REGRESSÃO' if change > threshold else 'ok'
+        lines.append(f"{flag:<10} {result['name']} {result['params']}: {change:+.1%}")
+    return lines
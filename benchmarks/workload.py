@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""
+Gerador de carga sintética para o sistema bancário.
+
+Monta um Bank determinístico (a partir de uma semente) com N clientes e M contas,
+gera uma sequência de operações com mistura, concentração (skew) e taxa
+configuráveis, e também permite reproduzir um log.txt gravado como carga.
+
+Uso:
+    python -m benchmarks.workload --clients 1000 --accounts 1500 --operations 10000
+    python -m benchmarks.workload --replay log.txt
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from datetime import datetime
+from decimal import Decimal
+from itertools import accumulate
+from typing import Dict, Iterator, List, NamedTuple, Optional, Tuple
+import argparse
+import json
+import random
+import sys
+import time
+
+from benchmarks.runner import quiet_environment
+from src import Bank
+from src.entities import Account, AccountNumber, AgencyNumber, Address, CPF, Client, DateOfBirth
+
+DEFAULT_MIX = {'deposit': 0.5, 'withdraw': 0.3, 'transfer': 0.2}
+OPERATION_KINDS = ('deposit', 'withdraw', 'transfer')
+LOG_TIMESTAMP_FORMAT = '%d/%m/%Y às %H:%M:%S'
+LOG_TRANSACTION_KINDS = {'Deposit': 'deposit', 'Withdraw': 'withdraw', 'Transfer': 'transfer'}
+
+FIRST_NAMES = ('João', 'Maria', 'José', 'Ana', 'Antônio', 'Francisca', 'Carlos', 'Luíza',
+               'Paulo', 'Márcia', 'Pedro', 'Beatriz', 'Lucas', 'Fernanda', 'Gabriel', 'Conceição')
+LAST_NAMES = ('Silva', 'Santos', 'Oliveira', 'Souza', 'Rodrigues', 'Ferreira', 'Alves',
+              'Pereira', 'Lima', 'Gomes', 'Ribeiro', 'Araújo', 'Batista', 'Simões', 'Gonçalves')
+CITIES = (('Recife', 'PE'), ('Olinda', 'PE'), ('São Paulo', 'SP'), ('Campinas', 'SP'),
+          ('Rio de Janeiro', 'RJ'), ('Niterói', 'RJ'), ('Salvador', 'BA'), ('Fortaleza', 'CE'),
+          ('Belo Horizonte', 'MG'), ('Curitiba', 'PR'), ('Porto Alegre', 'RS'), ('Manaus', 'AM'),
+          ('Belém', 'PA'), ('Goiânia', 'GO'), ('Florianópolis', 'SC'), ('João Pessoa', 'PB'))
+DISTRICTS = ('Centro', 'Boa Viagem', 'Jardins', 'Aldeota', 'Savassi', 'Batel', 'Moinhos')
+
+class Operation(NamedTuple):
+    """
+    Operação de carga.
+
+    Atributos:
+        kind (str): 'deposit', 'withdraw' ou 'transfer'.
+        source (int): Índice da conta de origem em bank.accounts.
+        destination (Optional[int]): Índice da conta de destino (apenas transferências).
+        value (Decimal): Valor da operação.
+        at (float): Instante agendado, em segundos a partir do início da carga.
+    """
+    kind: str
+    source: int
+    destination: Optional[int]
+    value: Decimal
+    at: float
+
+class Workload:
+    """
+    Gerador de carga determinístico.
+
+    A mesma semente produz sempre o mesmo banco e a mesma sequência de operações.
+    """
+
+    def __init__(self, clients: int, accounts: Optional[int] = None, seed: int = 0,
+                 mix: Optional[Dict[str, float]] = None, skew: float = 0.0,
+                 rate: Optional[float] = None, min_value: Decimal = Decimal('1.00'),
+                 max_value: Decimal = Decimal('500.00')):
+        """
+        Inicializa o gerador.
+
+        Args:
+            clients (int): Número de clientes.
+            accounts (int, optional): Número de contas (padrão: uma por cliente).
+                Contas excedentes são distribuídas entre os clientes de forma aleatória.
+            seed (int): Semente do gerador pseudoaleatório.
+            mix (Dict[str, float], optional): Proporção de cada tipo de operação.
+            skew (float): Expoente de Zipf para a escolha das contas (0 = uniforme).
+            rate (float, optional): Taxa média de operações por segundo (chegadas de Poisson).
+                None gera todas as operações no instante zero.
+            min_value (Decimal): Menor valor de operação.
+            max_value (Decimal): Maior valor de operação.
+
+        Raises:
+            ValueError: Se os parâmetros forem inválidos.
+        """
+        accounts = clients if accounts is None else accounts
+        mix = dict(DEFAULT_MIX if mix is None else mix)
+        if clients < 1 or accounts < 1:
+            raise ValueError("É necessário ao menos um cliente e uma conta")
+        if any(kind not in OPERATION_KINDS for kind in mix) or sum(mix.values()) <= 0:
+            raise ValueError(f"Mistura inválida. Tipos válidos: {list(OPERATION_KINDS)}")
+        if skew < 0:
+            raise ValueError("O skew deve ser maior ou igual a zero")
+        if rate is not None and rate <= 0:
+            raise ValueError("A taxa deve ser maior que zero")
+        if accounts < 2 and mix.get('transfer', 0) > 0:
+            raise ValueError("Transferências exigem ao menos duas contas")
+
+        self._clients = clients
+        self._accounts = accounts
+        self._seed = seed
+        self._mix = mix
+        self._skew = skew
+        self._rate = rate
+        self._min_cents = int(min_value * 100)
+        self._max_cents = int(max_value * 100)
+
+    @property
+    def seed(self) -> int:
+        """Retorna a semente do gerador."""
+        return self._seed
+
+    def _make_clients(self, rng: random.Random) -> List[Client]:
+        """Gera clientes com CPFs válidos e dados pessoais variados."""
+        # Endereços e datas são reaproveitados entre clientes para economizar memória
+        addresses = [Address(f"Rua {index}", str(index * 10), DISTRICTS[index % len(DISTRICTS)], city, state)
+                     for index, (city, state) in enumerate(CITIES)]
+        dates = [DateOfBirth(f"{day:02d}/{month:02d}/{year}")
+                 for year in range(1950, 2006, 5) for month in (1, 4, 7, 10) for day in (1, 15)]
+
+        clients = []
+        for index in range(self._clients):
+            clients.append(Client(
+                name=f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}",
+                cpf=CPF.generate(index + 1),
+                date_of_birth=rng.choice(dates),
+                address=rng.choice(addresses)
+            ))
+        return clients
+
+    def build_bank(self) -> Bank:
+        """
+        Monta o banco com os clientes e contas configurados.
+
+        Os clientes são gerados com CPFs distintos, por isso são anexados
+        diretamente à lista do banco, sem a verificação de duplicidade de
+        register_client; os índices de clientes do banco os incorporam na
+        primeira consulta. As contas usam register_account e recebem números
+        sequenciais a partir de 1.
+
+        Returns:
+            Bank: Banco populado.
+        """
+        rng = random.Random(self._seed)
+        bank = Bank()
+        clients = self._make_clients(rng)
+        bank.clients.extend(clients)
+
+        agency_number = AgencyNumber(1)
+        for index in range(self._accounts):
+            # Cada cliente recebe ao menos uma conta; as excedentes são sorteadas
+            client = clients[index] if index < self._clients else rng.choice(clients)
+            account = Account(AccountNumber(index + 1), agency_number, client)
+            bank.register_account(client=client, account=account)
+        return bank
+
+    def _account_picker(self, rng: random.Random):
+        """Cria uma função que sorteia índices de conta conforme a distribuição de Zipf."""
+        if self._skew == 0:
+            return lambda: rng.randrange(self._accounts)
+
+        # As contas mais "quentes" são espalhadas aleatoriamente pelo banco
+        ranking = list(range(self._accounts))
+        rng.shuffle(ranking)
+        cumulative = list(accumulate(1 / (rank + 1) ** self._skew for rank in range(self._accounts)))
+        total = cumulative[-1]
+        return lambda: ranking[min(bisect_right(cumulative, rng.random() * total), self._accounts - 1)]
+
+    def generate(self, count: int) -> Iterator[Operation]:
+        """
+        Gera `count` operações de forma preguiçosa.
+
+        Args:
+            count (int): Número de operações.
+
+        Yields:
+            Operation: Próxima operação da carga.
+        """
+        rng = random.Random(self._seed + 1)
+        pick = self._account_picker(rng)
+        kinds = list(self._mix)
+        cumulative = list(accumulate(self._mix[kind] for kind in kinds))
+        moment = 0.0
+
+        for _ in range(count):
+            kind = kinds[bisect_right(cumulative, rng.random() * cumulative[-1])]
+            source = pick()
+            destination = None
+            if kind == 'transfer':
+                destination = pick()
+                while destination == source:
+                    destination = pick()
+            value = Decimal(rng.randint(self._min_cents, self._max_cents)) / 100
+            if self._rate is not None:
+                moment += rng.expovariate(self._rate)
+            yield Operation(kind, source, destination, value, moment)
+
+def replay_log(path: str, initial_balance: Decimal = Decimal('0')) -> Tuple[Bank, List[Operation]]:
+    """
+    Converte um log.txt gravado pelo transaction_logger em banco e carga.
+
+    Cada conta encontrada no log é recriada com o mesmo número e com o cliente
+    do log (CPFs são gerados, pois o log não os registra). Os instantes das
+    operações preservam o espaçamento original entre os registros.
+
+    Args:
+        path (str): Caminho do arquivo de log.
+        initial_balance (Decimal): Saldo inicial das contas recriadas (útil quando
+            o log não começa com o banco vazio).
+
+    Returns:
+        Tuple[Bank, List[Operation]]: Banco montado e operações na ordem do log.
+    """
+    records = []
+    with open(path, 'r', encoding='utf-8') as log_file:
+        for line in log_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue
+            if record.get('transaction_type') in LOG_TRANSACTION_KINDS and 'account_number' in record:
+                records.append(record)
+
+    bank = Bank()
+    agency_number = AgencyNumber(1)
+    clients: Dict[str, Client] = {}
+    indexes: Dict[str, int] = {}
+    shared_date = DateOfBirth("01/01/1990")
+    shared_address = Address("Rua Replay", "1", "Centro", "Recife", "PE")
+
+    def account_index(number: str, client_name: str) -> int:
+        if number not in indexes:
+            client = clients.get(client_name)
+            if client is None:
+                client = Client(client_name, CPF.generate(len(clients) + 1), shared_date, shared_address)
+                clients[client_name] = client
+                bank.clients.append(client)
+            account = Account(AccountNumber(number), agency_number, client)
+            bank.register_account(client=client, account=account)
+            account.add_balance(initial_balance)
+            indexes[number] = len(bank.accounts) - 1
+        return indexes[number]
+
+    operations = []
+    first_moment = None
+    for record in records:
+        moment = datetime.strptime(record['timestamp'], LOG_TIMESTAMP_FORMAT)
+        if first_moment is None:
+            first_moment = moment
+        source = account_index(record['account_number'], record.get('client_name', 'Cliente'))
+        destination = None
+        if 'destination_account' in record:
+            destination = account_index(record['destination_account'],
+                                        record.get('destination_client', 'Cliente'))
+        operations.append(Operation(
+            LOG_TRANSACTION_KINDS[record['transaction_type']],
+            source,
+            destination,
+            Decimal(record['transaction_value']),
+            (moment - first_moment).total_seconds()
+        ))
+    return bank, operations
+
+def run(bank: Bank, operations, pace: bool = False) -> dict:
+    """
+    Aplica as operações no banco.
+
+    Args:
+        bank (Bank): Banco alvo.
+        operations (Iterable[Operation]): Operações a aplicar.
+        pace (bool): Se True, respeita o instante agendado de cada operação.
+
+    Returns:
+        dict: Contagem de operações por tipo e resultado, e a vazão observada.
+    """
+    accounts = bank.accounts
+    stats = {kind: {'ok': 0, 'failed': 0} for kind in OPERATION_KINDS}
+    start = time.perf_counter()
+    total = 0
+
+    for operation in operations:
+        if pace:
+            delay = operation.at - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+        account = accounts[operation.source]
+        try:
+            if operation.kind == 'deposit':
+                account.deposit(operation.value)
+            elif operation.kind == 'withdraw':
+                account.withdraw(operation.value)
+            else:
+                account.transfer(operation.value, accounts[operation.destination])
+            stats[operation.kind]['ok'] += 1
+        except ValueError:
+            stats[operation.kind]['failed'] += 1
+        total += 1
+
+    elapsed = time.perf_counter() - start
+    return {
+        'operations': total,
+        'elapsed_seconds': elapsed,
+        'ops_per_second': total / elapsed if elapsed > 0 else None,
+        'by_kind': stats
+    }
+
+def parse_mix(text: str) -> Dict[str, float]:
+    """Converte 'deposit=0.5,withdraw=0.3,transfer=0.2' em dicionário."""
+    mix = {}
+    for item in text.split(','):
+        kind, _, weight = item.partition('=')
+        mix[kind.strip()] = float(weight)
+    return mix
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Gerador de carga sintética para o banco")
+    parser.add_argument('--clients', type=int, default=1_000)
+    parser.add_argument('--accounts', type=int, default=None)
+    parser.add_argument('--operations', type=int, default=10_000)
+    parser.add_argument('--mix', type=parse_mix, default=DEFAULT_MIX,
+                        help="Ex.: deposit=0.5,withdraw=0.3,transfer=0.2")
+    parser.add_argument('--skew', type=float, default=0.0, help="Expoente de Zipf (0 = uniforme)")
+    parser.add_argument('--rate', type=float, default=None, help="Operações por segundo")
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--replay', help="Reproduz um log.txt gravado em vez de gerar carga")
+    parser.add_argument('--initial-balance', type=Decimal, default=Decimal('0'))
+    parser.add_argument('--pace', action='store_true', help="Respeita os instantes agendados")
+    args = parser.parse_args(argv)
+
+    if args.replay:
+        bank, operations = replay_log(args.replay, args.initial_balance)
+    else:
+        workload = Workload(args.clients, args.accounts, seed=args.seed, mix=args.mix,
+                            skew=args.skew, rate=args.rate)
+        bank = workload.build_bank()
+        for account in bank.accounts:
+            account.add_balance(args.initial_balance)
+        operations = workload.generate(args.operations)
+
+    with quiet_environment():
+        summary = run(bank, operations, pace=args.pace)
+    print(json.dumps(summary, indent=2))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
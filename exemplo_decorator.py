@@ -6,6 +6,7 @@ Exemplo de uso do decorador de transações.
 from decimal import Decimal
 from src import Bank
 from src.entities import AccountNumber, Address, CPF, Client, DateOfBirth
+from src.presenter import ConsolePresenter
 
 def exemplo_decorator():
     """Demonstra o funcionamento do decorador de transações."""
@@ -13,6 +14,9 @@ def exemplo_decorator():
     print("🎯 EXEMPLO DO DECORADOR DE TRANSAÇÕES")
     print("=" * 60)
     
+    # Exibir o andamento das transações no console
+    ConsolePresenter().install()
+    
     # Criar banco e cliente
     bank = Bank()
     client = Client(
@@ -6,6 +6,7 @@ Exemplo de uso do gerador de transações.
 from decimal import Decimal
 from src import Bank
 from src.entities import AccountNumber, Address, CPF, Client, DateOfBirth
+from src.presenter import ConsolePresenter
 
 def exemplo_generator():
     """Demonstra o funcionamento do gerador de transações."""
@@ -13,6 +14,9 @@ def exemplo_generator():
     print("🔄 EXEMPLO DO GERADOR DE TRANSAÇÕES")
     print("=" * 50)
     
+    # Exibir o andamento das transações no console
+    ConsolePresenter().install()
+    
     # Criar banco e conta
     bank = Bank()
     client = Client(
@@ -5,6 +5,7 @@ Bem vindo! Por favor escolha uma das opções:
 [c] Criar uma conta corrente
 [a] Acessar conta
 [l] Listar todas as contas
+[b] Buscar clientes por nome ou CPF
 [g] Analisar logs do sistema
 
 => """
@@ -23,11 +24,41 @@ Escolha uma das opções abaixo:
 
 from decimal import Decimal
 from src import Bank
-from src.entities import AccountNumber, Address, CPF, Client, DateOfBirth
+from src.Bank import DEFAULT_AGENCY_NUMBER
+from src.entities import AccountNumber, Address, AgencyNumber, CPF, Client, DateOfBirth
+from src.entities.AccountIterator import DEFAULT_FIELDS
+from src.limits import DAILY_TRANSACTIONS, DAILY_WITHDRAWALS
+from src.log_analysis import PythonLogAnalyzer, load_log_analyzer
+from src.log_rollups import BUCKET_SECONDS, GRANULARITY_DAY, GRANULARITY_HOUR, GRANULARITY_MINUTE, load_rollups
+from src.log_sinks import DEFAULT_LOG_FILE
+from src.presenter import ConsolePresenter
 import json
-from collections import defaultdict
 
-def carregar_logs(arquivo='log.txt'):
+LOG_FILE = DEFAULT_LOG_FILE
+GRANULARIDADES = {'m': GRANULARITY_MINUTE, 'h': GRANULARITY_HOUR, 'd': GRANULARITY_DAY}
+NOMES_GRANULARIDADE = {GRANULARITY_MINUTE: 'minuto', GRANULARITY_HOUR: 'hora', GRANULARITY_DAY: 'dia'}
+ACCOUNTS_PAGE_SIZE = 50
+# Listagem [l]: dados da conta e resumo das movimentações (sem percorrer os históricos)
+ACCOUNTS_LIST_FIELDS = DEFAULT_FIELDS + ('transactions_today', 'last_transaction_at')
+
+def ler_agencia(padrao=DEFAULT_AGENCY_NUMBER):
+    """
+    Lê o número da agência digitado pelo usuário.
+
+    Args:
+        padrao (AgencyNumber): Agência usada quando nada é digitado (None = todas).
+
+    Raises:
+        ValueError: Se o número da agência for inválido.
+
+    Returns:
+        AgencyNumber: Agência informada, ou `padrao`.
+    """
+    sugestao = f"Enter para {padrao}" if padrao is not None else "Enter para todas"
+    agencia = input(f"Digite a agência ({sugestao}): ").strip()
+    return AgencyNumber(agencia) if agencia else padrao
+
+def carregar_logs(arquivo=LOG_FILE):
     """
     Carrega os logs do arquivo especificado.
     
@@ -64,51 +95,7 @@ def analisar_logs(logs):
     Returns:
         dict: Estatísticas dos logs
     """
-    if not logs:
-        return {}
-    
-    stats = {
-        'total_transacoes': len(logs),
-        'por_tipo': defaultdict(int),
-        'por_status': defaultdict(int),
-        'por_conta': defaultdict(int),
-        'por_cliente': defaultdict(int),
-        'duracao_media': 0,
-        'transacoes_sucesso': 0,
-        'transacoes_erro': 0
-    }
-    
-    total_duracao = 0
-    
-    for log in logs:
-        # Contagem por tipo
-        stats['por_tipo'][log.get('transaction_type', 'Desconhecido')] += 1
-        
-        # Contagem por status
-        status = log.get('status', 'Desconhecido')
-        stats['por_status'][status] += 1
-        
-        if status == 'Sucesso':
-            stats['transacoes_sucesso'] += 1
-        else:
-            stats['transacoes_erro'] += 1
-        
-        # Contagem por conta
-        if 'account_number' in log:
-            stats['por_conta'][log['account_number']] += 1
-        
-        # Contagem por cliente
-        if 'client_name' in log:
-            stats['por_cliente'][log['client_name']] += 1
-        
-        # Duração
-        duracao = log.get('duration_seconds', 0)
-        total_duracao += duracao
-    
-    if logs:
-        stats['duracao_media'] = total_duracao / len(logs)
-    
-    return stats
+    return PythonLogAnalyzer(logs).stats()
 
 def exibir_estatisticas(stats):
     """
@@ -128,10 +115,18 @@ def exibir_estatisticas(stats):
     print(f"✅ Transações com sucesso: {stats['transacoes_sucesso']}")
     print(f"❌ Transações com erro: {stats['transacoes_erro']}")
     print(f"⏱️  Duração média: {stats['duracao_media']:.3f} segundos")
+    for percentil, duracao in stats.get('duracao_percentis', {}).items():
+        print(f"   p{percentil * 100:g}: {duracao:.3f} segundos")
+    if stats.get('primeira_transacao') is not None:
+        print(f"📅 Período: {stats['primeira_transacao']:%d/%m/%Y %H:%M:%S} a {stats['ultima_transacao']:%d/%m/%Y %H:%M:%S}")
     
     print("\n🏦 Transações por tipo:")
+    valores = stats.get('valor_total_por_tipo', {})
     for tipo, quantidade in stats['por_tipo'].items():
-        print(f"   {tipo}: {quantidade}")
+        if tipo in valores:
+            print(f"   {tipo}: {quantidade} (R$ {valores[tipo]:.2f})")
+        else:
+            print(f"   {tipo}: {quantidade}")
     
     print("\n👤 Transações por cliente:")
     for cliente, quantidade in stats['por_cliente'].items():
@@ -178,20 +173,44 @@ def filtrar_logs_por_tipo(logs, tipo):
     Returns:
         list: Logs filtrados
     """
-    return [log for log in logs if log.get('transaction_type') == tipo]
+    return PythonLogAnalyzer(logs).filter_by_type(tipo)
 
-def filtrar_logs_por_cliente(logs, cliente):
+def filtrar_logs_por_cliente(logs, cliente, parcial=False):
     """
     Filtra logs por cliente.
     
     Args:
         logs (list): Lista de logs
         cliente (str): Nome do cliente para filtrar
+        parcial (bool): Aceita parte do nome, sem diferenciar acentos e maiúsculas
         
     Returns:
         list: Logs filtrados
     """
-    return [log for log in logs if log.get('client_name') == cliente]
+    return PythonLogAnalyzer(logs).filter_by_client(cliente, partial=parcial)
+
+def exibir_relatorio_periodo(rollups, granularidade, quantidade=24):
+    """
+    Exibe vazão, taxa de erro e latência dos últimos intervalos agregados.
+    
+    Args:
+        rollups (LogRollups): Agregados do log já atualizados
+        granularidade (str): GRANULARITY_MINUTE, GRANULARITY_HOUR ou GRANULARITY_DAY
+        quantidade (int): Número de intervalos a exibir
+    """
+    serie = rollups.series(granularidade)[-quantidade:]
+    if not serie:
+        print("❌ Nenhum intervalo agregado")
+        return
+    
+    segundos = BUCKET_SECONDS[granularidade]
+    print(f"\n📈 RELATÓRIO POR {NOMES_GRANULARIDADE[granularidade].upper()} (últimos {len(serie)} intervalos)")
+    print("=" * 78)
+    print(f"{'Período':<18} {'Transações':>10} {'tx/s':>8} {'Erros':>7} {'Média (s)':>10} {'p95 (s)':>9} {'Valor (R$)':>12}")
+    for chave, agregado in serie:
+        print(f"{chave:<18} {agregado.count:>10} {agregado.throughput(segundos):>8.2f} "
+              f"{agregado.error_rate:>6.1%} {agregado.mean_duration:>10.3f} {agregado.percentile(0.95):>9.3f} "
+              f"{agregado.value_total:>12.2f}")
 
 def menu_analisador_logs():
     """
@@ -200,21 +219,29 @@ def menu_analisador_logs():
     print("\n🔍 ANALISADOR DE LOGS DO SISTEMA BANCÁRIO")
     print("=" * 60)
     
-    # Carregar logs
-    logs = carregar_logs()
+    # Carregar logs (com pandas, se instalado; caso contrário, em Python puro)
+    try:
+        analisador = load_log_analyzer(LOG_FILE)
+    except FileNotFoundError:
+        print(f"❌ Arquivo {LOG_FILE} não encontrado")
+        analisador = None
     
-    if not logs:
+    if analisador is None or not len(analisador):
         print("❌ Nenhum log encontrado. Execute algumas transações primeiro.")
         return
     
+    print(f"⚙️  Motor de análise: {analisador.backend}")
+    if analisador.invalid_lines:
+        print(f"⚠️  {analisador.invalid_lines} linhas inválidas ignoradas")
+    
     # Analisar logs
-    stats = analisar_logs(logs)
+    stats = analisador.stats()
     
     # Exibir estatísticas
     exibir_estatisticas(stats)
     
     # Exibir logs recentes
-    exibir_logs_recentes(logs, 10)
+    exibir_logs_recentes(analisador.recent(10), 10)
     
     # Menu de opções
     while True:
@@ -226,6 +253,7 @@ def menu_analisador_logs():
         print("4. Ver logs de um cliente específico")
         print("5. Ver logs de uma conta específica")
         print("6. Ver logs com erro")
+        print("7. Relatório por minuto/hora/dia")
         print("0. Voltar ao menu principal")
         
         opcao = input("\nEscolha uma opção: ").strip()
@@ -234,23 +262,23 @@ def menu_analisador_logs():
             print("👋 Voltando ao menu principal...")
             break
         elif opcao == '1':
-            logs_depositos = filtrar_logs_por_tipo(logs, 'Deposit')
+            logs_depositos = analisador.filter_by_type('Deposit')
             print(f"\n💰 LOGS DE DEPÓSITOS ({len(logs_depositos)} transações):")
             for log in logs_depositos:
                 print(f"   {log['timestamp']} | {log['client_name']} | R$ {log['transaction_value']} | {log['status']}")
         elif opcao == '2':
-            logs_saques = filtrar_logs_por_tipo(logs, 'Withdraw')
+            logs_saques = analisador.filter_by_type('Withdraw')
             print(f"\n💸 LOGS DE SAQUES ({len(logs_saques)} transações):")
             for log in logs_saques:
                 print(f"   {log['timestamp']} | {log['client_name']} | R$ {log['transaction_value']} | {log['status']}")
         elif opcao == '3':
-            logs_transferencias = filtrar_logs_por_tipo(logs, 'Transfer')
+            logs_transferencias = analisador.filter_by_type('Transfer')
             print(f"\n🔄 LOGS DE TRANSFERÊNCIAS ({len(logs_transferencias)} transações):")
             for log in logs_transferencias:
                 print(f"   {log['timestamp']} | {log['client_name']} → {log.get('destination_client', 'N/A')} | R$ {log['transaction_value']} | {log['status']}")
         elif opcao == '4':
-            cliente = input("Digite o nome do cliente: ").strip()
-            logs_cliente = filtrar_logs_por_cliente(logs, cliente)
+            cliente = input("Digite o nome (ou parte do nome) do cliente: ").strip()
+            logs_cliente = analisador.filter_by_client(cliente, partial=True)
             if logs_cliente:
                 print(f"\n👤 LOGS DO CLIENTE {cliente} ({len(logs_cliente)} transações):")
                 for log in logs_cliente:
@@ -259,7 +287,7 @@ def menu_analisador_logs():
                 print(f"❌ Nenhum log encontrado para o cliente {cliente}")
         elif opcao == '5':
             conta = input("Digite o número da conta: ").strip()
-            logs_conta = [log for log in logs if log.get('account_number') == conta]
+            logs_conta = analisador.filter_by_account(conta)
             if logs_conta:
                 print(f"\n🏦 LOGS DA CONTA {conta} ({len(logs_conta)} transações):")
                 for log in logs_conta:
@@ -267,187 +295,237 @@ def menu_analisador_logs():
             else:
                 print(f"❌ Nenhum log encontrado para a conta {conta}")
         elif opcao == '6':
-            logs_erro = [log for log in logs if log.get('status') != 'Sucesso']
+            logs_erro = analisador.failures()
             if logs_erro:
                 print(f"\n❌ LOGS COM ERRO ({len(logs_erro)} transações):")
                 for log in logs_erro:
                     print(f"   {log['timestamp']} | {log['transaction_type']} | {log['client_name']} | {log.get('error_message', 'Erro desconhecido')}")
             else:
                 print("✅ Nenhum erro encontrado nos logs")
+        elif opcao == '7':
+            granularidade = GRANULARIDADES.get(input("Agrupar por [m] minuto, [h] hora ou [d] dia: ").strip())
+            if granularidade is None:
+                print("❌ Opção inválida!")
+                continue
+            # Apenas as linhas novas do log são lidas; o restante vem dos agregados gravados ao lado do log
+            exibir_relatorio_periodo(load_rollups(LOG_FILE), granularidade)
         else:
             print("❌ Opção inválida!")
 
-bank: Bank = Bank()
+def main():
+    """
+    Executa o menu interativo do sistema bancário.
+    """
+    # Apenas o menu interativo exibe o andamento das transações no console
+    ConsolePresenter().install()
+    bank: Bank = Bank()
 
-while True:
-    print("="*80)
-    option_bank = input(MENU_BANK).strip()
+    while True:
+        print("="*80)
+        option_bank = input(MENU_BANK).strip()
 
-    if option_bank == 'r':
-        client_name = input("Digite o nome: ").strip()
+        if option_bank == 'r':
+            client_name = input("Digite o nome: ").strip()
         
-        # Criando o CPF
-        client_cpf = input("Digite o CPF: ").strip()
-        cpf = CPF(client_cpf)
-        if bank.has_registered_CPF(cpf):
-            print("Cliente já existente!")
-            continue
+            # Criando o CPF
+            client_cpf = input("Digite o CPF: ").strip()
+            cpf = CPF(client_cpf)
+            if bank.has_registered_CPF(cpf):
+                print("Cliente já existente!")
+                continue
 
-        # Criando a data de nascimento
-        client_date_of_birth = input("Digite a data de nascimento: ").strip()
-        date_of_birth = DateOfBirth(client_date_of_birth)
+            # Criando a data de nascimento
+            client_date_of_birth = input("Digite a data de nascimento: ").strip()
+            date_of_birth = DateOfBirth(client_date_of_birth)
 
-        # Criando o endereço
-        client_street = input("Digite o logradouro: ").strip()
-        client_number = input("Digite o número: ").strip()
-        client_district = input("Digite o bairro: ").strip()
-        client_city = input("Digite o cidade: ").strip()
-        client_state = input("Digite o state: ").strip()
-        address = Address(
-            street=client_street,
-            number=client_number,
-            district=client_district,
-            city=client_city,
-            state=client_state
-        )
+            # Criando o endereço
+            client_street = input("Digite o logradouro: ").strip()
+            client_number = input("Digite o número: ").strip()
+            client_district = input("Digite o bairro: ").strip()
+            client_city = input("Digite o cidade: ").strip()
+            client_state = input("Digite o state: ").strip()
+            address = Address(
+                street=client_street,
+                number=client_number,
+                district=client_district,
+                city=client_city,
+                state=client_state
+            )
 
-        print(f"Data de nascimento: {date_of_birth}")
+            print(f"Data de nascimento: {date_of_birth}")
 
-        print(f"CPF: {cpf}")
+            print(f"CPF: {cpf}")
 
-        print(f"Endereço: {address}")
+            print(f"Endereço: {address}")
 
-        # Criando o cliente
-        client = Client(
-            name=client_name,
-            cpf=cpf,
-            date_of_birth=date_of_birth,
-            address=address
-        )
-        print(f"Cliente: {client}")
-        if bank.register_client(client=client):
-            print("Cliente cadastrado com sucesso!")
-        else:
-            print("Cliente já existente!")
-            continue
-    elif option_bank == 'c':
-        try:
-            client_cpf = input("Digite o CPF: ").strip()
-            cpf = CPF(client_cpf)
-            client = bank.search_client(cpf)
-            if not client:
-                print("Não há cliente com o registro do CPF!")
-                continue
-            if bank.create_account(client):
-                print("Conta criada com sucesso!")
+            # Criando o cliente
+            client = Client(
+                name=client_name,
+                cpf=cpf,
+                date_of_birth=date_of_birth,
+                address=address
+            )
+            print(f"Cliente: {client}")
+            if bank.register_client(client=client):
+                print("Cliente cadastrado com sucesso!")
             else:
-                print("Ocorreu um erro na criação da conta!")
+                print("Cliente já existente!")
+                continue
+        elif option_bank == 'c':
+            try:
+                client_cpf = input("Digite o CPF: ").strip()
+                cpf = CPF(client_cpf)
+                client = bank.search_client(cpf)
+                if not client:
+                    print("Não há cliente com o registro do CPF!")
+                    continue
+                agency_number = ler_agencia()
+                if bank.create_account(client, agency_number):
+                    print("Conta criada com sucesso!")
+                else:
+                    print("Ocorreu um erro na criação da conta!")
+                    continue
+            except ValueError as e:
+                print(str(e))
                 continue
-        except ValueError as e:
-            print(str(e))
-            continue
-    elif option_bank == 'a':
-        cpf: CPF = None
-        account_number: AccountNumber = None
+        elif option_bank == 'a':
+            cpf: CPF = None
+            account_number: AccountNumber = None
         
-        try:
-            client_cpf = input("Digite o CPF: ").strip()
-            cpf = CPF(client_cpf)
-        except ValueError as e:
-            print(str(e))
-            continue
+            try:
+                client_cpf = input("Digite o CPF: ").strip()
+                cpf = CPF(client_cpf)
+            except ValueError as e:
+                print(str(e))
+                continue
         
-        try:
-            client_account_number = input("Digite o número da conta: ").strip()
-            account_number = AccountNumber(client_account_number)
-        except ValueError as e:
-            print(str(e))
-            continue
+            try:
+                client_account_number = input("Digite o número da conta: ").strip()
+                account_number = AccountNumber(client_account_number)
+                agency_number = ler_agencia()
+            except ValueError as e:
+                print(str(e))
+                continue
         
-        account = bank.signin_account(cpf, account_number)
-        if not account:
-            print("O CPF e/ou número da conta informada não existe")
-            continue
+            account = bank.signin_account(cpf, account_number, agency_number)
+            if not account:
+                print("O CPF e/ou número da conta informada não existe")
+                continue
         
-        print("Você está agora em sua conta!")
-        while True:
-            print("-----------------------------------------------------")
-            option_account = input(MENU_ACCOUNT).strip()
-            if option_account == 'd':
-                # print("Depositar na conta")
-                value = input("Digite o valor: ").strip()
-                try:
-                    account.deposit(Decimal(value))
-                except ValueError as e:
-                    print(str(e))
-                    continue
-            elif option_account == 's':
-                print("Sacar da conta")
-                value = input("Digite o valor: ").strip()
-                try:
-                    account.withdraw(Decimal(value))
-                except ValueError as e:
-                    print(str(e))
-                    continue
-            elif option_account == 't':
-                account_number: AccountNumber = None
+            print("Você está agora em sua conta!")
+            while True:
+                print("-----------------------------------------------------")
+                option_account = input(MENU_ACCOUNT).strip()
+                if option_account == 'd':
+                    # print("Depositar na conta")
+                    value = input("Digite o valor: ").strip()
+                    try:
+                        account.deposit(Decimal(value))
+                    except ValueError as e:
+                        print(str(e))
+                        continue
+                elif option_account == 's':
+                    print("Sacar da conta")
+                    value = input("Digite o valor: ").strip()
+                    try:
+                        account.withdraw(Decimal(value))
+                    except ValueError as e:
+                        print(str(e))
+                        continue
+                elif option_account == 't':
+                    account_number: AccountNumber = None
                 
-                try:
-                    client_account_number = input("Digite o número da conta: ").strip()
-                    account_number = AccountNumber(client_account_number)
-                except ValueError as e:
-                    print(str(e))
-                    continue
+                    try:
+                        client_account_number = input("Digite o número da conta: ").strip()
+                        account_number = AccountNumber(client_account_number)
+                        agency_number = ler_agencia()
+                    except ValueError as e:
+                        print(str(e))
+                        continue
 
-                account_of_receipt = bank.search_account(account_number)
-                if not account_of_receipt:
-                    print("Não existe a conta informada")
-                    continue
+                    # A conta de destino pode ser de outra agência
+                    account_of_receipt = bank.search_account(account_number, agency_number)
+                    if not account_of_receipt:
+                        print("Não existe a conta informada")
+                        continue
 
-                value = input("Digite o valor: ").strip()
+                    value = input("Digite o valor: ").strip()
+                    try:
+                        account.transfer(Decimal(value), account_of_receipt)
+                    except ValueError as e:
+                        print(str(e))
+                        continue
+                elif option_account == 'e':
+                    account.show_extract()
+                elif option_account == 'l':
+                    print("\n📊 INFORMAÇÕES DO LIMITE DIÁRIO")
+                    print("-" * 40)
+                    daily_count = account.get_daily_transactions_count()
+                    remaining = account.get_remaining_daily_transactions()
+                    print(f"Transações realizadas hoje: {daily_count}")
+                    print(f"Transações restantes: {remaining}")
+                    print(f"Limite diário: {account.limits.engine.policy(DAILY_TRANSACTIONS).limit} transações")
+                    print(f"Saques restantes hoje: {account.limits.remaining(DAILY_WITHDRAWALS)}")
+                    if remaining == 0:
+                        print("⚠️  Você atingiu o limite diário de transações!")
+                    elif remaining <= 2:
+                        print("⚠️  Atenção: Poucas transações restantes para hoje!")
+                    else:
+                        print("✅ Você ainda pode realizar transações hoje.")
+                    print("-" * 40)
+                elif option_account == 'q':
+                    print("Você saiu do menu da sua conta bancária!")
+                    break
+        elif option_bank == 'l':
+            print("\n📊 LISTANDO TODAS AS CONTAS DO BANCO")
+            print("=" * 80)
+        
+            if not bank.accounts:
+                print("Nenhuma conta cadastrada no banco.")
+            else:
                 try:
-                    account.transfer(Decimal(value), account_of_receipt)
+                    agency_number = ler_agencia(padrao=None)
                 except ValueError as e:
                     print(str(e))
                     continue
-            elif option_account == 'e':
-                account.show_extract()
-            elif option_account == 'l':
-                print("\n📊 INFORMAÇÕES DO LIMITE DIÁRIO")
-                print("-" * 40)
-                daily_count = account.get_daily_transactions_count()
-                remaining = account.get_remaining_daily_transactions()
-                print(f"Transações realizadas hoje: {daily_count}")
-                print(f"Transações restantes: {remaining}")
-                print(f"Limite diário: 10 transações")
-                if remaining == 0:
-                    print("⚠️  Você atingiu o limite diário de transações!")
-                elif remaining <= 2:
-                    print("⚠️  Atenção: Poucas transações restantes para hoje!")
-                else:
-                    print("✅ Você ainda pode realizar transações hoje.")
-                print("-" * 40)
-            elif option_account == 'q':
-                print("Você saiu do menu da sua conta bancária!")
-                break
-    elif option_bank == 'l':
-        print("\n📊 LISTANDO TODAS AS CONTAS DO BANCO")
-        print("=" * 80)
-        
-        if not bank.accounts:
-            print("Nenhuma conta cadastrada no banco.")
-        else:
-            accounts_iterator = bank.get_accounts_iterator()
-            print(f"Total de contas: {len(accounts_iterator)}")
-            print("-" * 80)
+                accounts_iterator = bank.get_accounts_iterator(fields=ACCOUNTS_LIST_FIELDS, page_size=ACCOUNTS_PAGE_SIZE,
+                                                               agency_number=agency_number)
+                print(f"Total de contas: {len(accounts_iterator)}")
+                print("-" * 80)
             
-            for i, account_info in enumerate(accounts_iterator, 1):
-                formatted_info = accounts_iterator.get_account_info_formatted(account_info)
-                print(f"{i:2d}. {formatted_info}")
+                i = 0
+                for page in accounts_iterator.pages():
+                    for account_info in page:
+                        i += 1
+                        formatted_info = accounts_iterator.get_account_info_formatted(account_info)
+                        print(f"{i:2d}. {formatted_info}")
+                    if accounts_iterator.has_next:
+                        answer = input("Enter para a próxima página ou 'q' para encerrar: ").strip()
+                        if answer == 'q':
+                            break
             
-            print("-" * 80)
-            print("✅ Listagem concluída!")
-    elif option_bank == 'g':
-        menu_analisador_logs()
-    else:
-        print("Operação inválida, tente as opções disponíveis por favor!")
\ No newline at end of file
+                print("-" * 80)
+                print("✅ Listagem concluída!")
+        elif option_bank == 'b':
+            query = input("Digite parte do nome ou o início do CPF: ").strip()
+            if not query:
+                print("Informe um termo para a busca!")
+                continue
+            # Consultas só com dígitos (e pontuação de CPF) buscam pelo prefixo do CPF
+            if query.replace('.', '').replace('-', '').isdigit():
+                clients = bank.search_clients_by_cpf_prefix(query)
+            else:
+                clients = bank.search_clients_by_name(query)
+            if not clients:
+                print("Nenhum cliente encontrado.")
+                continue
+            print(f"\n🔍 {len(clients)} cliente(s) encontrado(s):")
+            for client in clients:
+                print(f"  {client.name} - CPF: {client.cpf}")
+        elif option_bank == 'g':
+            menu_analisador_logs()
+        else:
+            print("Operação inválida, tente as opções disponíveis por favor!")
+
+if __name__ == "__main__":
+    main()
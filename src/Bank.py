@@ -1,7 +1,18 @@
 from __future__ import annotations
-from typing import Dict, List, TYPE_CHECKING
-
-from src.entities import Account, AccountNumber, AgencyNumber
+from datetime import datetime
+from decimal import Decimal
+from heapq import merge
+from itertools import islice
+from typing import Dict, Iterator, List, Sequence, Tuple, TYPE_CHECKING
+import os
+
+from src.account_numbers import DEFAULT_BLOCK_SIZE, AccountNumberAllocator
+from src.agencies import AgencyPartition
+from src.entities import Account, AccountIterator, AccountNumber, AgencyNumber
+from src.entities.AccountIterator import DEFAULT_PAGE_SIZE
+from src.indexes import DEFAULT_SEARCH_LIMIT, ClientSearchIndex
+from src.ledger import CHUNK_SIZE, Ledger, LedgerRecord
+from src.limits import DEFAULT_LIMIT_ENGINE, LimitEngine
 
 if TYPE_CHECKING:
     from src.entities import Client, CPF
@@ -10,23 +21,55 @@ PROCESSING_WAITING_TIME_IN_SECONDS = 2
 AGENCY_NUMBER = 1
 DEFAULT_AGENCY_NUMBER = AgencyNumber(AGENCY_NUMBER)
 
+def _balance_of(account: Account) -> Decimal:
+    """Chave de intercalação dos resultados das agências por saldo."""
+    return account.balance
+
 class Bank:
     """
     Classe que representa um banco com operações básicas de cadastro de clientes e contas,
     bem como busca e autenticação de contas.
 
-    Atributos:
-        current_account_number (int): Número sequencial para geração de contas.
+    As contas são particionadas por agência (AgencyPartition): cada agência
+    tem a sua numeração de contas, o seu mapa de números e os seus índices.
+    A lista `accounts` mantém todas as contas do banco, em ordem de registro.
     """
-    current_account_number: int = 1
 
-    def __init__(self):
+    def __init__(self, limit_engine: LimitEngine = None, account_numbers_dir: str = None,
+                 account_number_block_size: int = DEFAULT_BLOCK_SIZE, idempotency_path: str = None):
         """
         Inicializa o banco com listas vazias de clientes e contas.
+
+        Args:
+            limit_engine (LimitEngine, optional): Políticas de limite aplicadas às contas
+                do banco (padrão: 10 transações e 3 saques de até R$ 500,00 por dia).
+            account_numbers_dir (str, optional): Diretório onde cada agência grava a marca
+                d'água dos seus números de conta (None = numeração só em memória).
+            account_number_block_size (int): Números de conta reservados por thread a cada vez.
+            idempotency_path (str, optional): Arquivo onde o livro-razão grava as chaves de
+                idempotência, recarregadas ao reabrir (None = só em memória).
         """
         self._clients: List[Client] = []
         self._accounts: List[Account] = []
 
+        # Partições por agência (número formatado -> partição), com os índices das contas
+        self._agencies: Dict[str, AgencyPartition] = {}
+        self._account_numbers_dir = account_numbers_dir
+        self._account_number_block_size = account_number_block_size
+
+        # Índices de clientes: CPF exato e busca por nome/prefixo de CPF. Ambos
+        # acompanham o fim da lista de clientes, incluindo clientes anexados
+        # diretamente à lista; o de busca só é atualizado quando consultado.
+        self._clients_by_cpf: Dict[str, Client] = {}
+        self._cpf_indexed = 0
+        self._client_search = ClientSearchIndex()
+        self._search_indexed = 0
+
+        # Livro-razão global: todas as transações do banco, em ordem de registro
+        self._ledger = Ledger(idempotency_path=idempotency_path)
+        self._observers: list = []
+        self._limit_engine = limit_engine or DEFAULT_LIMIT_ENGINE
+
         self.clients = []
         self.accounts = []
 
@@ -45,7 +88,9 @@ class Bank:
         Args:
             clients (List[Client]): Nova lista de clientes.
         """
-        self._clients = clients
+        if clients is not self._clients:
+            self._clients = clients
+            self._reset_client_indexes()
 
     @property
     def accounts(self) -> List[Account]:
@@ -62,11 +107,156 @@ class Bank:
         Args:
             accounts (List[Account]): Nova lista de contas.
         """
-        self._accounts = accounts
+        if accounts is not self._accounts:
+            self._accounts = accounts
+            self._rebuild_indexes()
+
+    @property
+    def ledger(self) -> Ledger:
+        """
+        Getter do livro-razão global do banco.
+        """
+        return self._ledger
+
+    @property
+    def limit_engine(self) -> LimitEngine:
+        """
+        Getter das políticas de limite aplicadas às contas do banco.
+        """
+        return self._limit_engine
+
+    def add_observer(self, observer):
+        """
+        Registra um observador dos cadastros do banco.
+
+        O observador deve implementar `client_registered(client)` e
+        `account_registered(account)`.
+
+        Args:
+            observer: Objeto notificado a cada cadastro (ex.: o CDC).
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Remove um observador previamente registrado."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    @property
+    def agencies(self) -> List[AgencyNumber]:
+        """
+        Getter dos números das agências com contas, em ordem crescente.
+        """
+        return [self._agencies[key].agency_number for key in sorted(self._agencies)]
+
+    def agency(self, agency_number: AgencyNumber) -> AgencyPartition:
+        """
+        Retorna a partição de uma agência.
+
+        Args:
+            agency_number (AgencyNumber): Número da agência.
+
+        Returns:
+            AgencyPartition: Partição da agência, ou None se ela não tiver contas.
+        """
+        return self._agencies.get(agency_number.agency_number)
+
+    def _partition(self, agency_number: AgencyNumber) -> AgencyPartition:
+        """Retorna a partição da agência, criando-a no primeiro uso."""
+        key = agency_number.agency_number
+        partition = self._agencies.get(key)
+        if partition is None:
+            state_path = None
+            if self._account_numbers_dir is not None:
+                state_path = os.path.join(self._account_numbers_dir, f'account-numbers-{key}.json')
+            allocator = AccountNumberAllocator(self._account_number_block_size, state_path=state_path)
+            # setdefault: duas threads criando a mesma agência passam a usar a mesma partição
+            partition = self._agencies.setdefault(key, AgencyPartition(agency_number, allocator))
+        return partition
+
+    def _partitions(self, agency_number: AgencyNumber = None) -> List[AgencyPartition]:
+        """Retorna as partições consultadas: a da agência informada ou todas."""
+        if agency_number is None:
+            return list(self._agencies.values())
+        partition = self.agency(agency_number)
+        return [partition] if partition is not None else []
+
+    def _index_account(self, account: Account):
+        """
+        Adiciona a conta à partição da sua agência (índices e mapa de números),
+        registra seu histórico no livro-razão do banco e aplica as políticas de
+        limite do banco.
+        """
+        account.ledger = self._ledger
+        if account.limits.engine is not self._limit_engine:
+            account.limits = self._limit_engine.for_account()
+        self._partition(account.agency_number).add(account)
+
+    def _rebuild_indexes(self):
+        """Reconstrói as partições por agência a partir da lista de contas."""
+        for partition in self._agencies.values():
+            partition.detach()
+        self._agencies = {}
+        for account in self._accounts:
+            self._index_account(account)
+
+    def reindex_account(self, account: Account):
+        """
+        Atualiza os índices de uma conta cujo cliente teve endereço ou data de nascimento alterados.
+
+        Args:
+            account (Account): Conta a ser reindexada.
+        """
+        self._partition(account.agency_number).reindex(account)
+
+    def _reset_client_indexes(self):
+        """Esvazia os índices de clientes; serão refeitos a partir da lista na próxima consulta."""
+        self._clients_by_cpf = {}
+        self._cpf_indexed = 0
+        self._client_search.clear()
+        self._search_indexed = 0
+
+    def _sync_cpf_index(self):
+        """Indexa por CPF os clientes acrescentados à lista desde a última consulta."""
+        clients = self._clients
+        if len(clients) < self._cpf_indexed:
+            # A lista encolheu (remoção direta): refaz os índices
+            self._reset_client_indexes()
+        if len(clients) != self._cpf_indexed:
+            by_cpf = self._clients_by_cpf
+            for client in clients[self._cpf_indexed:]:
+                # Mantém o primeiro cliente com o CPF, como a antiga busca linear
+                by_cpf.setdefault(client.cpf.cpf, client)
+            self._cpf_indexed = len(clients)
+
+    def _sync_client_search(self) -> ClientSearchIndex:
+        """Inclui na busca por nome/CPF os clientes acrescentados à lista desde a última busca."""
+        self._sync_cpf_index()
+        clients = self._clients
+        if len(clients) != self._search_indexed:
+            for client in clients[self._search_indexed:]:
+                self._client_search.add(client)
+            self._search_indexed = len(clients)
+        return self._client_search
+
+    def reindex_client(self, client: Client):
+        """
+        Atualiza os índices de um cliente cujo nome ou CPF foi alterado.
+
+        Args:
+            client (Client): Cliente alterado.
+        """
+        self._sync_client_search().update(client)
+        if self._clients_by_cpf.get(client.cpf.cpf) is not client:
+            # CPF alterado: a chave antiga não é conhecida, então o índice exato é refeito
+            self._clients_by_cpf = {}
+            self._cpf_indexed = 0
+            self._sync_cpf_index()
 
     def _get_client_by_cpf(self, cpf: CPF) -> Client:
         """
-        Retorna o cliente associado ao CPF informado, se existir.
+        Retorna o cliente associado ao CPF informado, se existir (O(1)).
 
         Args:
             cpf (CPF): CPF do cliente.
@@ -74,10 +264,8 @@ class Bank:
         Returns:
             Client: Cliente correspondente, ou None.
         """
-        for client in self.clients:
-            if client.cpf.cpf == cpf.cpf:
-                return client
-        return None
+        self._sync_cpf_index()
+        return self._clients_by_cpf.get(cpf.cpf)
 
     def has_registered_CPF(self, cpf: CPF) -> bool:
         """
@@ -101,10 +289,16 @@ class Bank:
         Returns:
             bool: True se o cliente foi adicionado, False se já existia.
         """
-        if client not in self.clients:
-            clients = self.clients
-            clients.append(client)
-            self.clients = clients
+        if self._get_client_by_cpf(client.cpf) is None:
+            self._clients.append(client)
+            self._clients_by_cpf[client.cpf.cpf] = client
+            self._cpf_indexed = len(self._clients)
+            if self._search_indexed == len(self._clients) - 1:
+                # Busca já em dia: inclui o cliente agora, sem esperar a próxima consulta
+                self._client_search.add(client)
+                self._search_indexed += 1
+            for observer in self._observers:
+                observer.client_registered(client)
             return True
         else:
             return False
@@ -121,6 +315,35 @@ class Bank:
         """
         return self._get_client_by_cpf(cpf)
 
+    def search_clients_by_name(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Client]:
+        """
+        Busca clientes por trecho do nome, sem diferenciar acentos nem maiúsculas.
+
+        Cada termo da consulta deve aparecer no nome (termos de uma ou duas
+        letras, no início de uma palavra): "jose conc" encontra "José da Conceição".
+
+        Args:
+            query (str): Consulta.
+            limit (int): Máximo de clientes retornados.
+
+        Returns:
+            List[Client]: Clientes encontrados.
+        """
+        return self._sync_client_search().search_name(query, limit)
+
+    def search_clients_by_cpf_prefix(self, prefix: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Client]:
+        """
+        Busca clientes pelo início do CPF.
+
+        Args:
+            prefix (str): Dígitos iniciais do CPF, com ou sem pontuação.
+            limit (int): Máximo de clientes retornados.
+
+        Returns:
+            List[Client]: Clientes encontrados, em ordem de CPF.
+        """
+        return self._sync_client_search().search_cpf_prefix(prefix, limit)
+
     def register_account(self, client: Client, account: Account):
         """
         Registra uma nova conta bancária para um cliente.
@@ -129,50 +352,59 @@ class Bank:
             client (Client): Cliente dono da conta.
             account (Account): Conta a ser registrada.
 
+        Raises:
+            ValueError: Se a agência já tiver uma conta com o mesmo número.
+
         Returns:
             bool: True após registro.
         """
+        partition = self.agency(account.agency_number)
+        if partition is not None and partition.get(account.account_number) is not None:
+            raise ValueError(f"A conta {account.account_number} já existe na agência {account.agency_number}")
         client.add_account(account=account)
         account.client = client
-        accounts = self.accounts
-        accounts.append(account)
-        self.accounts = accounts
-        Bank.current_account_number += 1
+        self._accounts.append(account)
+        for observer in self._observers:
+            observer.account_registered(account)
+        self._index_account(account)
         return True
 
-    def create_account(self, client: Client) -> bool:
+    def create_account(self, client: Client, agency_number: AgencyNumber = DEFAULT_AGENCY_NUMBER) -> bool:
         """
-        Cria uma conta e a registra no banco.
+        Cria uma conta, com o próximo número livre da agência, e a registra no banco.
 
         Args:
             client (Client): Cliente dono da nova conta.
+            agency_number (AgencyNumber): Agência da conta (padrão: 1).
+
+        Raises:
+            ValueError: Se a agência esgotou os números de conta.
 
         Returns:
             bool: True se registrada com sucesso.
         """
         account = Account(
-            account_number=AccountNumber(Bank.current_account_number),
-            agency_number=AgencyNumber(AGENCY_NUMBER),
+            account_number=self._partition(agency_number).allocate_account_number(),
+            agency_number=agency_number,
             client=client
         )
         return self.register_account(client=client, account=account)
 
-    def create_checking_account(self, client: Client) -> bool:
+    def create_checking_account(self, client: Client, agency_number: AgencyNumber = DEFAULT_AGENCY_NUMBER) -> bool:
         """
-        Cria uma conta corrente e a registra no banco.
+        Cria uma conta corrente, com o próximo número livre da agência, e a registra no banco.
 
         Args:
             client (Client): Cliente dono da nova conta.
+            agency_number (AgencyNumber): Agência da conta (padrão: 1).
+
+        Raises:
+            ValueError: Se a agência esgotou os números de conta.
 
         Returns:
             bool: True se registrada com sucesso.
         """
-        account = Account(
-            account_number=AccountNumber(Bank.current_account_number),
-            agency_number=AgencyNumber(AGENCY_NUMBER),
-            client=client
-        )
-        return self.register_account(client=client, account=account)
+        return self.create_account(client, agency_number)
 
     def search_account(self, account_number: AccountNumber, agency_number: AgencyNumber = DEFAULT_AGENCY_NUMBER) -> Account:
         """
@@ -185,11 +417,8 @@ class Bank:
         Returns:
             Account: Conta encontrada, ou None.
         """
-        for account in self.accounts:
-            if account.account_number == account_number and \
-                account.agency_number == agency_number:
-                return account
-        return None
+        partition = self.agency(agency_number)
+        return partition.get(account_number) if partition is not None else None
 
     def signin_account(self, cpf: CPF, account_number: AccountNumber, agency_number: AgencyNumber = DEFAULT_AGENCY_NUMBER) -> Account:
         """
@@ -203,19 +432,127 @@ class Bank:
         Returns:
             Account: Conta autenticada, ou None.
         """
-        for account in self.accounts:
-            if account.account_number == account_number and \
-                account.agency_number == agency_number and \
-                account.client.cpf == cpf:
-                return account
+        account = self.search_account(account_number, agency_number)
+        if account is not None and account.client.cpf == cpf:
+            return account
         return None
 
-    def get_accounts_iterator(self):
+    def get_accounts_iterator(self, fields: Sequence[str] = None, page_size: int = DEFAULT_PAGE_SIZE,
+                              cursor: str = None, agency_number: AgencyNumber = None):
         """
-        Cria um iterador personalizado para todas as contas do banco.
+        Cria um iterador personalizado para as contas do banco ou de uma agência.
+
+        Args:
+            fields (Sequence[str], optional): Campos a calcular por conta (padrão: DEFAULT_FIELDS
+                do AccountIterator; os campos do resumo, como `last_transaction_at`, são opcionais).
+            page_size (int): Número de contas por página.
+            cursor (str, optional): Token para retomar uma listagem anterior.
+            agency_number (AgencyNumber, optional): Restringe a listagem à agência (None = todas).
         
         Returns:
-            AccountIterator: Iterador que permite iterar sobre todas as contas.
+            AccountIterator: Iterador que permite iterar sobre as contas.
+        """
+        if agency_number is None:
+            accounts = self.accounts
+        else:
+            partition = self.agency(agency_number)
+            accounts = partition.accounts if partition is not None else []
+        return AccountIterator(accounts, fields=fields, page_size=page_size, cursor=cursor)
+
+    def query_accounts(self, city: str = None, state: str = None,
+                       born_before: datetime = None, born_after: datetime = None,
+                       min_balance: Decimal = None, max_balance: Decimal = None,
+                       agency_number: AgencyNumber = None) -> List[Account]:
+        """
+        Consulta contas por atributos do cliente e pelo saldo.
+
+        Em cada agência consultada, usa o índice que produz menos candidatos
+        (a contagem é obtida sem materializar as contas) e aplica os demais
+        critérios como filtro sobre esse conjunto.
+
+        Args:
+            city (str, optional): Cidade do cliente (sem diferenciar maiúsculas).
+            state (str, optional): Estado do cliente (sem diferenciar maiúsculas).
+            born_before (datetime, optional): Clientes nascidos antes desta data (exclusivo).
+            born_after (datetime, optional): Clientes nascidos depois desta data (exclusivo).
+            min_balance (Decimal, optional): Saldo mínimo (inclusivo).
+            max_balance (Decimal, optional): Saldo máximo (inclusivo).
+            agency_number (AgencyNumber, optional): Restringe a consulta à agência (None = todas).
+
+        Returns:
+            List[Account]: Contas que atendem a todos os critérios, agrupadas por agência.
+        """
+        results = []
+        for partition in self._partitions(agency_number):
+            results.extend(partition.query_accounts(city, state, born_before, born_after, min_balance, max_balance))
+        return results
+
+    def top_accounts_by_balance(self, limit: int, agency_number: AgencyNumber = None) -> List[Account]:
+        """
+        Retorna as contas com os maiores saldos.
+
+        Usa os índices de saldo das agências, mantidos a cada alteração de
+        saldo, em vez de ordenar todas as contas: cada agência contribui com
+        as suas `limit` maiores, intercaladas por saldo (O(a·log n + k)).
+
+        Args:
+            limit (int): Quantidade máxima de contas.
+            agency_number (AgencyNumber, optional): Restringe a consulta à agência (None = todas).
+
+        Returns:
+            List[Account]: Contas em ordem decrescente de saldo.
+        """
+        tops = [partition.top_accounts_by_balance(limit) for partition in self._partitions(agency_number)]
+        if len(tops) == 1:
+            return tops[0]
+        return list(islice(merge(*tops, key=_balance_of, reverse=True), max(0, limit)))
+
+    def accounts_with_balance_between(self, min_balance: Decimal = None, max_balance: Decimal = None,
+                                      agency_number: AgencyNumber = None) -> List[Account]:
+        """
+        Retorna as contas cujo saldo está na faixa informada (limites inclusivos).
+
+        Args:
+            min_balance (Decimal, optional): Saldo mínimo (None = sem limite).
+            max_balance (Decimal, optional): Saldo máximo (None = sem limite).
+            agency_number (AgencyNumber, optional): Restringe a consulta à agência (None = todas).
+
+        Returns:
+            List[Account]: Contas em ordem crescente de saldo.
+        """
+        ranges = [partition.iterate_balance_range(min_balance, max_balance)
+                  for partition in self._partitions(agency_number)]
+        if len(ranges) == 1:
+            return list(ranges[0])
+        return list(merge(*ranges, key=_balance_of))
+
+    def stream_transactions(self, since: int = 0) -> Iterator[LedgerRecord]:
+        """
+        Percorre todas as transações do banco registradas depois de uma sequência.
+
+        Args:
+            since (int): Última sequência já consumida (0 = desde o início).
+
+        Returns:
+            Iterator[LedgerRecord]: Registros (sequência, timestamp, transação) em ordem de sequência.
+        """
+        return self._ledger.stream(since)
+
+    def read_transactions(self, since: int = 0, limit: int = CHUNK_SIZE) -> Tuple[List[LedgerRecord], int]:
+        """
+        Lê um lote de transações a partir de um cursor, para consumidores externos e replicação.
+
+        Args:
+            since (int): Cursor: última sequência já consumida (0 = desde o início).
+            limit (int): Quantidade máxima de registros no lote.
+
+        Returns:
+            Tuple[List[LedgerRecord], int]: Registros lidos e o cursor para a próxima leitura.
+        """
+        return self._ledger.read(since, limit)
+
+    def close(self):
+        """
+        Encerra o banco, fechando os arquivos mantidos pelo livro-razão.
         """
-        from src.entities import AccountIterator
-        return AccountIterator(self.accounts)
+        self._ledger.close()
@@ -4,6 +4,9 @@ import re
 TOTAL_DIGITS_ACCOUNT_NUMBER = 8
 TOTAL_DIGITS_AGENCY_NUMBER = 4
 
+# Fatores de quantização já construídos, por número de casas decimais
+_QUANTIZERS = {}
+
 def clear_cmd_line(length: int):
     """
     Limpa a linha atual no terminal imprimindo espaços em branco.
@@ -25,5 +28,7 @@ def round_decimal(value: Decimal, decimal_places: int) -> Decimal:
     Returns:
         Decimal: Valor arredondado.
     """
-    fator = Decimal('1.' + ('0' * decimal_places))
+    fator = _QUANTIZERS.get(decimal_places)
+    if fator is None:
+        fator = _QUANTIZERS[decimal_places] = Decimal('1.' + ('0' * decimal_places))
     return value.quantize(fator, rounding=ROUND_HALF_UP)
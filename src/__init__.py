@@ -1,13 +1,61 @@
 # Arquivo __init__.py para permitir importações simplificadas
+#
+# Os atributos públicos são carregados sob demanda (PEP 562): `import src` não
+# importa nenhum módulo interno, e `from src import Bank` carrega apenas o que
+# for necessário. Os módulos internos importam diretamente de src.Utils e dos
+# submódulos de src.entities, evitando importações circulares.
+from importlib import import_module
+from types import ModuleType
+import sys
 
-# Importando as funções utilitárias primeiro para evitar importação circular
-from .Utils import round_decimal, clear_cmd_line
-
-# Importando Bank depois das entidades para evitar importação circular
-from .Bank import Bank
+# Nome do atributo -> módulo onde ele está definido
+_LAZY_ATTRIBUTES = {
+    'Bank': 'src.Bank',
+    'round_decimal': 'src.Utils',
+    'clear_cmd_line': 'src.Utils'
+}
 
 __all__ = [
     'Bank',
     'round_decimal',
     'clear_cmd_line'
 ]
+
+def __getattr__(name: str):
+    """
+    Importa o atributo solicitado na primeira vez em que ele é acessado.
+
+    Args:
+        name (str): Nome do atributo.
+
+    Raises:
+        AttributeError: Se o atributo não fizer parte da interface pública.
+
+    Returns:
+        Any: O objeto solicitado (que passa a ficar em cache no módulo).
+    """
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
+
+class _LazyPackage(ModuleType):
+    """
+    Tipo do módulo `src` que preserva as classes exportadas.
+
+    O sistema de importação registra cada submódulo como atributo do pacote
+    (ex.: `import src.Bank` definiria src.Bank como o módulo). Para os nomes
+    exportados, mantém o objeto público no lugar do submódulo homônimo.
+    """
+
+    def __setattr__(self, name, value):
+        if name in _LAZY_ATTRIBUTES and isinstance(value, ModuleType):
+            value = getattr(value, name)
+        super().__setattr__(name, value)
+
+sys.modules[__name__].__class__ = _LazyPackage
@@ -0,0 +1,165 @@
+from __future__ import annotations
+
+from itertools import count
+from typing import Optional
+import json
+import os
+import threading
+
+from src.entities.AccountNumber import AccountNumber, MAX_ACCOUNT_NUMBER
+
+DEFAULT_BLOCK_SIZE = 64
+FIRST_ACCOUNT_NUMBER = 1
+
+class AccountNumberAllocator:
+    """
+    Distribui números de conta em blocos reservados por thread.
+
+    O contador compartilhado avança um bloco inteiro por vez com
+    `next(itertools.count)`, operação atômica no CPython; o lock é tomado
+    apenas uma vez por bloco, para confirmá-lo. Cada thread consome o seu
+    bloco localmente; só volta ao contador quando o bloco acaba. Assim,
+    criações de conta em paralelo nunca recebem o mesmo número e quase
+    nunca disputam o contador.
+
+    Com `state_path`, a marca d'água (fim do maior bloco reservado) é gravada
+    a cada novo bloco, antes de o bloco ser usado; ao reabrir, a numeração
+    continua dali. Números de blocos não consumidos antes do encerramento
+    são descartados (a numeração pode ter lacunas, mas não repetições).
+    """
+
+    def __init__(self, block_size: int = DEFAULT_BLOCK_SIZE, first_number: int = FIRST_ACCOUNT_NUMBER,
+                 state_path: str = None, max_number: int = MAX_ACCOUNT_NUMBER):
+        """
+        Inicializa o alocador.
+
+        Args:
+            block_size (int): Quantidade de números reservada por thread a cada vez.
+            first_number (int): Primeiro número distribuído (se não houver estado gravado além dele).
+            state_path (str, optional): Arquivo JSON onde a marca d'água é gravada (None = só em memória).
+            max_number (int): Limite exclusivo dos números de conta.
+
+        Raises:
+            ValueError: Se o tamanho do bloco ou os limites forem inválidos.
+        """
+        if block_size < 1:
+            raise ValueError("O tamanho do bloco deve ser maior que zero")
+        if not 0 <= first_number < max_number <= MAX_ACCOUNT_NUMBER:
+            raise ValueError("Os limites da numeração de contas são inválidos")
+        self._block_size = block_size
+        self._max_number = max_number
+        self._state_path = state_path
+        self._local = threading.local()
+        # Protege a confirmação dos blocos, a gravação da marca d'água e o reposicionamento (uma vez por bloco)
+        self._lock = threading.Lock()
+        self._high_water_mark = max(first_number, self._load_high_water_mark())
+        self._blocks = count(self._high_water_mark, block_size)
+
+    @property
+    def block_size(self) -> int:
+        """Retorna a quantidade de números reservada por bloco."""
+        return self._block_size
+
+    @property
+    def high_water_mark(self) -> int:
+        """Retorna o limite (exclusivo) dos números já reservados."""
+        return self._high_water_mark
+
+    @property
+    def state_path(self) -> Optional[str]:
+        """Retorna o arquivo da marca d'água (None se só em memória)."""
+        return self._state_path
+
+    def _load_high_water_mark(self) -> int:
+        """Lê a marca d'água gravada (0 se não houver arquivo)."""
+        if self._state_path is None or not os.path.exists(self._state_path):
+            return 0
+        with open(self._state_path, encoding='utf-8') as state_file:
+            return int(json.load(state_file)['high_water_mark'])
+
+    def _save_high_water_mark(self, high_water_mark: int):
+        """Grava a marca d'água em um temporário e o renomeia (leitores nunca veem meio arquivo)."""
+        temporary = f'{self._state_path}.tmp'
+        with open(temporary, 'w', encoding='utf-8') as state_file:
+            json.dump({'high_water_mark': high_water_mark}, state_file)
+        os.replace(temporary, self._state_path)
+
+    def reserve_block(self) -> range:
+        """
+        Reserva o próximo bloco de números (para um worker que os distribui por conta própria).
+
+        Raises:
+            ValueError: Se os números de conta se esgotaram.
+
+        Returns:
+            range: Números reservados (o último bloco pode ser menor que `block_size`).
+        """
+        while True:
+            blocks = self._blocks
+            start = next(blocks)
+            if start >= self._max_number:
+                raise ValueError("Não há mais números de conta disponíveis")
+            end = min(start + self._block_size, self._max_number)
+            with self._lock:
+                # Se `advance` reposicionou o contador depois do `next`, o bloco pode conter
+                # o número registrado fora do alocador: descarta-o e pede outro ao contador novo
+                if blocks is not self._blocks:
+                    continue
+                if end > self._high_water_mark:
+                    if self._state_path is not None:
+                        self._save_high_water_mark(end)
+                    self._high_water_mark = end
+            return range(start, end)
+
+    def allocate_int(self) -> int:
+        """
+        Distribui o próximo número do bloco da thread atual.
+
+        Raises:
+            ValueError: Se os números de conta se esgotaram.
+
+        Returns:
+            int: Número de conta livre.
+        """
+        local = self._local
+        numbers = getattr(local, 'numbers', None)
+        if numbers is None:
+            numbers = local.numbers = iter(())
+        number = next(numbers, None)
+        if number is None:
+            local.numbers = numbers = iter(self.reserve_block())
+            number = next(numbers)
+        return number
+
+    def allocate(self) -> AccountNumber:
+        """
+        Distribui o próximo número de conta da thread atual.
+
+        Raises:
+            ValueError: Se os números de conta se esgotaram.
+
+        Returns:
+            AccountNumber: Número de conta livre.
+        """
+        return AccountNumber(self.allocate_int())
+
+    def advance(self, number: int):
+        """
+        Garante que os próximos blocos comecem depois de um número já usado.
+
+        Usado quando contas são registradas com números escolhidos fora do
+        alocador (ex.: importação). Com `state_path`, a nova marca d'água é
+        gravada, de modo que esses números continuam cobertos após reabrir.
+        Blocos já reservados pelas threads não são alterados.
+
+        Args:
+            number (int): Número de conta em uso.
+        """
+        if number < self._high_water_mark:
+            return
+        with self._lock:
+            if number >= self._high_water_mark:
+                if self._state_path is not None:
+                    self._save_high_water_mark(number + 1)
+                self._high_water_mark = number + 1
+                self._blocks = count(number + 1, self._block_size)
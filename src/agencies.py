@@ -0,0 +1,199 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, List, TYPE_CHECKING
+
+from src.account_numbers import AccountNumberAllocator
+from src.entities.AccountNumber import AccountNumber
+from src.entities.AgencyNumber import AgencyNumber
+from src.indexes import BalanceIndex, HashIndex, SortedIndex, normalize_text_key
+
+if TYPE_CHECKING:
+    from src.entities import Account
+
+class AgencyPartition:
+    """
+    Partição das contas de uma agência.
+
+    Cada agência tem a sua lista de contas (em ordem de registro), um mapa
+    número -> conta para buscas em O(1), o seu próprio alocador de números
+    de conta (AccountNumberAllocator) e os seus índices secundários (cidade,
+    estado, nascimento e saldo). Listagens e consultas restritas a uma
+    agência percorrem apenas a sua partição.
+    """
+
+    def __init__(self, agency_number: AgencyNumber, allocator: AccountNumberAllocator = None):
+        """
+        Inicializa a partição vazia.
+
+        Args:
+            agency_number (AgencyNumber): Número da agência.
+            allocator (AccountNumberAllocator, optional): Alocador dos números de conta
+                (padrão: um alocador em memória, a partir de 1).
+        """
+        self._agency_number = agency_number
+        self._accounts: List[Account] = []
+        self._accounts_by_number: Dict[str, Account] = {}
+        self._allocator = allocator if allocator is not None else AccountNumberAllocator()
+
+        self._city_index = HashIndex(lambda account: normalize_text_key(account.client.address.city))
+        self._state_index = HashIndex(lambda account: normalize_text_key(account.client.address.state))
+        self._birth_date_index = SortedIndex(lambda account: account.client.date_of_birth.date)
+        self._balance_index = BalanceIndex()
+
+    @property
+    def agency_number(self) -> AgencyNumber:
+        """Retorna o número da agência."""
+        return self._agency_number
+
+    @property
+    def accounts(self) -> List[Account]:
+        """Retorna as contas da agência, em ordem de registro."""
+        return self._accounts
+
+    @property
+    def allocator(self) -> AccountNumberAllocator:
+        """Retorna o alocador dos números de conta da agência."""
+        return self._allocator
+
+    def __len__(self) -> int:
+        """Retorna o número de contas da agência."""
+        return len(self._accounts)
+
+    def _indexes(self):
+        """Retorna os índices secundários da partição."""
+        return (self._city_index, self._state_index, self._birth_date_index, self._balance_index)
+
+    def add(self, account: Account):
+        """
+        Inclui uma conta na partição, nos índices e no mapa de números.
+
+        Em números repetidos, o mapa mantém a primeira conta registrada.
+
+        Args:
+            account (Account): Conta da agência.
+        """
+        self._accounts.append(account)
+        number = account.account_number
+        self._accounts_by_number.setdefault(number.account_number, account)
+        # Números escolhidos fora do alocador (ex.: importação) não serão distribuídos depois
+        self._allocator.advance(number.number)
+        for index in self._indexes():
+            index.add(account)
+        account.add_observer(self._balance_index)
+
+    def get(self, account_number: AccountNumber) -> Account:
+        """
+        Busca uma conta da agência pelo número (O(1)).
+
+        Args:
+            account_number (AccountNumber): Número da conta.
+
+        Returns:
+            Account: Conta encontrada, ou None.
+        """
+        return self._accounts_by_number.get(account_number.account_number)
+
+    def allocate_account_number(self) -> AccountNumber:
+        """
+        Reserva o próximo número de conta da agência.
+
+        Números que já pertencem a uma conta da agência são pulados.
+
+        Raises:
+            ValueError: Se a agência esgotou os números de conta.
+
+        Returns:
+            AccountNumber: Número reservado.
+        """
+        while True:
+            account_number = self._allocator.allocate()
+            if account_number.account_number not in self._accounts_by_number:
+                return account_number
+
+    def reindex(self, account: Account):
+        """Atualiza os índices de uma conta cujo cliente teve endereço ou data de nascimento alterados."""
+        for index in self._indexes():
+            index.remove(account)
+            index.add(account)
+
+    def detach(self):
+        """Deixa de observar o saldo das contas (a partição será descartada)."""
+        for account in self._accounts:
+            account.remove_observer(self._balance_index)
+
+    def query_accounts(self, city: str = None, state: str = None,
+                       born_before: datetime = None, born_after: datetime = None,
+                       min_balance: Decimal = None, max_balance: Decimal = None) -> List[Account]:
+        """
+        Consulta as contas da agência por atributos do cliente e pelo saldo.
+
+        Entre os critérios informados, usa o índice que produz menos candidatos
+        (a contagem é obtida sem materializar as contas) e aplica os demais
+        critérios como filtro sobre esse conjunto.
+
+        Args:
+            city (str, optional): Cidade do cliente (sem diferenciar maiúsculas).
+            state (str, optional): Estado do cliente (sem diferenciar maiúsculas).
+            born_before (datetime, optional): Clientes nascidos antes desta data (exclusivo).
+            born_after (datetime, optional): Clientes nascidos depois desta data (exclusivo).
+            min_balance (Decimal, optional): Saldo mínimo (inclusivo).
+            max_balance (Decimal, optional): Saldo máximo (inclusivo).
+
+        Returns:
+            List[Account]: Contas que atendem a todos os critérios.
+        """
+        city_key = normalize_text_key(city) if city is not None else None
+        state_key = normalize_text_key(state) if state is not None else None
+        has_birth = born_before is not None or born_after is not None
+        has_balance = min_balance is not None or max_balance is not None
+
+        # Planos possíveis: (quantidade estimada de candidatos, função que os materializa)
+        plans = []
+        if city_key is not None:
+            candidates = self._city_index.lookup(city_key)
+            plans.append((len(candidates), lambda: candidates))
+        if state_key is not None:
+            state_candidates = self._state_index.lookup(state_key)
+            plans.append((len(state_candidates), lambda: state_candidates))
+        if has_birth:
+            plans.append((
+                self._birth_date_index.count_range(born_after, born_before, include_low=False, include_high=False),
+                lambda: self._birth_date_index.range(born_after, born_before, include_low=False, include_high=False)
+            ))
+        if has_balance:
+            plans.append((
+                self._balance_index.count_range(min_balance, max_balance),
+                lambda: self._balance_index.range(min_balance, max_balance)
+            ))
+
+        if not plans:
+            return list(self._accounts)
+        _, materialize = min(plans, key=lambda plan: plan[0])
+
+        results = []
+        for account in materialize():
+            client = account.client
+            if city_key is not None and normalize_text_key(client.address.city) != city_key:
+                continue
+            if state_key is not None and normalize_text_key(client.address.state) != state_key:
+                continue
+            if born_before is not None and not client.date_of_birth.date < born_before:
+                continue
+            if born_after is not None and not client.date_of_birth.date > born_after:
+                continue
+            if min_balance is not None and account.balance < min_balance:
+                continue
+            if max_balance is not None and account.balance > max_balance:
+                continue
+            results.append(account)
+        return results
+
+    def top_accounts_by_balance(self, limit: int) -> List[Account]:
+        """Retorna as contas da agência com os maiores saldos, em ordem decrescente."""
+        return self._balance_index.largest(limit)
+
+    def iterate_balance_range(self, min_balance: Decimal = None, max_balance: Decimal = None):
+        """Percorre as contas da agência com saldo na faixa (inclusiva), em ordem crescente."""
+        return self._balance_index.iterate_range(min_balance, max_balance)
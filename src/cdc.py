@@ -0,0 +1,609 @@
+from __future__ import annotations
+
+from collections import deque
+from decimal import Decimal
+from typing import Callable, Deque, List, NamedTuple, Sequence, TYPE_CHECKING
+import json
+import os
+import socket
+import threading
+import time
+
+if TYPE_CHECKING:
+    from src import Bank
+    from src.entities import Account, Client, Transaction
+
+# Tipos de evento publicados
+CLIENT_REGISTERED = 'client_registered'
+ACCOUNT_CREATED = 'account_created'
+BALANCE_CHANGED = 'balance_changed'
+TRANSACTION_APPENDED = 'transaction_appended'
+EVENT_TYPES = (CLIENT_REGISTERED, ACCOUNT_CREATED, BALANCE_CHANGED, TRANSACTION_APPENDED)
+
+# Políticas quando o buffer está cheio
+OVERFLOW_BLOCK = 'block'
+OVERFLOW_DROP_OLDEST = 'drop_oldest'
+OVERFLOW_POLICIES = (OVERFLOW_BLOCK, OVERFLOW_DROP_OLDEST)
+
+DEFAULT_CAPACITY = 65_536
+DEFAULT_BATCH_SIZE = 512
+# Espera máxima do produtor por espaço no buffer (política `block`) antes de descartar o evento mais antigo
+DEFAULT_BLOCK_TIMEOUT = 5.0
+
+class ChangeEvent(NamedTuple):
+    """
+    Evento de alteração publicado pelo CDC.
+
+    Atributos:
+        sequence (int): Número do evento, crescente (permite retomar o consumo).
+        type (str): Tipo do evento (ver EVENT_TYPES).
+        timestamp (float): Momento da publicação, em segundos desde a época.
+        data (dict): Dados do evento, suficientes para reproduzir a alteração.
+    """
+    sequence: int
+    type: str
+    timestamp: float
+    data: dict
+
+def encode_event(event: ChangeEvent) -> str:
+    """
+    Serializa um evento como uma linha JSON compacta (sem a quebra de linha).
+
+    Args:
+        event (ChangeEvent): Evento a serializar.
+
+    Returns:
+        str: Representação JSON do evento.
+    """
+    return json.dumps({'seq': event.sequence, 'type': event.type, 'ts': event.timestamp, 'data': event.data},
+                      ensure_ascii=False, separators=(',', ':'))
+
+def decode_event(line: str | bytes) -> ChangeEvent:
+    """
+    Reconstrói um evento a partir de uma linha JSON produzida por encode_event.
+
+    Args:
+        line (str | bytes): Linha JSON.
+
+    Raises:
+        ValueError: Se a linha não representar um evento válido.
+
+    Returns:
+        ChangeEvent: Evento decodificado.
+    """
+    try:
+        record = json.loads(line)
+        event = ChangeEvent(record['seq'], record['type'], record['ts'], record['data'])
+    except (KeyError, TypeError, json.JSONDecodeError):
+        raise ValueError("Evento de CDC inválido")
+    if event.type not in EVENT_TYPES:
+        raise ValueError(f"Tipo de evento de CDC desconhecido: {event.type}")
+    return event
+
+def client_data(client: Client) -> dict:
+    """Dados de um cliente para o evento CLIENT_REGISTERED."""
+    address = client.address
+    return {
+        'name': client.name,
+        'cpf': str(client.cpf),
+        'date_of_birth': str(client.date_of_birth),
+        'street': address.street,
+        'number': address.number,
+        'district': address.district,
+        'city': address.city,
+        'state': address.state
+    }
+
+def account_data(account: Account) -> dict:
+    """Dados de uma conta para o evento ACCOUNT_CREATED."""
+    return {
+        'account': str(account.account_number),
+        'agency': str(account.agency_number),
+        'cpf': str(account.client.cpf),
+        'balance': str(account.balance)
+    }
+
+def transaction_data(sequence: int, transaction: Transaction) -> dict:
+    """Dados de uma transação para o evento TRANSACTION_APPENDED."""
+    account = transaction.account
+    timestamp = transaction._timestamp
+    data = {
+        'ledger_sequence': sequence,
+        'kind': type(transaction).__name__.lower(),
+        'account': str(account.account_number),
+        'agency': str(account.agency_number),
+        'value': str(transaction.value),
+        'at': timestamp.timestamp() if timestamp is not None else None
+    }
+    destination = getattr(transaction, 'destination_account', None)
+    if destination is not None:
+        data['destination_account'] = str(destination.account_number)
+        data['destination_agency'] = str(destination.agency_number)
+    if transaction.idempotency_key is not None:
+        data['idempotency_key'] = transaction.idempotency_key
+    return data
+
+class RingBuffer:
+    """
+    Buffer circular limitado e seguro entre threads.
+
+    Quando cheio, aplica a política configurada: `block` faz o produtor
+    aguardar o consumo (contrapressão) e `drop_oldest` descarta o evento mais
+    antigo, contabilizando-o em `dropped`.
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, overflow: str = OVERFLOW_BLOCK):
+        """
+        Inicializa o buffer.
+
+        Args:
+            capacity (int): Número máximo de eventos armazenados.
+            overflow (str): Política quando cheio (OVERFLOW_BLOCK ou OVERFLOW_DROP_OLDEST).
+
+        Raises:
+            ValueError: Se a capacidade ou a política forem inválidas.
+        """
+        if capacity < 1:
+            raise ValueError("A capacidade do buffer deve ser maior que zero")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Política inválida. Políticas válidas: {list(OVERFLOW_POLICIES)}")
+        self._capacity = capacity
+        self._overflow = overflow
+        self._items: Deque[ChangeEvent] = deque()
+        self._condition = threading.Condition()
+        self._dropped = 0
+        self._closed = False
+
+    @property
+    def capacity(self) -> int:
+        """Retorna a capacidade do buffer."""
+        return self._capacity
+
+    @property
+    def overflow(self) -> str:
+        """Retorna a política aplicada quando o buffer está cheio."""
+        return self._overflow
+
+    @property
+    def dropped(self) -> int:
+        """Retorna o número de eventos descartados por falta de espaço."""
+        return self._dropped
+
+    def __len__(self) -> int:
+        """Retorna o número de eventos aguardando consumo."""
+        return len(self._items)
+
+    def is_full(self) -> bool:
+        """Indica se o buffer atingiu a capacidade."""
+        return len(self._items) >= self._capacity
+
+    def put(self, event: ChangeEvent, timeout: float = None) -> bool:
+        """
+        Armazena um evento.
+
+        Args:
+            event (ChangeEvent): Evento a armazenar.
+            timeout (float, optional): Espera máxima, em segundos, na política `block`.
+
+        Returns:
+            bool: True se o evento foi armazenado, False se a espera expirou
+                ou o buffer foi fechado.
+        """
+        with self._condition:
+            if len(self._items) >= self._capacity:
+                if self._overflow == OVERFLOW_DROP_OLDEST:
+                    self._items.popleft()
+                    self._dropped += 1
+                elif not self._condition.wait_for(
+                        lambda: self._closed or len(self._items) < self._capacity, timeout):
+                    return False
+            if self._closed:
+                return False
+            self._items.append(event)
+            self._condition.notify_all()
+            return True
+
+    def wait_for_space(self, timeout: float = None) -> bool:
+        """
+        Aguarda até haver espaço no buffer.
+
+        Args:
+            timeout (float, optional): Espera máxima, em segundos.
+
+        Returns:
+            bool: True se há espaço (ou o buffer foi fechado), False se a espera expirou.
+        """
+        with self._condition:
+            return self._condition.wait_for(lambda: self._closed or len(self._items) < self._capacity, timeout)
+
+    def force_put(self, event: ChangeEvent) -> bool:
+        """
+        Armazena um evento sem esperar: se cheio, descarta o mais antigo (contabilizado em `dropped`).
+
+        Returns:
+            bool: True se o evento foi armazenado, False se o buffer foi fechado.
+        """
+        with self._condition:
+            if self._closed:
+                return False
+            if len(self._items) >= self._capacity:
+                self._items.popleft()
+                self._dropped += 1
+            self._items.append(event)
+            self._condition.notify_all()
+            return True
+
+    def wait_for_events(self, timeout: float = None) -> bool:
+        """
+        Aguarda até haver eventos no buffer, sem retirá-los.
+
+        Args:
+            timeout (float, optional): Espera máxima, em segundos.
+
+        Returns:
+            bool: True se há eventos, False se a espera expirou ou o buffer foi fechado vazio.
+        """
+        with self._condition:
+            self._condition.wait_for(lambda: self._closed or self._items, timeout)
+            return bool(self._items)
+
+    def get_batch(self, max_items: int, timeout: float = None) -> List[ChangeEvent]:
+        """
+        Retira até `max_items` eventos, aguardando se o buffer estiver vazio.
+
+        Args:
+            max_items (int): Tamanho máximo do lote.
+            timeout (float, optional): Espera máxima, em segundos (0 = não espera).
+
+        Returns:
+            List[ChangeEvent]: Eventos retirados (lista vazia se a espera expirou).
+        """
+        with self._condition:
+            if not self._items and timeout != 0:
+                self._condition.wait_for(lambda: self._closed or self._items, timeout)
+            items = self._items
+            batch = [items.popleft() for _ in range(min(max_items, len(items)))]
+            if batch:
+                self._condition.notify_all()
+            return batch
+
+    def close(self):
+        """Fecha o buffer, liberando produtores e consumidores em espera."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+
+class FileSink:
+    """
+    Destino que grava os eventos em um arquivo, um evento JSON por linha.
+
+    Cada lote é gravado com uma única escrita e descarregado em seguida,
+    permitindo que outro processo acompanhe o arquivo.
+    """
+
+    def __init__(self, path: str, fsync: bool = False):
+        """
+        Inicializa o destino.
+
+        Args:
+            path (str): Caminho do arquivo (aberto para acréscimo).
+            fsync (bool): Se cada lote deve ser sincronizado com o disco.
+        """
+        self._path = path
+        self._fsync = fsync
+        self._file = open(path, 'a', encoding='utf-8')
+
+    @property
+    def path(self) -> str:
+        """Retorna o caminho do arquivo."""
+        return self._path
+
+    def write_batch(self, events: Sequence[ChangeEvent]):
+        """Grava um lote de eventos."""
+        self._file.write(''.join(encode_event(event) + '\n' for event in events))
+        self._file.flush()
+        if self._fsync:
+            os.fsync(self._file.fileno())
+
+    def close(self):
+        """Fecha o arquivo."""
+        self._file.close()
+
+class UnixSocketSink:
+    """
+    Destino que envia os eventos a um consumidor local por socket Unix.
+
+    Os eventos seguem o mesmo formato do FileSink (JSON por linha) e cada lote
+    é enviado com um único `sendall`; se o consumidor for lento, o envio
+    bloqueia o despacho e, com a política `block`, os produtores.
+    """
+
+    def __init__(self, path: str, connect_timeout: float = 5.0):
+        """
+        Inicializa o destino (a conexão é aberta no primeiro envio).
+
+        Args:
+            path (str): Caminho do socket Unix do consumidor.
+            connect_timeout (float): Tempo máximo, em segundos, para estabelecer a conexão.
+        """
+        self._path = path
+        self._connect_timeout = connect_timeout
+        self._socket: socket.socket = None
+
+    @property
+    def path(self) -> str:
+        """Retorna o caminho do socket."""
+        return self._path
+
+    def _connect(self) -> socket.socket:
+        """Abre a conexão com o consumidor."""
+        connection = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        connection.settimeout(self._connect_timeout)
+        connection.connect(self._path)
+        connection.settimeout(None)
+        return connection
+
+    def write_batch(self, events: Sequence[ChangeEvent]):
+        """
+        Envia um lote de eventos.
+
+        Raises:
+            OSError: Se o consumidor não estiver disponível (a conexão é
+                refeita no próximo envio).
+        """
+        payload = ''.join(encode_event(event) + '\n' for event in events).encode('utf-8')
+        if self._socket is None:
+            self._socket = self._connect()
+        try:
+            self._socket.sendall(payload)
+        except OSError:
+            self.close()
+            raise
+
+    def close(self):
+        """Fecha a conexão."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+class CallbackSink:
+    """Destino que entrega cada lote a uma função (consumidores no mesmo processo)."""
+
+    def __init__(self, callback: Callable[[Sequence[ChangeEvent]], None]):
+        """
+        Args:
+            callback (Callable[[Sequence[ChangeEvent]], None]): Função chamada com cada lote.
+        """
+        self._callback = callback
+
+    def write_batch(self, events: Sequence[ChangeEvent]):
+        """Entrega um lote de eventos."""
+        self._callback(events)
+
+    def close(self):
+        """Nada a liberar."""
+
+class ChangeDataCapture:
+    """
+    Captura as alterações do banco e as publica como eventos tipados.
+
+    Observa o Bank (clientes e contas registrados), as contas (saldo) e o
+    livro-razão (transações). Os eventos entram em um RingBuffer e são
+    entregues em lotes aos destinos (sinks) por uma thread de despacho
+    (`start`) ou sob demanda (`dispatch_pending`).
+
+    Sem a thread de despacho, um buffer cheio com a política `block` é
+    esvaziado pelo próprio produtor, evitando bloqueio permanente. Com a
+    thread, o produtor espera por espaço no máximo `block_timeout` segundos;
+    depois disso, o evento mais antigo é descartado (contabilizado em
+    `buffer.dropped`).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY, overflow: str = OVERFLOW_BLOCK,
+                 batch_size: int = DEFAULT_BATCH_SIZE, flush_interval: float = 0.05,
+                 block_timeout: float = DEFAULT_BLOCK_TIMEOUT):
+        """
+        Inicializa o CDC.
+
+        Args:
+            capacity (int): Capacidade do buffer de eventos.
+            overflow (str): Política quando o buffer está cheio.
+            batch_size (int): Número máximo de eventos por lote entregue aos destinos.
+            flush_interval (float): Espera máxima, em segundos, da thread de despacho por novos eventos.
+            block_timeout (float): Espera máxima, em segundos, do produtor por espaço na política `block`.
+        """
+        self._buffer = RingBuffer(capacity, overflow)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._block_timeout = block_timeout
+        self._sinks: list = []
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._dispatch_lock = threading.Lock()
+        self._thread: threading.Thread = None
+        self._running = False
+        self._errors = 0
+        self._banks: List[Bank] = []
+
+    @property
+    def buffer(self) -> RingBuffer:
+        """Retorna o buffer de eventos."""
+        return self._buffer
+
+    @property
+    def last_sequence(self) -> int:
+        """Retorna o número do último evento publicado."""
+        return self._sequence
+
+    @property
+    def errors(self) -> int:
+        """Retorna quantas entregas de lote (ou ciclos da thread de despacho) falharam."""
+        return self._errors
+
+    def add_sink(self, sink):
+        """
+        Registra um destino. Deve implementar `write_batch(events)` e `close()`.
+
+        Args:
+            sink: Destino dos eventos (ex.: FileSink, UnixSocketSink).
+        """
+        self._sinks.append(sink)
+
+    def remove_sink(self, sink):
+        """Remove um destino registrado."""
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+
+    def publish(self, event_type: str, data: dict) -> ChangeEvent:
+        """
+        Publica um evento no buffer.
+
+        A espera por espaço (política `block`) acontece fora do lock; o número
+        de sequência é atribuído e o evento armazenado sob o lock, sem espera,
+        o que mantém os eventos do buffer em ordem de sequência.
+
+        Args:
+            event_type (str): Tipo do evento.
+            data (dict): Dados do evento.
+
+        Returns:
+            ChangeEvent: Evento publicado.
+        """
+        buffer = self._buffer
+        if buffer.overflow == OVERFLOW_BLOCK and buffer.is_full():
+            if self._running:
+                buffer.wait_for_space(self._block_timeout)
+            else:
+                self.dispatch_pending()
+        with self._lock:
+            self._sequence += 1
+            event = ChangeEvent(self._sequence, event_type, time.time(), data)
+            # Se outro produtor ocupou a vaga ou a espera expirou, descarta o evento mais antigo
+            buffer.force_put(event)
+        return event
+
+    # Observador do Bank, das contas e do livro-razão
+
+    def client_registered(self, client: Client):
+        """Publica CLIENT_REGISTERED."""
+        self.publish(CLIENT_REGISTERED, client_data(client))
+
+    def account_registered(self, account: Account):
+        """Publica ACCOUNT_CREATED e passa a observar o saldo da conta."""
+        self.publish(ACCOUNT_CREATED, account_data(account))
+        account.add_observer(self)
+
+    def balance_changed(self, account: Account, previous_balance: Decimal):
+        """Publica BALANCE_CHANGED com o saldo novo e o anterior."""
+        self.publish(BALANCE_CHANGED, {
+            'account': str(account.account_number),
+            'agency': str(account.agency_number),
+            'balance': str(account.balance),
+            'previous_balance': str(previous_balance)
+        })
+
+    def transaction_appended(self, sequence: int, transaction: Transaction):
+        """Publica TRANSACTION_APPENDED."""
+        self.publish(TRANSACTION_APPENDED, transaction_data(sequence, transaction))
+
+    def attach(self, bank: Bank, snapshot: bool = False):
+        """
+        Passa a capturar as alterações de um banco.
+
+        Args:
+            bank (Bank): Banco observado.
+            snapshot (bool): Se o estado atual (clientes, contas com saldo e
+                transações do livro-razão) deve ser publicado antes das
+                alterações seguintes, permitindo que um consumidor novo
+                reconstrua o banco.
+        """
+        if snapshot:
+            for client in bank.clients:
+                self.client_registered(client)
+            for account in bank.accounts:
+                self.publish(ACCOUNT_CREATED, account_data(account))
+            for record in bank.stream_transactions():
+                self.transaction_appended(record.sequence, record.transaction)
+        for account in bank.accounts:
+            account.add_observer(self)
+        bank.add_observer(self)
+        bank.ledger.add_observer(self)
+        self._banks.append(bank)
+
+    def detach(self, bank: Bank):
+        """Deixa de capturar as alterações de um banco."""
+        bank.remove_observer(self)
+        bank.ledger.remove_observer(self)
+        for account in bank.accounts:
+            account.remove_observer(self)
+        if bank in self._banks:
+            self._banks.remove(bank)
+
+    def dispatch_pending(self) -> int:
+        """
+        Entrega aos destinos todos os eventos do buffer, em lotes.
+
+        Falhas de um destino são contabilizadas em `errors` e não impedem a
+        entrega aos demais.
+
+        Returns:
+            int: Número de eventos retirados do buffer.
+        """
+        total = 0
+        with self._dispatch_lock:
+            while True:
+                batch = self._buffer.get_batch(self._batch_size, timeout=0)
+                if not batch:
+                    return total
+                self._deliver(batch)
+                total += len(batch)
+
+    def _deliver(self, batch: List[ChangeEvent]):
+        """Entrega um lote a cada destino."""
+        for sink in self._sinks:
+            try:
+                sink.write_batch(batch)
+            except Exception:
+                # Um destino com defeito não pode interromper a entrega aos demais nem a thread de despacho
+                self._errors += 1
+
+    def _run(self):
+        """Laço da thread de despacho (uma falha inesperada é contabilizada e o laço continua)."""
+        while self._running:
+            try:
+                # Espera fora do lock; o lote é retirado e entregue sob o lock, para que um
+                # dispatch_pending concorrente não entregue eventos posteriores antes destes
+                if self._buffer.wait_for_events(self._flush_interval):
+                    with self._dispatch_lock:
+                        batch = self._buffer.get_batch(self._batch_size, timeout=0)
+                        if batch:
+                            self._deliver(batch)
+            except Exception:
+                self._errors += 1
+        self.dispatch_pending()
+
+    def start(self):
+        """Inicia a thread de despacho em segundo plano."""
+        if self._running:
+            return
+        self._running = True
+        self._thread = threading.Thread(target=self._run, name='cdc-dispatcher', daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        """Interrompe a thread de despacho após entregar os eventos pendentes."""
+        if not self._running:
+            return
+        self._running = False
+        self._thread.join()
+        self._thread = None
+
+    def close(self):
+        """Interrompe o despacho, deixa de observar os bancos e fecha os destinos."""
+        self.stop()
+        self.dispatch_pending()
+        for bank in list(self._banks):
+            self.detach(bank)
+        for sink in self._sinks:
+            sink.close()
+        self._buffer.close()
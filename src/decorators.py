@@ -1,35 +1,322 @@
 from __future__ import annotations
 
+from contextlib import nullcontext
 from datetime import datetime
 from functools import wraps
-from typing import Callable, Any
-import logging
-import json
-import os
+from typing import Callable, Any, Dict, List, Optional, TYPE_CHECKING
+import time
+import tracemalloc
+
+from src.log_encoding import TimestampFormatter
+from src.log_policy import LEVEL_EXCEPTION, LEVEL_FAILURE, LEVEL_SUCCESS, LogPolicy
+from src.log_sinks import LogPipeline, LogSink, log_pipeline
+
+if TYPE_CHECKING:
+    import pstats
+
+# Nomes dos estágios medidos durante a execução de uma transação
+STAGE_VALIDATION = 'validation'
+STAGE_BALANCE = 'balance'
+STAGE_PRESENTATION = 'presentation'
+STAGE_LOG = 'log'
+
+# Registro de hooks de instrumentação do método execute()
+_before_hooks: List[Callable] = []
+_after_hooks: List[Callable] = []
+_error_hooks: List[Callable] = []
+_hooks_enabled: bool = False
+
+# Contexto nulo reutilizado quando não há hooks registrados
+_NULL_STAGE = nullcontext()
+
+# Formatação das datas do log, reaproveitada entre transações do mesmo segundo
+_log_timestamp = TimestampFormatter()
+
+def _refresh_hooks_state() -> None:
+    """Atualiza o indicador global usado para evitar custo quando não há hooks."""
+    global _hooks_enabled
+    _hooks_enabled = bool(_before_hooks or _after_hooks or _error_hooks)
+
+def register_transaction_hook(before: Optional[Callable] = None,
+                              after: Optional[Callable] = None,
+                              error: Optional[Callable] = None) -> None:
+    """
+    Registra callbacks executados ao redor do método execute() das transações.
+
+    Assinaturas esperadas:
+        before(transaction)
+        after(transaction, result, stages)
+        error(transaction, exception, stages)
+
+    Onde `stages` é um dicionário {estágio: segundos} com o tempo gasto em
+    validação, alteração de saldo, escrita do log e, com o ConsolePresenter
+    instalado, exibição no console.
+
+    Args:
+        before (Callable, optional): Chamado antes da execução.
+        after (Callable, optional): Chamado após a execução bem-sucedida.
+        error (Callable, optional): Chamado quando a execução lança exceção.
+    """
+    if before is not None:
+        _before_hooks.append(before)
+    if after is not None:
+        _after_hooks.append(after)
+    if error is not None:
+        _error_hooks.append(error)
+    _refresh_hooks_state()
+
+def unregister_transaction_hook(before: Optional[Callable] = None,
+                                after: Optional[Callable] = None,
+                                error: Optional[Callable] = None) -> None:
+    """
+    Remove callbacks previamente registrados com register_transaction_hook.
+
+    Args:
+        before (Callable, optional): Callback "before" a remover.
+        after (Callable, optional): Callback "after" a remover.
+        error (Callable, optional): Callback "error" a remover.
+    """
+    for hooks, hook in ((_before_hooks, before), (_after_hooks, after), (_error_hooks, error)):
+        if hook is not None and hook in hooks:
+            hooks.remove(hook)
+    _refresh_hooks_state()
+
+def clear_transaction_hooks() -> None:
+    """Remove todos os hooks de transação registrados."""
+    _before_hooks.clear()
+    _after_hooks.clear()
+    _error_hooks.clear()
+    _refresh_hooks_state()
+
+class _StageTimer:
+    """
+    Gerenciador de contexto que acumula o tempo gasto em um estágio da transação.
+    """
+    __slots__ = ('_timings', '_name', '_start')
+
+    def __init__(self, timings: Dict[str, float], name: str):
+        self._timings = timings
+        self._name = name
+        self._start = 0.0
+
+    def __enter__(self):
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        elapsed = time.perf_counter() - self._start
+        self._timings[self._name] = self._timings.get(self._name, 0.0) + elapsed
+        return False
+
+def transaction_stage(transaction: Any, name: str):
+    """
+    Retorna um gerenciador de contexto que mede um estágio da transação.
+
+    Quando nenhum hook está registrado, devolve um contexto nulo compartilhado,
+    de modo que o custo no caminho quente seja apenas uma verificação de flag.
+
+    Args:
+        transaction (Any): Instância da transação em execução.
+        name (str): Nome do estágio (ex.: STAGE_VALIDATION).
+
+    Returns:
+        Gerenciador de contexto para uso com `with`.
+    """
+    if not _hooks_enabled:
+        return _NULL_STAGE
+    timings = getattr(transaction, '_stage_timings', None)
+    if timings is None:
+        return _NULL_STAGE
+    return _StageTimer(timings, name)
+
+class ProfilingSampler:
+    """
+    Amostrador que perfila uma a cada N transações usando cProfile ou tracemalloc.
+
+    É instalado como um conjunto de hooks de transação, portanto não adiciona
+    custo algum enquanto não estiver instalado.
+    """
+
+    MODES = ('cprofile', 'tracemalloc')
+
+    def __init__(self, every: int = 100, mode: str = 'cprofile'):
+        """
+        Inicializa o amostrador.
+
+        Args:
+            every (int): Intervalo de amostragem (1 perfila todas as transações).
+            mode (str): 'cprofile' para tempo de CPU ou 'tracemalloc' para memória.
+
+        Raises:
+            ValueError: Se o intervalo ou o modo forem inválidos.
+        """
+        if every < 1:
+            raise ValueError("O intervalo de amostragem deve ser maior que zero")
+        if mode not in self.MODES:
+            raise ValueError(f"Modo de perfilamento inválido. Modos válidos: {list(self.MODES)}")
+        self._every = every
+        self._mode = mode
+        self._counter = 0
+        self._sampling = None
+        self._profile = None
+        if mode == 'cprofile':
+            # Importado apenas quando usado, para não pesar na inicialização do pacote
+            import cProfile
+            self._profile = cProfile.Profile()
+        self._samples: List[dict] = []
+        self._started_tracemalloc = False
+        self._baseline_memory = 0
+
+    @property
+    def samples(self) -> List[dict]:
+        """Retorna as amostras coletadas (tipo, estágios e, no modo tracemalloc, memória)."""
+        return self._samples
+
+    def install(self) -> 'ProfilingSampler':
+        """Registra o amostrador nos hooks de transação."""
+        register_transaction_hook(before=self._before, after=self._after, error=self._error)
+        return self
+
+    def uninstall(self) -> None:
+        """Remove o amostrador dos hooks de transação."""
+        unregister_transaction_hook(before=self._before, after=self._after, error=self._error)
+        if self._started_tracemalloc and tracemalloc.is_tracing():
+            tracemalloc.stop()
+            self._started_tracemalloc = False
+
+    def stats(self) -> Optional[pstats.Stats]:
+        """
+        Retorna as estatísticas acumuladas do cProfile.
+
+        Returns:
+            pstats.Stats: Estatísticas agregadas, ou None se nada foi amostrado.
+        """
+        if self._profile is None or not self._samples:
+            return None
+        import pstats
+        return pstats.Stats(self._profile)
+
+    def _before(self, transaction: Any) -> None:
+        self._counter += 1
+        if self._counter % self._every != 0:
+            return
+        self._sampling = transaction
+        if self._mode == 'cprofile':
+            try:
+                self._profile.enable()
+            except ValueError:
+                # Outro profiler já está ativo; ignora esta amostra
+                self._sampling = None
+        else:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            tracemalloc.reset_peak()
+            self._baseline_memory = tracemalloc.get_traced_memory()[0]
+
+    def _finish(self, transaction: Any, stages: Dict[str, float], failed: bool) -> None:
+        if self._sampling is not transaction:
+            return
+        self._sampling = None
+        sample = {
+            'transaction_type': type(transaction).__name__,
+            'stages': dict(stages),
+            'failed': failed
+        }
+        if self._mode == 'cprofile':
+            self._profile.disable()
+        else:
+            current, peak = tracemalloc.get_traced_memory()
+            sample['allocated_bytes'] = current - self._baseline_memory
+            sample['peak_bytes'] = peak - self._baseline_memory
+        self._samples.append(sample)
+
+    def _after(self, transaction: Any, result: Any, stages: Dict[str, float]) -> None:
+        self._finish(transaction, stages, failed=not result)
+
+    def _error(self, transaction: Any, error: Exception, stages: Dict[str, float]) -> None:
+        self._finish(transaction, stages, failed=True)
+
+def configure_log_sinks(*sinks: LogSink) -> LogPipeline:
+    """
+    Substitui os destinos do log de transações (os anteriores são fechados).
+
+    Sem argumentos, o log é desligado e o decorador deixa de montar os registros.
+
+    Exemplo:
+        configure_log_sinks(AsyncFileSink('log.txt'), SyslogSocketSink(sample_rate=0.01))
+
+    Args:
+        *sinks (LogSink): Novos destinos.
+
+    Returns:
+        LogPipeline: Pipeline usado pelo transaction_logger.
+    """
+    log_pipeline.configure(sinks)
+    return log_pipeline
+
+def configure_log_policy(policy: Optional[LogPolicy]) -> LogPipeline:
+    """
+    Define a política de níveis e amostragem do log de transações.
+
+    A política é avaliada antes da montagem do registro, de modo que as
+    transações descartadas não pagam a formatação de nomes, argumentos e datas.
+
+    Exemplo:
+        configure_log_policy(LogPolicy(success_sample_rate=0.01,
+                                       transfer_threshold=Decimal('10000'),
+                                       max_records_per_account=5))
+
+    Args:
+        policy (LogPolicy, optional): Nova política (None registra todas as transações).
+
+    Returns:
+        LogPipeline: Pipeline usado pelo transaction_logger.
+    """
+    log_pipeline.policy = policy
+    return log_pipeline
 
 def save_to_log_file(log_data: dict) -> None:
     """
-    Salva os dados de log em um arquivo log.txt.
+    Entrega os dados de log aos destinos configurados (por padrão, o arquivo log.txt).
     
     Args:
         log_data (dict): Dicionário com os dados do log
     """
-    try:
-        # Converte os dados para JSON em uma linha
-        log_line = json.dumps(log_data, ensure_ascii=False)
-        
-        # Abre o arquivo em modo append (adiciona ao final)
-        with open('log.txt', 'a', encoding='utf-8') as log_file:
-            log_file.write(log_line + '\n')
-            
-    except Exception as e:
-        # Se houver erro ao salvar o log, apenas imprime no console
-        print(f"⚠️  Erro ao salvar log em arquivo: {str(e)}")
+    log_pipeline.emit(log_data)
+
+def _build_log_record(func: Callable, args: tuple, kwargs: dict, transaction_instance: Any,
+                      start_time: datetime) -> dict:
+    """Monta a parte do registro de log conhecida antes do desfecho da transação."""
+    log_data = {
+        'timestamp': _log_timestamp.format(start_time),
+        'function_name': func.__name__,
+        'transaction_type': type(transaction_instance).__name__,
+        'arguments': {
+            'args': [str(arg) for arg in args[1:]],  # Exclui self
+            'kwargs': {k: str(v) for k, v in kwargs.items()}
+        }
+    }
+    
+    # Adiciona informações específicas da transação
+    if hasattr(transaction_instance, 'value'):
+        log_data['transaction_value'] = str(transaction_instance.value)
+    
+    if hasattr(transaction_instance, 'account'):
+        log_data['account_number'] = str(transaction_instance.account.account_number)
+        log_data['client_name'] = transaction_instance.account.client.name
+    
+    if hasattr(transaction_instance, 'destination_account'):
+        log_data['destination_account'] = str(transaction_instance.destination_account.account_number)
+        log_data['destination_client'] = transaction_instance.destination_account.client.name
+    return log_data
 
 def transaction_logger(func: Callable) -> Callable:
     """
     Decorador que registra a data e hora de cada transação bancária.
-    Salva as informações em arquivo log.txt e também exibe no console.
+    Entrega as informações aos destinos do log (por padrão, o arquivo log.txt;
+    ver configure_log_sinks); a exibição no console fica a cargo do
+    apresentador (src.presenter), instalado como hook apenas pelo menu interativo.
     
     Args:
         func (Callable): Função a ser decorada (método execute das transações)
@@ -44,103 +331,68 @@ def transaction_logger(func: Callable) -> Callable:
         
         # Registra o início da transação
         start_time = datetime.now()
-        transaction_type = type(transaction_instance).__name__
         
         # Armazena o timestamp na transação para uso posterior
         transaction_instance._timestamp = start_time
         
-        # Prepara dados para o log
-        log_data = {
-            'timestamp': start_time.strftime('%d/%m/%Y às %H:%M:%S'),
-            'function_name': func.__name__,
-            'transaction_type': transaction_type,
-            'arguments': {
-                'args': [str(arg) for arg in args[1:]],  # Exclui self
-                'kwargs': {k: str(v) for k, v in kwargs.items()}
-            }
-        }
-        
-        # Adiciona informações específicas da transação
-        if hasattr(transaction_instance, 'value'):
-            log_data['transaction_value'] = str(transaction_instance.value)
-        
-        if hasattr(transaction_instance, 'account'):
-            log_data['account_number'] = str(transaction_instance.account.account_number)
-            log_data['client_name'] = transaction_instance.account.client.name
-        
-        if hasattr(transaction_instance, 'destination_account'):
-            log_data['destination_account'] = str(transaction_instance.destination_account.account_number)
-            log_data['destination_client'] = transaction_instance.destination_account.client.name
-        
-        # Exibe no console (mantém o comportamento original)
-        print(f"\n{'='*60}")
-        print(f"🕐 INÍCIO DA TRANSAÇÃO: {transaction_type}")
-        print(f"📅 Data/Hora: {start_time.strftime('%d/%m/%Y às %H:%M:%S')}")
-        print(f"💰 Valor: R$ {transaction_instance.value if hasattr(transaction_instance, 'value') else 'N/A'}")
-        
-        if hasattr(transaction_instance, 'account'):
-            print(f"🏦 Conta: {transaction_instance.account.account_number}")
-            print(f"👤 Cliente: {transaction_instance.account.client.name}")
-        
-        # Para transferências, mostra informações da conta de destino
-        if hasattr(transaction_instance, 'destination_account'):
-            print(f"🎯 Conta Destino: {transaction_instance.destination_account.account_number}")
-            print(f"👤 Cliente Destino: {transaction_instance.destination_account.client.name}")
-        
-        print(f"{'='*60}")
+        # Hooks de instrumentação (apenas uma verificação de flag quando não há hooks)
+        hooks_enabled = _hooks_enabled
+        if hooks_enabled:
+            stage_timings = transaction_instance._stage_timings = {}
+            for hook in tuple(_before_hooks):
+                hook(transaction_instance)
         
         try:
             # Executa a transação
             result = func(*args, **kwargs)
-            
-            # Registra o sucesso da transação
-            end_time = datetime.now()
-            duration = end_time - start_time
-            
-            # Atualiza dados do log com resultado
-            log_data['return_value'] = str(result)
-            log_data['status'] = 'Sucesso'
-            log_data['duration_seconds'] = duration.total_seconds()
-            log_data['end_timestamp'] = end_time.strftime('%d/%m/%Y às %H:%M:%S')
-            
-            # Salva no arquivo de log
-            save_to_log_file(log_data)
-            
-            # Exibe no console
-            print(f"\n{'='*60}")
-            print(f"✅ TRANSAÇÃO CONCLUÍDA: {transaction_type}")
-            print(f"📅 Data/Hora: {end_time.strftime('%d/%m/%Y às %H:%M:%S')}")
-            print(f"⏱️  Duração: {duration.total_seconds():.2f} segundos")
-            print(f"🎯 Status: {'Sucesso' if result else 'Falha'}")
-            print(f"{'='*60}\n")
-            
-            return result
-            
         except Exception as e:
-            # Registra o erro da transação
-            end_time = datetime.now()
-            duration = end_time - start_time
-            
-            # Atualiza dados do log com erro
-            log_data['return_value'] = None
-            log_data['status'] = 'Erro'
-            log_data['error_message'] = str(e)
-            log_data['duration_seconds'] = duration.total_seconds()
-            log_data['end_timestamp'] = end_time.strftime('%d/%m/%Y às %H:%M:%S')
-            
-            # Salva no arquivo de log
-            save_to_log_file(log_data)
+            # A política é consultada antes de montar o registro: erros são sempre registrados
+            if log_pipeline.should_log(transaction_instance, LEVEL_EXCEPTION):
+                log_data = _build_log_record(func, args, kwargs, transaction_instance, start_time)
+                
+                # Atualiza dados do log com erro
+                end_time = datetime.now()
+                log_data['return_value'] = None
+                log_data['status'] = 'Erro'
+                log_data['error_message'] = str(e)
+                log_data['duration_seconds'] = (end_time - start_time).total_seconds()
+                log_data['end_timestamp'] = _log_timestamp.format(end_time)
+                
+                # Entrega aos destinos do log
+                with transaction_stage(transaction_instance, STAGE_LOG):
+                    save_to_log_file(log_data)
             
-            # Exibe no console
-            print(f"\n{'='*60}")
-            print(f"❌ ERRO NA TRANSAÇÃO: {transaction_type}")
-            print(f"📅 Data/Hora: {end_time.strftime('%d/%m/%Y às %H:%M:%S')}")
-            print(f"⏱️  Duração: {duration.total_seconds():.2f} segundos")
-            print(f"🚨 Erro: {str(e)}")
-            print(f"{'='*60}\n")
+            if hooks_enabled:
+                for hook in tuple(_error_hooks):
+                    hook(transaction_instance, e, stage_timings)
             
             # Re-lança a exceção para manter o comportamento original
             raise
+        
+        # Transações descartadas pela política (ou sem destinos ativos) não montam o registro
+        level = LEVEL_SUCCESS if result else LEVEL_FAILURE
+        if log_pipeline.should_log(transaction_instance, level):
+            log_data = _build_log_record(func, args, kwargs, transaction_instance, start_time)
+            
+            # Atualiza dados do log com resultado (falhas de validação ficam registradas com o motivo)
+            end_time = datetime.now()
+            log_data['return_value'] = str(bool(result))
+            log_data['status'] = 'Sucesso' if result else 'Falha'
+            if not result and hasattr(result, 'reason'):
+                log_data['failure_reason'] = result.reason.value
+                log_data['error_message'] = result.message
+            log_data['duration_seconds'] = (end_time - start_time).total_seconds()
+            log_data['end_timestamp'] = _log_timestamp.format(end_time)
+            
+            # Entrega aos destinos do log
+            with transaction_stage(transaction_instance, STAGE_LOG):
+                save_to_log_file(log_data)
+        
+        if hooks_enabled:
+            for hook in tuple(_after_hooks):
+                hook(transaction_instance, result, stage_timings)
+        
+        return result
     
     return wrapper
 
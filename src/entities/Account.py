@@ -1,22 +1,34 @@
 from __future__ import annotations
 
-from abc import abstractmethod
-from datetime import datetime
+from datetime import datetime, timedelta
 from decimal import Decimal
-import time
 from typing import List, TYPE_CHECKING
 
-from src import round_decimal, clear_cmd_line
-from src.entities import AccountNumber, AgencyNumber
+from src.Utils import round_decimal
+from src.decorators import STAGE_BALANCE, STAGE_VALIDATION, transaction_stage
+from src.entities.AccountNumber import AccountNumber
+from src.entities.AgencyNumber import AgencyNumber
+from src.entities.AccountSummary import AccountSummary
+from src.entities.Deposit import Deposit
+from src.entities.Withdraw import Withdraw
+from src.entities.Transfer import Transfer
+from src.entities.TransactionHistory import TransactionHistory
+from src.entities.TransactionResult import TransactionError, TransactionReason, TransactionResult, TransactionStatus
+from src.idempotency import IdempotencyEntry, transaction_fingerprint
+from src.limits import DAILY_TRANSACTIONS, DEFAULT_LIMIT_ENGINE, AccountLimits, transaction_operation
 
 if TYPE_CHECKING:
-    from src.entities import Client, Transaction, Deposit, Withdraw, Transfer
+    from src.entities import Client, Transaction
+    from src.ledger import Ledger
 
-LIMIT_PER_WITHDRAWLS = Decimal('500.00')
-MAX_WITHDRAWLS = 3
-MAX_DAILY_TRANSACTIONS = 10
 DEFAULT_DECIMAL_PLACES = 2
-PROCESSING_WAITING_TIME_IN_SECONDS = 2
+
+# Mapeamento de tipos aceitos por iterate_transactions para as classes de transação
+TRANSACTION_TYPES = {
+    'deposit': Deposit,
+    'withdraw': Withdraw,
+    'transfer': Transfer
+}
 
 class Account:
     """
@@ -39,15 +51,17 @@ class Account:
         self._agency_number: AgencyNumber = None
         self._client: Client = None
         self._balance: Decimal = None
-        self._transactions: List[Transaction] = None
-        self._total_withdrawl: int = None
+        self._transactions: TransactionHistory = None
+        self._summary: AccountSummary = None
+        self._limits: AccountLimits = None
+        self._observers: list = []
 
         self.account_number = account_number
         self.agency_number = agency_number
         self.client = client
         self.balance = Decimal('0')
         self.transactions = []
-        self.total_withdrawl = 0
+        self.limits = DEFAULT_LIMIT_ENGINE.for_account()
 
     @property
     def account_number(self) -> AccountNumber:
@@ -57,6 +71,7 @@ class Account:
     @account_number.setter
     def account_number(self, account_number: AccountNumber):
         self._account_number = account_number
+        self.invalidate_rendering()
 
     @property
     def agency_number(self) -> AgencyNumber:
@@ -66,6 +81,7 @@ class Account:
     @agency_number.setter
     def agency_number(self, agency_number: AgencyNumber):
         self._agency_number = agency_number
+        self.invalidate_rendering()
 
     @property
     def client(self) -> Client:
@@ -74,7 +90,9 @@ class Account:
 
     @client.setter
     def client(self, client: Client):
-        self._client = client
+        if client is not self._client:
+            self._client = client
+            self.invalidate_rendering()
 
     @property
     def balance(self) -> Decimal:
@@ -86,31 +104,98 @@ class Account:
         self._balance = balance
 
     @property
-    def transactions(self) -> List[Transaction]:
-        """Retorna a lista de transações da conta."""
+    def transactions(self) -> TransactionHistory:
+        """Retorna o histórico de transações da conta (sequência indexada por tipo e data)."""
         return self._transactions
 
     @transactions.setter
     def transactions(self, transactions: List[Transaction]):
+        if not isinstance(transactions, TransactionHistory):
+            ledger = self._transactions.ledger if self._transactions is not None else None
+            transactions = TransactionHistory(transactions, ledger)
         self._transactions = transactions
+        self._summary = AccountSummary.from_transactions(self, transactions)
+        if self._limits is not None:
+            self.limits = self._limits.engine.for_account()
+
+    @property
+    def summary(self) -> AccountSummary:
+        """Retorna o resumo das movimentações (última transação, totais por tipo, transações do dia)."""
+        return self._summary
+
+    @property
+    def ledger(self) -> Ledger:
+        """Retorna o livro-razão onde as transações da conta são registradas."""
+        return self._transactions.ledger
+
+    @ledger.setter
+    def ledger(self, ledger: Ledger):
+        """
+        Passa a registrar as transações da conta em outro livro-razão (ex.: o do banco).
+
+        As transações já existentes são registradas no novo livro-razão, na
+        ordem do histórico.
+        """
+        if ledger is not self._transactions.ledger:
+            self._transactions = TransactionHistory(self._transactions, ledger)
 
     @property
-    def total_withdrawl(self) -> int:
-        """Retorna o total de saques realizados."""
-        return self._total_withdrawl
+    def limits(self) -> AccountLimits:
+        """Retorna os contadores de limite da conta (transações diárias, saques etc.)."""
+        return self._limits
+
+    @limits.setter
+    def limits(self, limits: AccountLimits):
+        """
+        Passa a usar outros contadores de limite (ex.: de um motor com outras políticas).
+
+        As transações recentes do histórico são contabilizadas nos novos
+        contadores, percorrendo apenas o período coberto pelas políticas.
+        """
+        since = datetime.fromtimestamp(limits.engine.clock() - limits.engine.lookback_seconds)
+        limits.record_transactions(self._transactions.iterate(None, since, None))
+        self._limits = limits
+
+    def invalidate_rendering(self):
+        """
+        Descarta as descrições memorizadas das transações da conta.
+
+        Chamado quando dados exibidos nas descrições (número, agência ou
+        dados do cliente) mudam; nas demais situações o cache é mantido.
+        """
+        if not self._transactions:
+            return
+        for transaction in self._transactions:
+            transaction.invalidate_render_cache()
+
+    def add_observer(self, observer):
+        """
+        Registra um observador das alterações da conta.
+
+        O observador deve implementar `balance_changed(account, previous_balance)`.
+
+        Args:
+            observer: Objeto notificado a cada alteração de saldo (ex.: índices do banco).
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
 
-    @total_withdrawl.setter
-    def total_withdrawl(self, total_withdrawl: int):
-        self._total_withdrawl = total_withdrawl
+    def remove_observer(self, observer):
+        """Remove um observador previamente registrado."""
+        if observer in self._observers:
+            self._observers.remove(observer)
 
     def add_transaction(self, transaction: Transaction):
         """
-        Adiciona uma transação à lista de transações da conta.
+        Adiciona uma transação ao histórico da conta (e ao livro-razão) e a
+        contabiliza nos limites e no resumo da conta.
 
         Args:
             transaction (Transaction): A transação a ser adicionada.
         """
         self.transactions.append(transaction)
+        self._summary.record(self, transaction)
+        self._limits.record(transaction_operation(transaction), transaction._timestamp)
 
     def get_daily_transactions_count(self, date: datetime = None) -> int:
         """
@@ -126,16 +211,10 @@ class Account:
             date = datetime.now()
         
         # Normaliza a data para comparar apenas dia/mês/ano
-        target_date = date.date()
+        start_of_day = datetime.combine(date.date(), datetime.min.time())
         
-        count = 0
-        for transaction in self.transactions:
-            if hasattr(transaction, '_timestamp') and transaction._timestamp:
-                transaction_date = transaction._timestamp.date()
-                if transaction_date == target_date:
-                    count += 1
-        
-        return count
+        # Busca binária no índice temporal do histórico
+        return self.transactions.count_between(start_of_day, start_of_day + timedelta(days=1))
 
     def can_perform_transaction_today(self) -> bool:
         """
@@ -144,8 +223,7 @@ class Account:
         Returns:
             bool: True se pode realizar transação, False se atingiu o limite diário.
         """
-        daily_count = self.get_daily_transactions_count()
-        return daily_count < MAX_DAILY_TRANSACTIONS
+        return self._limits.remaining(DAILY_TRANSACTIONS) > 0
 
     def get_remaining_daily_transactions(self) -> int:
         """
@@ -154,48 +232,37 @@ class Account:
         Returns:
             int: Número de transações que ainda podem ser realizadas hoje.
         """
-        daily_count = self.get_daily_transactions_count()
-        return max(0, MAX_DAILY_TRANSACTIONS - daily_count)
+        return self._limits.remaining(DAILY_TRANSACTIONS)
 
-    def iterate_transactions(self, transaction_type: str = None):
+    def iterate_transactions(self, transaction_type: str = None, since: datetime = None, until: datetime = None):
         """
-        Gerador que itera sobre as transações da conta com filtro opcional por tipo.
+        Gerador que itera sobre as transações da conta com filtros opcionais por tipo e período.
+
+        Os filtros usam os índices do histórico, percorrendo apenas as
+        transações selecionadas. Com período informado, as transações são
+        devolvidas em ordem cronológica.
         
         Args:
             transaction_type (str, optional): Tipo de transação para filtrar.
                 Valores aceitos: 'deposit', 'withdraw', 'transfer', None (todos)
+            since (datetime, optional): Início do período (inclusivo).
+            until (datetime, optional): Fim do período (exclusivo).
                 
         Yields:
-            Transaction: Transação da conta que atende ao filtro.
+            Transaction: Transação da conta que atende aos filtros.
         """
-        from src.entities import Deposit, Withdraw, Transfer
-        
-        # Mapeamento de tipos para classes
-        type_mapping = {
-            'deposit': Deposit,
-            'withdraw': Withdraw,
-            'transfer': Transfer
-        }
-        
-        # Se não foi especificado tipo, retorna todas as transações
-        if transaction_type is None:
-            for transaction in self.transactions:
-                yield transaction
-            return
-        
-        # Converte para lowercase para facilitar comparação
-        transaction_type = transaction_type.lower()
-        
-        # Verifica se o tipo é válido
-        if transaction_type not in type_mapping:
-            valid_types = list(type_mapping.keys()) + ['None']
-            raise ValueError(f"Tipo de transação inválido. Tipos válidos: {valid_types}")
+        target_class = None
+        if transaction_type is not None:
+            # Converte para lowercase para facilitar comparação
+            transaction_type = transaction_type.lower()
+            
+            # Verifica se o tipo é válido
+            if transaction_type not in TRANSACTION_TYPES:
+                valid_types = list(TRANSACTION_TYPES.keys()) + ['None']
+                raise ValueError(f"Tipo de transação inválido. Tipos válidos: {valid_types}")
+            target_class = TRANSACTION_TYPES[transaction_type]
         
-        # Filtra transações pelo tipo especificado
-        target_class = type_mapping[transaction_type]
-        for transaction in self.transactions:
-            if isinstance(transaction, target_class):
-                yield transaction
+        yield from self.transactions.iterate(target_class, since, until)
 
     def add_extract(self, message: str):
         """
@@ -219,18 +286,16 @@ class Account:
         if not self.transactions:
             return "Extrato Bancário:\n\n-- Nenhuma movimentação --"
         
-        extract_text = "Extrato Bancário:\n\n"
+        lines = ["Extrato Bancário:\n\n"]
         current_balance = Decimal('0')  # Começa com saldo zero
         
         for transaction in self.transactions:
             # Usa o timestamp da transação se disponível, senão usa o momento atual
-            if hasattr(transaction, '_timestamp') and transaction._timestamp:
-                date_string = transaction._timestamp.strftime("%d/%m/%Y às %H:%M:%S")
-            else:
+            date_string = transaction.formatted_timestamp
+            if date_string is None:
                 date_string = datetime.now().strftime("%d/%m/%Y às %H:%M:%S")
             
             # Calcula o saldo após esta transação
-            from src.entities import Deposit, Withdraw, Transfer
             if isinstance(transaction, Deposit):
                 current_balance += transaction.value
             elif isinstance(transaction, Withdraw):
@@ -249,12 +314,11 @@ class Account:
                 # Para depósitos e saques
                 description = str(transaction)
             
-            full_message = (f"{description} => Saldo após operação R$ "
-                            f"{round_decimal(current_balance, DEFAULT_DECIMAL_PLACES)}"
-                            f" - Realizado em {date_string}\n")
-            extract_text += full_message
+            lines.append(f"{description} => Saldo após operação R$ "
+                         f"{round_decimal(current_balance, DEFAULT_DECIMAL_PLACES)}"
+                         f" - Realizado em {date_string}\n")
         
-        return extract_text
+        return ''.join(lines)
 
     def generate_account_information_text(self) -> str:
         """
@@ -271,102 +335,169 @@ class Account:
 
     def add_balance(self, value: Decimal):
         """Adiciona um valor ao saldo da conta."""
-        self.balance += value
+        previous_balance = self.balance
+        self.balance = previous_balance + value
+        for observer in self._observers:
+            observer.balance_changed(self, previous_balance)
 
     def sub_balance(self, value: Decimal):
         """Subtrai um valor do saldo da conta."""
         self.add_balance(-value)
 
-    def add_total_withdrawl(self, total: int = 1):
-        """Incrementa o total de saques realizados."""
-        self.total_withdrawl += total
+    def _original_of(self, transaction: Transaction, idempotency_key: str) -> IdempotencyEntry:
+        """
+        Associa a chave de idempotência à transação e busca a operação original.
+
+        Args:
+            transaction (Transaction): Transação ainda não executada.
+            idempotency_key (str): Chave informada pelo chamador (None = sem verificação).
+
+        Raises:
+            ValueError: Se a chave já foi usada em uma operação diferente.
+
+        Returns:
+            IdempotencyEntry: Registro da transação idêntica já aplicada com a mesma chave, ou None.
+        """
+        if idempotency_key is None:
+            return None
+        transaction.idempotency_key = idempotency_key
+        return self.ledger.idempotency.check(idempotency_key, transaction_fingerprint(transaction))
+
+    @staticmethod
+    def _duplicate_result(original: IdempotencyEntry) -> TransactionResult:
+        """Resultado de uma repetição: o saldo e o momento da execução original (status DUPLICATE)."""
+        return TransactionResult(TransactionStatus.DUPLICATE, TransactionReason.OK, original.balance,
+                                 datetime.fromtimestamp(original.timestamp))
+
+    def reserve(self, transfer: Transfer, idempotency_key: str = None) -> TransactionResult:
+        """
+        Valida uma transferência que sai desta conta e debita (reserva) o valor.
+
+        É a etapa de origem de `Transfer.execute`; transferências entre shards
+        a usam na preparação e creditam o destino só na confirmação. O destino
+        não é alterado.
+
+        Args:
+            transfer (Transfer): Transferência com esta conta como origem, ainda não executada.
+            idempotency_key (str, optional): Identificação da requisição; uma repetição
+                com a mesma chave não reserva nada (status DUPLICATE, com o saldo e o
+                momento da execução original).
+
+        Returns:
+            TransactionResult: Resultado da reserva (verdadeiro se o valor foi debitado ou já havia sido).
+        """
+        try:
+            original = self._original_of(transfer, idempotency_key)
+        except ValueError as error:
+            return transfer._fail(TransactionReason.IDEMPOTENCY_CONFLICT, str(error))
+        if original is not None:
+            return self._duplicate_result(original)
+
+        with transaction_stage(transfer, STAGE_VALIDATION):
+            if transfer.value <= 0:
+                return transfer._fail(TransactionReason.INVALID_VALUE, "O valor é inválido para transferir")
+            elif transfer.value > self.balance:
+                return transfer._fail(TransactionReason.INSUFFICIENT_BALANCE,
+                                      f"Saldo insuficiente... Seu saldo atual é de R$ {round_decimal(self.balance, DEFAULT_DECIMAL_PLACES)}")
+            elif self == transfer.destination_account:
+                return transfer._fail(TransactionReason.SAME_ACCOUNT, "Não é possível transferir para a mesma conta")
+            failure = transfer._check_limits()
+            if failure is not None:
+                return failure
+
+        with transaction_stage(transfer, STAGE_BALANCE):
+            self.sub_balance(transfer.value)
+        return transfer._succeed()
+
+    def submit(self, transaction: Transaction, idempotency_key: str = None) -> TransactionResult:
+        """
+        Verifica idempotência, executa a transação (que verifica os limites) e a registra no histórico.
+
+        Não lança exceção nem escreve no console em caso de falha: o motivo
+        vem no resultado, o que torna falhas em lote baratas e legíveis por
+        programas.
 
-    def withdraw(self, value: Decimal) -> Decimal:
+        Args:
+            transaction (Transaction): Transação criada para esta conta e ainda não executada.
+            idempotency_key (str, optional): Identificação da requisição; uma repetição
+                com a mesma chave não é reaplicada (status DUPLICATE, com o saldo e o
+                momento da execução original).
+
+        Returns:
+            TransactionResult: Resultado estruturado da transação.
+        """
+        try:
+            original = self._original_of(transaction, idempotency_key)
+            if original is not None:
+                return self._duplicate_result(original)
+        except ValueError as error:
+            return transaction._fail(TransactionReason.IDEMPOTENCY_CONFLICT, str(error))
+
+        # Os limites da conta são verificados dentro de execute(), para que as recusas fiquem no log
+        result = transaction.execute()
+        if result:
+            self.add_transaction(transaction)
+        return result
+
+    def withdraw(self, value: Decimal, idempotency_key: str = None) -> Decimal:
         """
         Realiza um saque usando a classe Withdraw.
 
         Args:
             value (Decimal): Valor a ser sacado.
+            idempotency_key (str, optional): Identificação da requisição; uma repetição
+                com a mesma chave devolve o resultado original sem sacar novamente.
 
         Raises:
-            ValueError: Caso o valor seja inválido, saldo insuficiente, ultrapasse o limite de saque,
-                        o número máximo de saques permitido ou o limite diário de transações.
+            TransactionError: Caso o valor seja inválido, saldo insuficiente, ultrapasse o limite de saque,
+                              o número máximo de saques por dia, o limite diário de transações ou
+                              a chave de idempotência já tenha sido usada em outra operação.
 
         Returns:
             Decimal: Valor sacado, se bem-sucedido.
         """
-        # Verifica limite diário de transações
-        if not self.can_perform_transaction_today():
-            daily_count = self.get_daily_transactions_count()
-            raise ValueError(f"Limite diário de transações excedido! "
-                           f"Você já realizou {daily_count} transações hoje. "
-                           f"Limite máximo: {MAX_DAILY_TRANSACTIONS} transações por dia.")
-        
-        from src.entities import Withdraw
-        withdraw_transaction = Withdraw(self, value)
-        success = withdraw_transaction.execute()
-        if not success:
-            raise ValueError("Falha ao realizar saque")
-        
-        # Adiciona a transação à lista
-        self.add_transaction(withdraw_transaction)
+        result = self.submit(Withdraw(self, value), idempotency_key)
+        if not result:
+            raise TransactionError(result)
         return value
 
-    def deposit(self, value: Decimal):
+    def deposit(self, value: Decimal, idempotency_key: str = None):
         """
         Realiza um depósito na conta usando a classe Deposit.
 
         Args:
             value (Decimal): Valor a ser depositado.
+            idempotency_key (str, optional): Identificação da requisição; uma repetição
+                com a mesma chave é ignorada.
 
         Raises:
-            ValueError: Se o valor for menor ou igual a zero ou se o limite diário de transações for excedido.
-        """
-        # Verifica limite diário de transações
-        if not self.can_perform_transaction_today():
-            daily_count = self.get_daily_transactions_count()
-            raise ValueError(f"Limite diário de transações excedido! "
-                           f"Você já realizou {daily_count} transações hoje. "
-                           f"Limite máximo: {MAX_DAILY_TRANSACTIONS} transações por dia.")
-        
-        from src.entities import Deposit
-        deposit_transaction = Deposit(self, value)
-        success = deposit_transaction.execute()
-        if not success:
-            raise ValueError("Falha ao realizar depósito")
-        
-        # Adiciona a transação à lista
-        self.add_transaction(deposit_transaction)
+            TransactionError: Se o valor for menor ou igual a zero, se o limite diário de transações for
+                              excedido ou se a chave de idempotência já tiver sido usada em outra operação.
+        """
+        result = self.submit(Deposit(self, value), idempotency_key)
+        if not result:
+            raise TransactionError(result)
 
-    def transfer(self, value: Decimal, account_of_receipt: 'Account') -> bool:
+    def transfer(self, value: Decimal, account_of_receipt: 'Account', idempotency_key: str = None) -> bool:
         """
         Realiza uma transferência entre contas usando a classe Transfer.
 
         Args:
             value (Decimal): Valor a ser transferido.
             account_of_receipt (Account): Conta destino.
+            idempotency_key (str, optional): Identificação da requisição; uma repetição
+                com a mesma chave devolve o resultado original sem transferir novamente.
 
         Returns:
             bool: True se bem-sucedido.
 
         Raises:
-            ValueError: Em caso de valor inválido, saldo insuficiente, contas iguais ou limite diário excedido.
-        """
-        # Verifica limite diário de transações
-        if not self.can_perform_transaction_today():
-            daily_count = self.get_daily_transactions_count()
-            raise ValueError(f"Limite diário de transações excedido! "
-                           f"Você já realizou {daily_count} transações hoje. "
-                           f"Limite máximo: {MAX_DAILY_TRANSACTIONS} transações por dia.")
-        
-        from src.entities import Transfer
-        transfer_transaction = Transfer(self, account_of_receipt, value)
-        success = transfer_transaction.execute()
-        if not success:
-            raise ValueError("Falha ao realizar transferência")
-        
-        # Adiciona a transação à lista da conta de origem
-        self.add_transaction(transfer_transaction)
+            TransactionError: Em caso de valor inválido, saldo insuficiente, contas iguais, limite diário
+                              excedido ou chave de idempotência já usada em outra operação.
+        """
+        result = self.submit(Transfer(self, account_of_receipt, value), idempotency_key)
+        if not result:
+            raise TransactionError(result)
         return True
 
     def show_extract(self):
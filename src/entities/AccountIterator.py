@@ -1,82 +1,217 @@
 from __future__ import annotations
 
-from typing import Iterator, TYPE_CHECKING
+from typing import Callable, Dict, Iterator, List, Sequence, Tuple, TYPE_CHECKING
+
+from src.Utils import round_decimal
 
 if TYPE_CHECKING:
     from src.entities import Account
 
+DEFAULT_DECIMAL_PLACES = 2
+DEFAULT_PAGE_SIZE = 100
+LAST_TRANSACTION_FORMAT = '%d/%m/%Y %H:%M'
+CURSOR_PREFIX = 'acc1'
+
+# Campos disponíveis na listagem de contas e como calculá-los
+ACCOUNT_FIELDS: Dict[str, Callable[[Account], object]] = {
+    'account_number': lambda account: str(account.account_number),
+    'agency_number': lambda account: str(account.agency_number),
+    'balance': lambda account: account.balance,
+    'client_name': lambda account: account.client.name,
+    'client_cpf': lambda account: str(account.client.cpf),
+    'total_transactions': lambda account: len(account.transactions),
+    # Campos do resumo mantido pela conta (não percorrem o histórico)
+    'last_transaction_at': lambda account: account.summary.last_transaction_at,
+    'transactions_today': lambda account: account.summary.transactions_today,
+    'counts_by_type': lambda account: account.summary.counts_by_type(),
+    'totals_by_type': lambda account: account.summary.totals_by_type()
+}
+
+# Campos calculados quando nenhum é solicitado (os dados cadastrais e o saldo)
+DEFAULT_FIELDS = ('account_number', 'agency_number', 'balance', 'client_name', 'client_cpf', 'total_transactions')
+
 class AccountIterator:
     """
     Iterador personalizado para iterar sobre todas as contas do banco.
-    
+
     Permite iterar sobre as contas retornando informações básicas de cada uma,
-    incluindo número da conta, agência e saldo atual.
+    incluindo número da conta, agência e saldo atual, e o resumo das
+    movimentações (última transação, transações do dia, quantidade e total
+    por tipo), lido do resumo mantido por cada conta.
+
+    Recursos adicionais:
+        - Projeção: apenas os campos solicitados são calculados.
+        - Snapshot: o iterador enxerga somente as contas existentes na sua criação;
+          como as contas do banco só são acrescentadas ao final da lista, isso
+          não exige cópia.
+        - Paginação: next_page() devolve blocos de contas e `cursor` fornece um
+          token que permite retomar a listagem em outro iterador.
     """
-    
-    def __init__(self, accounts: list[Account]):
+
+    def __init__(self, accounts: list[Account], fields: Sequence[str] = None,
+                 page_size: int = DEFAULT_PAGE_SIZE, cursor: str = None):
         """
         Inicializa o iterador com a lista de contas.
-        
+
         Args:
             accounts (list[Account]): Lista de contas do banco.
+            fields (Sequence[str], optional): Campos a calcular (padrão: DEFAULT_FIELDS).
+            page_size (int): Número de contas por página em next_page().
+            cursor (str, optional): Token obtido de `cursor` para retomar uma listagem.
+
+        Raises:
+            ValueError: Se algum campo, o tamanho da página ou o cursor forem inválidos.
         """
+        if fields is None:
+            fields = DEFAULT_FIELDS
+        invalid_fields = [field for field in fields if field not in ACCOUNT_FIELDS]
+        if invalid_fields:
+            raise ValueError(f"Campos inválidos: {invalid_fields}. Campos válidos: {list(ACCOUNT_FIELDS)}")
+        if page_size < 1:
+            raise ValueError("O tamanho da página deve ser maior que zero")
+
         self._accounts = accounts
+        self._fields: Tuple[str, ...] = tuple(fields)
+        self._getters = tuple((field, ACCOUNT_FIELDS[field]) for field in self._fields)
+        self._page_size = page_size
         self._index = 0
-    
+        self._limit = len(accounts)
+
+        if cursor is not None:
+            self._index, self._limit = self.decode_cursor(cursor)
+            self._limit = min(self._limit, len(accounts))
+
+    @staticmethod
+    def decode_cursor(cursor: str) -> Tuple[int, int]:
+        """
+        Decodifica um token de cursor.
+
+        Args:
+            cursor (str): Token no formato produzido pela propriedade `cursor`.
+
+        Raises:
+            ValueError: Se o token for inválido.
+
+        Returns:
+            Tuple[int, int]: Posição atual e limite do snapshot.
+        """
+        try:
+            prefix, index, limit = cursor.split('.')
+            index, limit = int(index), int(limit)
+        except (AttributeError, ValueError):
+            raise ValueError("Cursor de listagem inválido")
+        if prefix != CURSOR_PREFIX or not 0 <= index <= limit:
+            raise ValueError("Cursor de listagem inválido")
+        return index, limit
+
+    @property
+    def fields(self) -> Tuple[str, ...]:
+        """Retorna os campos calculados para cada conta."""
+        return self._fields
+
+    @property
+    def cursor(self) -> str:
+        """
+        Retorna o token da posição atual, ou None se a listagem terminou.
+
+        O token guarda a posição e o tamanho do snapshot, de modo que a
+        listagem retomada continua enxergando o mesmo conjunto de contas.
+        """
+        if not self.has_next:
+            return None
+        return f"{CURSOR_PREFIX}.{self._index}.{self._limit}"
+
+    @property
+    def has_next(self) -> bool:
+        """Indica se ainda há contas a percorrer."""
+        return self._index < self._limit
+
     def __iter__(self) -> AccountIterator:
         """Retorna o próprio iterador."""
         return self
-    
+
+    def _project(self, account: Account) -> dict:
+        """Calcula apenas os campos solicitados para a conta."""
+        return {field: getter(account) for field, getter in self._getters}
+
     def __next__(self) -> dict:
         """
         Retorna a próxima conta com suas informações básicas.
-        
+
         Returns:
-            dict: Dicionário com informações da conta (número, agência, saldo, cliente).
-            
+            dict: Dicionário com informações da conta (número, agência, saldo, cliente),
+                restrito aos campos solicitados.
+
         Raises:
             StopIteration: Quando não há mais contas para iterar.
         """
-        if self._index >= len(self._accounts):
+        if self._index >= self._limit:
             raise StopIteration
-        
+
         account = self._accounts[self._index]
         self._index += 1
-        
-        # Retorna informações básicas da conta
-        return {
-            'account_number': str(account.account_number),
-            'agency_number': str(account.agency_number),
-            'balance': account.balance,
-            'client_name': account.client.name,
-            'client_cpf': str(account.client.cpf),
-            'total_transactions': len(account.transactions)
-        }
-    
+
+        return self._project(account)
+
+    def next_page(self) -> List[dict]:
+        """
+        Retorna a próxima página de contas.
+
+        Returns:
+            List[dict]: Até `page_size` contas; lista vazia ao final da listagem.
+        """
+        start = self._index
+        end = min(start + self._page_size, self._limit)
+        self._index = end
+        project = self._project
+        return [project(account) for account in self._accounts[start:end]]
+
+    def pages(self) -> Iterator[List[dict]]:
+        """
+        Gerador que percorre o restante da listagem página a página.
+
+        Yields:
+            List[dict]: Página com até `page_size` contas.
+        """
+        while self.has_next:
+            yield self.next_page()
+
     def __len__(self) -> int:
-        """Retorna o número total de contas."""
-        return len(self._accounts)
-    
+        """Retorna o número total de contas do snapshot."""
+        return self._limit
+
     def reset(self):
         """Reseta o índice do iterador para o início."""
         self._index = 0
-    
+
     def get_account_info_formatted(self, account_info: dict) -> str:
         """
         Formata as informações da conta para exibição.
-        
+
         Args:
-            account_info (dict): Informações da conta retornadas pelo iterador.
-            
+            account_info (dict): Informações da conta retornadas pelo iterador
+                (campos não projetados são omitidos).
+
         Returns:
             str: String formatada com as informações da conta.
         """
-        from src import round_decimal
-        DEFAULT_DECIMAL_PLACES = 2
-        
-        return (f"Conta: {account_info['account_number']} | "
-                f"Agência: {account_info['agency_number']} | "
-                f"Cliente: {account_info['client_name']} | "
-                f"CPF: {account_info['client_cpf']} | "
-                f"Saldo: R$ {round_decimal(account_info['balance'], DEFAULT_DECIMAL_PLACES)} | "
-                f"Transações: {account_info['total_transactions']}")
+        parts = []
+        if 'account_number' in account_info:
+            parts.append(f"Conta: {account_info['account_number']}")
+        if 'agency_number' in account_info:
+            parts.append(f"Agência: {account_info['agency_number']}")
+        if 'client_name' in account_info:
+            parts.append(f"Cliente: {account_info['client_name']}")
+        if 'client_cpf' in account_info:
+            parts.append(f"CPF: {account_info['client_cpf']}")
+        if 'balance' in account_info:
+            parts.append(f"Saldo: R$ {round_decimal(account_info['balance'], DEFAULT_DECIMAL_PLACES)}")
+        if 'total_transactions' in account_info:
+            parts.append(f"Transações: {account_info['total_transactions']}")
+        if 'transactions_today' in account_info:
+            parts.append(f"Hoje: {account_info['transactions_today']}")
+        if 'last_transaction_at' in account_info:
+            last_transaction_at = account_info['last_transaction_at']
+            last_text = last_transaction_at.strftime(LAST_TRANSACTION_FORMAT) if last_transaction_at else '-'
+            parts.append(f"Última: {last_text}")
+        return " | ".join(parts)
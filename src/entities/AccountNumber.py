@@ -20,6 +20,7 @@ class AccountNumber:
             ValueError: Se o número for inválido.
         """
         self._account_number: int = None
+        self._formatted: str = None
         self.account_number = account_number
 
     @property
@@ -30,7 +31,17 @@ class AccountNumber:
         Returns:
             str: Número da conta formatado (8 dígitos).
         """
-        return str(self._account_number).zfill(TOTAL_DIGITS_ACCOUNT_NUMBER)
+        return self._formatted
+
+    @property
+    def number(self) -> int:
+        """
+        Retorna o número da conta como inteiro.
+
+        Returns:
+            int: Número da conta, sem formatação.
+        """
+        return self._account_number
 
     @account_number.setter
     def account_number(self, account_number: str | int):
@@ -54,6 +65,8 @@ class AccountNumber:
             self._account_number = int(account_number)
         else:
             raise ValueError("É esperado que o número da conta seja inteiro ou string")
+        # O formato é recalculado apenas quando o número muda
+        self._formatted = str(self._account_number).zfill(TOTAL_DIGITS_ACCOUNT_NUMBER)
 
     def __str__(self) -> str:
         """
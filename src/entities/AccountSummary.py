@@ -0,0 +1,153 @@
+from __future__ import annotations
+
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, TYPE_CHECKING
+
+from src.entities.Deposit import Deposit
+from src.entities.Withdraw import Withdraw
+from src.entities.Transfer import Transfer
+
+if TYPE_CHECKING:
+    from src.entities import Account, Transaction
+
+# Tipos contabilizados no resumo (transferências separadas por sentido)
+SUMMARY_DEPOSIT = 'deposit'
+SUMMARY_WITHDRAW = 'withdraw'
+SUMMARY_TRANSFER_IN = 'transfer_in'
+SUMMARY_TRANSFER_OUT = 'transfer_out'
+SUMMARY_KINDS = (SUMMARY_DEPOSIT, SUMMARY_WITHDRAW, SUMMARY_TRANSFER_IN, SUMMARY_TRANSFER_OUT)
+
+SUMMARY_KIND_NAMES = {
+    SUMMARY_DEPOSIT: 'Depósitos',
+    SUMMARY_WITHDRAW: 'Saques',
+    SUMMARY_TRANSFER_IN: 'Transferências recebidas',
+    SUMMARY_TRANSFER_OUT: 'Transferências enviadas'
+}
+
+class AccountSummary:
+    """
+    Resumo das movimentações de uma conta, mantido a cada transação registrada.
+
+    Guarda a data da última transação, a quantidade e o total por tipo e a
+    quantidade de transações do dia mais recente. Cada registro custa O(1),
+    de modo que listagens e cabeçalhos de extrato não percorrem o histórico.
+
+    A contagem diária acompanha apenas o dia mais recente registrado:
+    transações de dias anteriores, registradas fora de ordem, entram nos
+    totais, mas não nessa contagem.
+    """
+
+    def __init__(self, today: Callable[[], date] = date.today):
+        """
+        Inicializa um resumo vazio.
+
+        Args:
+            today (Callable[[], date]): Fornece a data atual (substituível em testes).
+        """
+        self._today = today
+        self._counts: Dict[str, int] = dict.fromkeys(SUMMARY_KINDS, 0)
+        self._totals: Dict[str, Decimal] = dict.fromkeys(SUMMARY_KINDS, Decimal('0'))
+        self._last_transaction_at: datetime = None
+        self._day: date = None
+        self._day_count = 0
+
+    @classmethod
+    def from_transactions(cls, account: Account, transactions: Iterable[Transaction]) -> AccountSummary:
+        """
+        Monta o resumo a partir de um histórico existente.
+
+        Args:
+            account (Account): Conta dona do histórico.
+            transactions (Iterable[Transaction]): Transações, em ordem de registro.
+
+        Returns:
+            AccountSummary: Resumo do histórico.
+        """
+        summary = cls()
+        for transaction in transactions:
+            summary.record(account, transaction)
+        return summary
+
+    @staticmethod
+    def kind_of(account: Account, transaction: Transaction) -> str:
+        """
+        Classifica a transação do ponto de vista da conta.
+
+        Args:
+            account (Account): Conta que registra a transação.
+            transaction (Transaction): Transação registrada.
+
+        Returns:
+            str: Um dos SUMMARY_KINDS, ou None para tipos desconhecidos.
+        """
+        if isinstance(transaction, Transfer):
+            return SUMMARY_TRANSFER_OUT if transaction.account is account else SUMMARY_TRANSFER_IN
+        if isinstance(transaction, Deposit):
+            return SUMMARY_DEPOSIT
+        if isinstance(transaction, Withdraw):
+            return SUMMARY_WITHDRAW
+        return None
+
+    def record(self, account: Account, transaction: Transaction):
+        """
+        Contabiliza uma transação registrada no histórico da conta.
+
+        Args:
+            account (Account): Conta que registra a transação.
+            transaction (Transaction): Transação registrada.
+        """
+        kind = self.kind_of(account, transaction)
+        if kind is not None:
+            self._counts[kind] += 1
+            self._totals[kind] += transaction.value
+
+        timestamp = transaction._timestamp
+        if timestamp is None:
+            return
+        if self._last_transaction_at is None or timestamp > self._last_transaction_at:
+            self._last_transaction_at = timestamp
+        day = timestamp.date()
+        if day == self._day:
+            self._day_count += 1
+        elif self._day is None or day > self._day:
+            self._day = day
+            self._day_count = 1
+
+    @property
+    def last_transaction_at(self) -> datetime:
+        """Retorna a data/hora da transação mais recente (None se não houver)."""
+        return self._last_transaction_at
+
+    @property
+    def transaction_count(self) -> int:
+        """Retorna o total de transações contabilizadas."""
+        return sum(self._counts.values())
+
+    @property
+    def transactions_today(self) -> int:
+        """Retorna a quantidade de transações registradas hoje."""
+        return self._day_count if self._day == self._today() else 0
+
+    def count(self, kind: str) -> int:
+        """Retorna a quantidade de transações de um tipo (SUMMARY_KINDS)."""
+        return self._counts[kind]
+
+    def total(self, kind: str) -> Decimal:
+        """Retorna o valor total movimentado em um tipo (SUMMARY_KINDS)."""
+        return self._totals[kind]
+
+    def counts_by_type(self) -> Dict[str, int]:
+        """Retorna uma cópia das quantidades por tipo."""
+        return dict(self._counts)
+
+    def totals_by_type(self) -> Dict[str, Decimal]:
+        """Retorna uma cópia dos totais por tipo."""
+        return dict(self._totals)
+
+    @property
+    def net_flow(self) -> Decimal:
+        """Retorna as entradas menos as saídas (igual ao saldo, se a conta só movimenta pelo histórico)."""
+        totals = self._totals
+        return (totals[SUMMARY_DEPOSIT] + totals[SUMMARY_TRANSFER_IN]
+                - totals[SUMMARY_WITHDRAW] - totals[SUMMARY_TRANSFER_OUT])
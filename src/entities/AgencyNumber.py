@@ -20,6 +20,7 @@ class AgencyNumber:
             ValueError: Se o número não for válido ou exceder os limites definidos.
         """
         self._agency_number: int = None
+        self._formatted: str = None
         self.agency_number = agency_number
 
     @property
@@ -30,7 +31,7 @@ class AgencyNumber:
         Returns:
             str: Número da agência formatado com 4 dígitos.
         """
-        return str(self._agency_number).zfill(TOTAL_DIGITS_AGENCY_NUMBER)
+        return self._formatted
 
     @agency_number.setter
     def agency_number(self, agency_number: str | int):
@@ -54,6 +55,8 @@ class AgencyNumber:
             self._agency_number = int(agency_number)
         else:
             raise ValueError("É esperado que o número da agência seja inteiro ou string")
+        # O formato é recalculado apenas quando o número muda
+        self._formatted = str(self._agency_number).zfill(TOTAL_DIGITS_AGENCY_NUMBER)
 
     def __str__(self) -> str:
         """
@@ -19,6 +19,7 @@ class CPF:
             ValueError: Se o CPF for inválido.
         """
         self._cpf: str = None
+        self._formatted: str = None
         self.cpf = cpf
 
     def _clear_cpf(self, cpf: str) -> str:
@@ -50,17 +51,51 @@ class CPF:
         if cpf_raw == cpf_raw[0] * 11:
             return False
 
+        return cpf_raw[-2:] == self.calculate_check_digits(cpf_raw[:9])
+
+    @staticmethod
+    def calculate_check_digits(base: str) -> str:
+        """
+        Calcula os dois dígitos verificadores para os 9 primeiros dígitos de um CPF.
+
+        Args:
+            base (str): Os 9 primeiros dígitos do CPF (apenas números).
+
+        Returns:
+            str: Os dois dígitos verificadores.
+        """
         # Primeiro dígito verificador
-        total_sum = sum(int(num) * weight for num, weight in zip(cpf_raw[:9], range(10, 1, -1)))
+        total_sum = sum(int(num) * weight for num, weight in zip(base, range(10, 1, -1)))
         first_digit = (total_sum * 10) % 11
         first_digit = first_digit if first_digit < 10 else 0
 
         # Segundo dígito verificador
-        total_sum = sum(int(num) * weight for num, weight in zip(cpf_raw[:9] + str(first_digit), range(11, 1, -1)))
+        total_sum = sum(int(num) * weight for num, weight in zip(base + str(first_digit), range(11, 1, -1)))
         second_digit = (total_sum * 10) % 11
         second_digit = second_digit if second_digit < 10 else 0
 
-        return cpf_raw[-2:] == f"{first_digit}{second_digit}"
+        return f"{first_digit}{second_digit}"
+
+    @classmethod
+    def generate(cls, number: int) -> 'CPF':
+        """
+        Gera um CPF válido a partir de um número base de até 9 dígitos.
+
+        Útil para gerar massas de dados determinísticas (benchmarks e testes de carga).
+
+        Args:
+            number (int): Número base (0 a 999.999.999).
+
+        Raises:
+            ValueError: Se o número base estiver fora do intervalo ou gerar um CPF inválido.
+
+        Returns:
+            CPF: CPF válido composto pela base e seus dígitos verificadores.
+        """
+        if not 0 <= number < 10 ** 9:
+            raise ValueError("O número base do CPF deve ter no máximo 9 dígitos")
+        base = str(number).zfill(9)
+        return cls(base + cls.calculate_check_digits(base))
 
     @property
     def cpf(self) -> str:
@@ -70,7 +105,7 @@ class CPF:
         Returns:
             str: CPF no formato xxx.xxx.xxx-xx.
         """
-        return f"{self._cpf[:3]}.{self._cpf[3:6]}.{self._cpf[6:9]}-{self._cpf[9:]}"
+        return self._formatted
 
     @cpf.setter
     def cpf(self, cpf: str):
@@ -86,6 +121,8 @@ class CPF:
         if not self._is_valid(cpf):
             raise ValueError("O CPF informado não é válido")
         self._cpf = self._clear_cpf(cpf)
+        # O formato é recalculado apenas quando o CPF muda
+        self._formatted = f"{self._cpf[:3]}.{self._cpf[3:6]}.{self._cpf[6:9]}-{self._cpf[9:]}"
 
     def __str__(self) -> str:
         """
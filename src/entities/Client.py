@@ -3,7 +3,9 @@ from __future__ import annotations
 import re
 from typing import List, TYPE_CHECKING
 
-from src.entities import Address, CPF, DateOfBirth
+from src.entities.Address import Address
+from src.entities.CPF import CPF
+from src.entities.DateOfBirth import DateOfBirth
 
 if TYPE_CHECKING:
     from src.entities import Account
@@ -55,6 +57,7 @@ class Client:
         if re.search(r"^\s*$", name):
             raise ValueError("O nome precisa ser definido")
         self._name = name
+        self._invalidate_accounts_rendering()
 
     @property
     def cpf(self) -> CPF:
@@ -65,6 +68,7 @@ class Client:
     def cpf(self, cpf: CPF):
         """Define o CPF do cliente."""
         self._cpf = cpf
+        self._invalidate_accounts_rendering()
 
     @property
     def date_of_birth(self) -> DateOfBirth:
@@ -96,6 +100,11 @@ class Client:
         """Define a lista de contas do cliente."""
         self._accounts = accounts
 
+    def _invalidate_accounts_rendering(self):
+        """Descarta as descrições memorizadas que exibem o nome ou o CPF do cliente."""
+        for account in self._accounts:
+            account.invalidate_rendering()
+
     def add_account(self, account: Account):
         """
         Adiciona uma conta bancária à lista de contas do cliente.
@@ -16,6 +16,7 @@ class DateOfBirth:
             date_str (str): Data de nascimento no formato "dd/mm/yyyy".
         """
         self._date: datetime.datetime = None
+        self._formatted: str = None
         self.date = date_str
 
     @property
@@ -40,6 +41,7 @@ class DateOfBirth:
             ValueError: Se o formato da data for inválido.
         """
         self._date = datetime.datetime.strptime(date, "%d/%m/%Y")
+        self._formatted = datetime.datetime.strftime(self._date, "%d/%m/%Y")
 
     def __str__(self):
         """
@@ -48,4 +50,4 @@ class DateOfBirth:
         Returns:
             str: Representação formatada da data.
         """
-        return datetime.datetime.strftime(self.date, "%d/%m/%Y")
+        return self._formatted
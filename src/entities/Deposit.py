@@ -3,8 +3,9 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from src.entities import Transaction
-from src.decorators import transaction_logger
+from src.entities.Transaction import Transaction, RENDER_DEFAULT
+from src.entities.TransactionResult import TransactionReason, TransactionResult
+from src.decorators import transaction_logger, transaction_stage, STAGE_VALIDATION, STAGE_BALANCE
 
 if TYPE_CHECKING:
     from src.entities import Account
@@ -28,42 +29,25 @@ class Deposit(Transaction):
         super().__init__(account, value)
     
     @transaction_logger
-    def execute(self) -> bool:
+    def execute(self) -> TransactionResult:
         """
         Executa o depósito na conta.
         
         Returns:
-            bool: True se o depósito foi realizado com sucesso, False caso contrário.
+            TransactionResult: Resultado do depósito (verdadeiro se realizado).
         """
-        try:
+        with transaction_stage(self, STAGE_VALIDATION):
             if self.value <= 0:
-                raise ValueError("O valor é inválido para depósito")
-            
-            # Interface visual
-            operation_info = 'Processando o depósito... Aguarde um momento!'
-            print(operation_info, end='', flush=True)
-            
-            # Adiciona o valor ao saldo da conta
+                return self._fail(TransactionReason.INVALID_VALUE, "O valor é inválido para depósito")
+            failure = self._check_limits()
+            if failure is not None:
+                return failure
+        
+        # Adiciona o valor ao saldo da conta (a transação será registrada pela classe Account)
+        with transaction_stage(self, STAGE_BALANCE):
             self.account.add_balance(self.value)
-            
-            # Delay e limpeza de tela
-            import time
-            from src import clear_cmd_line
-            PROCESSING_WAITING_TIME_IN_SECONDS = 2
-            time.sleep(PROCESSING_WAITING_TIME_IN_SECONDS)
-            clear_cmd_line(len(operation_info))
-            print("O valor foi depositado com sucesso!")
-            
-            # A transação será registrada pela classe Account
-            from src import round_decimal
-            DEFAULT_DECIMAL_PLACES = 2
-            print(f"O seu saldo atual é de: R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao realizar depósito: {e}")
-            return False
+        
+        return self._succeed()
     
     def __str__(self) -> str:
         """
@@ -72,6 +56,4 @@ class Deposit(Transaction):
         Returns:
             str: Descrição do depósito.
         """
-        from src import round_decimal
-        DEFAULT_DECIMAL_PLACES = 2
-        return f"Depósito de R$ {round_decimal(self.value, DEFAULT_DECIMAL_PLACES)} na conta {self.account.account_number}"
+        return self._render(RENDER_DEFAULT, lambda: f"Depósito de R$ {self.formatted_value} na conta {self.account.account_number}")
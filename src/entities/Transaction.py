@@ -1,11 +1,25 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from decimal import Decimal
-from typing import TYPE_CHECKING
+from typing import Callable, Dict, TYPE_CHECKING
+
+from src.Utils import round_decimal
+from src.entities.TransactionResult import TransactionReason, TransactionResult, TransactionStatus
+from src.limits import transaction_operation
 
 if TYPE_CHECKING:
     from src.entities import Account
+    from src.ledger import Ledger
+
+DEFAULT_DECIMAL_PLACES = 2
+TIMESTAMP_FORMAT = "%d/%m/%Y às %H:%M:%S"
+
+# Chaves do cache de descrições: representação geral e pontos de vista das contas
+RENDER_DEFAULT = 'default'
+RENDER_SOURCE = 'source'
+RENDER_DESTINATION = 'destination'
 
 class Transaction(ABC):
     """
@@ -13,7 +27,12 @@ class Transaction(ABC):
     
     Define a interface comum para todas as transações (depósito, saque, etc.)
     que podem ser realizadas em uma conta bancária.
+
+    Atributos:
+        processing_waiting_time_in_seconds (float): Pausa visual exibida pelo apresentador
+            do console durante o processamento (pode ser zerada em benchmarks e testes de carga).
     """
+    processing_waiting_time_in_seconds: float = 2
     
     def __init__(self, account: Account, value: Decimal):
         """
@@ -25,6 +44,13 @@ class Transaction(ABC):
         """
         self._account: Account = account
         self._value: Decimal = value
+        self._timestamp: datetime = None
+        self._formatted_value: Decimal = None
+        self._formatted_timestamp: tuple = None
+        self._render_cache: Dict[str, str] = {}
+        self._ledger: Ledger = None
+        self._sequence: int = None
+        self._idempotency_key: str = None
     
     @property
     def account(self) -> Account:
@@ -35,14 +61,109 @@ class Transaction(ABC):
     def value(self) -> Decimal:
         """Retorna o valor da transação."""
         return self._value
+
+    @property
+    def sequence(self) -> int:
+        """Retorna o número de sequência no livro-razão (None se ainda não registrada)."""
+        return self._sequence
+
+    @property
+    def idempotency_key(self) -> str:
+        """Retorna a chave de idempotência informada na submissão (None se ausente)."""
+        return self._idempotency_key
+
+    @idempotency_key.setter
+    def idempotency_key(self, idempotency_key: str):
+        self._idempotency_key = idempotency_key
+
+    @property
+    def formatted_value(self) -> Decimal:
+        """Retorna o valor arredondado para exibição (calculado uma única vez)."""
+        if self._formatted_value is None:
+            self._formatted_value = round_decimal(self._value, DEFAULT_DECIMAL_PLACES)
+        return self._formatted_value
+
+    @property
+    def formatted_timestamp(self) -> str:
+        """
+        Retorna a data/hora da transação formatada para o extrato.
+
+        O texto é reaproveitado enquanto o timestamp não mudar.
+
+        Returns:
+            str: Data/hora no formato "dd/mm/aaaa às HH:MM:SS", ou None se a
+                transação ainda não foi executada.
+        """
+        timestamp = self._timestamp
+        if timestamp is None:
+            return None
+        cached = self._formatted_timestamp
+        if cached is None or cached[0] is not timestamp:
+            cached = self._formatted_timestamp = (timestamp, timestamp.strftime(TIMESTAMP_FORMAT))
+        return cached[1]
+
+    def _render(self, key: str, builder: Callable[[], str]) -> str:
+        """
+        Retorna a descrição memorizada para a chave, construindo-a na primeira vez.
+
+        Args:
+            key (str): Ponto de vista da descrição (ex.: RENDER_DEFAULT).
+            builder (Callable[[], str]): Função que monta o texto.
+
+        Returns:
+            str: Descrição da transação.
+        """
+        text = self._render_cache.get(key)
+        if text is None:
+            text = self._render_cache[key] = builder()
+        return text
+
+    def invalidate_render_cache(self):
+        """
+        Descarta as descrições memorizadas.
+
+        Deve ser chamado quando dados exibidos na descrição (número da conta,
+        agência, nome ou CPF do cliente) são alterados.
+        """
+        self._render_cache.clear()
+
+    def _result(self, status: TransactionStatus, reason: TransactionReason = TransactionReason.OK,
+                message: str = None) -> TransactionResult:
+        """Monta o resultado da transação com o saldo atual da conta de origem."""
+        return TransactionResult(status, reason, self._account.balance,
+                                 self._timestamp or datetime.now(), message)
+
+    def _succeed(self) -> TransactionResult:
+        """Resultado de uma execução bem-sucedida."""
+        return self._result(TransactionStatus.SUCCESS)
+
+    def _fail(self, reason: TransactionReason, message: str) -> TransactionResult:
+        """Resultado de uma execução recusada, sem alteração de saldo."""
+        return self._result(TransactionStatus.FAILED, reason, message)
+
+    def _check_limits(self) -> TransactionResult:
+        """
+        Verifica os limites da conta de origem (transações diárias, saques, valor).
+
+        Chamado dentro de `execute`, depois das validações da transação, para
+        que as recusas por limite passem pelo log como as demais falhas.
+
+        Returns:
+            TransactionResult: Falha com o motivo LIMIT_EXCEEDED, ou None se a operação cabe nos limites.
+        """
+        try:
+            self._account.limits.check(transaction_operation(self), self._value)
+        except ValueError as error:
+            return self._fail(TransactionReason.LIMIT_EXCEEDED, str(error))
+        return None
     
     @abstractmethod
-    def execute(self) -> bool:
+    def execute(self) -> TransactionResult:
         """
-        Executa a transação na conta.
+        Executa a transação na conta, sem escrever no console.
         
         Returns:
-            bool: True se a transação foi executada com sucesso, False caso contrário.
+            TransactionResult: Resultado estruturado (verdadeiro se a transação foi aplicada).
         """
         pass
     
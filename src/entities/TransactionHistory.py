@@ -0,0 +1,186 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import Sequence
+from datetime import datetime
+from heapq import merge
+from typing import Dict, Iterable, Iterator, List, Tuple, TYPE_CHECKING
+
+from src.ledger import Ledger
+
+if TYPE_CHECKING:
+    from src.entities import Transaction
+
+class TransactionHistory(Sequence):
+    """
+    Histórico de transações de uma conta com índices por tipo e por data/hora.
+
+    Comporta-se como uma lista somente de acréscimo (mantém a ordem de registro,
+    usada pelo extrato). As transações ficam no livro-razão (Ledger) do banco;
+    o histórico guarda apenas os números de sequência, em um `array`. A cada
+    `append` também são mantidos:
+        - posições das transações de cada tipo (classe concreta);
+        - um índice temporal por tipo, com os timestamps ordenados e as posições
+          correspondentes, consultado com `bisect`.
+
+    Assim, filtros por tipo e por período percorrem apenas as transações
+    selecionadas (O(log n + k)). Transações sem timestamp aparecem nos filtros
+    por tipo, mas não nas consultas por período.
+    """
+
+    def __init__(self, transactions: Iterable[Transaction] = (), ledger: Ledger = None):
+        """
+        Inicializa o histórico.
+
+        Args:
+            transactions (Iterable[Transaction], optional): Transações iniciais, em ordem de registro.
+            ledger (Ledger, optional): Livro-razão onde as transações são registradas
+                (padrão: um livro-razão próprio, para contas fora de um banco).
+        """
+        self._ledger = ledger if ledger is not None else Ledger()
+        self._sequences = array('q')
+        self._type_positions: Dict[type, List[int]] = {}
+        # Por tipo: (timestamps ordenados, posições correspondentes)
+        self._time_index: Dict[type, Tuple[List[datetime], List[int]]] = {}
+        self._all_timestamps: List[datetime] = []
+        for transaction in transactions:
+            self.append(transaction)
+
+    @property
+    def ledger(self) -> Ledger:
+        """Retorna o livro-razão onde as transações estão registradas."""
+        return self._ledger
+
+    @property
+    def sequences(self) -> array:
+        """Retorna os números de sequência das transações, na ordem de registro."""
+        return self._sequences
+
+    def __len__(self) -> int:
+        """Retorna o número de transações."""
+        return len(self._sequences)
+
+    def __getitem__(self, index):
+        """Retorna a transação (ou lista de transações, para fatias) na posição informada."""
+        if isinstance(index, slice):
+            return list(map(self._ledger.get, self._sequences[index]))
+        return self._ledger.get(self._sequences[index])
+
+    def __iter__(self) -> Iterator[Transaction]:
+        """Percorre as transações na ordem de registro."""
+        return map(self._ledger.get, self._sequences)
+
+    def __eq__(self, other) -> bool:
+        """Compara com outro histórico ou com uma lista pela sequência de transações."""
+        if isinstance(other, (TransactionHistory, list)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"TransactionHistory({list(self)!r})"
+
+    def append(self, transaction: Transaction):
+        """
+        Registra uma transação ao final do histórico e atualiza os índices.
+
+        Transações registradas fora de ordem cronológica são inseridas na
+        posição correta do índice temporal.
+
+        Args:
+            transaction (Transaction): Transação a registrar.
+        """
+        position = len(self._sequences)
+        self._sequences.append(self._ledger.append(transaction))
+        transaction_class = type(transaction)
+        self._type_positions.setdefault(transaction_class, []).append(position)
+
+        timestamp = transaction._timestamp
+        if timestamp is None:
+            return
+        timestamps, positions = self._time_index.setdefault(transaction_class, ([], []))
+        self._insert_ordered(timestamps, positions, timestamp, position)
+        all_timestamps = self._all_timestamps
+        if not all_timestamps or all_timestamps[-1] <= timestamp:
+            all_timestamps.append(timestamp)
+        else:
+            all_timestamps.insert(bisect_right(all_timestamps, timestamp), timestamp)
+
+    @staticmethod
+    def _insert_ordered(timestamps: List[datetime], positions: List[int], timestamp: datetime, position: int):
+        """Insere o par (timestamp, posição) mantendo a ordem; acréscimos em ordem custam O(1)."""
+        if not timestamps or timestamps[-1] <= timestamp:
+            timestamps.append(timestamp)
+            positions.append(position)
+        else:
+            index = bisect_right(timestamps, timestamp)
+            timestamps.insert(index, timestamp)
+            positions.insert(index, position)
+
+    def _classes_for(self, transaction_class: type = None) -> List[type]:
+        """Retorna as classes registradas compatíveis com o filtro (subclasses incluídas)."""
+        if transaction_class is None:
+            return list(self._type_positions)
+        return [registered for registered in self._type_positions if issubclass(registered, transaction_class)]
+
+    @staticmethod
+    def _bounds(timestamps: List[datetime], since: datetime, until: datetime) -> Tuple[int, int]:
+        """Localiza a faixa [since, until) em uma lista de timestamps ordenada."""
+        start = 0 if since is None else bisect_left(timestamps, since)
+        end = len(timestamps) if until is None else bisect_left(timestamps, until)
+        return start, max(start, end)
+
+    def iterate(self, transaction_class: type = None, since: datetime = None,
+                until: datetime = None) -> Iterator[Transaction]:
+        """
+        Percorre as transações filtradas por tipo e/ou período.
+
+        Sem período, as transações são devolvidas na ordem de registro; com
+        período, em ordem cronológica (iguais quando o registro é cronológico).
+
+        Args:
+            transaction_class (type, optional): Classe da transação (None = todas).
+            since (datetime, optional): Início do período (inclusivo).
+            until (datetime, optional): Fim do período (exclusivo).
+
+        Yields:
+            Transaction: Transações selecionadas.
+        """
+        get = self._ledger.get
+        sequences = self._sequences
+        if since is None and until is None:
+            if transaction_class is None:
+                yield from map(get, sequences)
+                return
+            position_lists = [self._type_positions[registered] for registered in self._classes_for(transaction_class)]
+            positions = position_lists[0] if len(position_lists) == 1 else merge(*position_lists)
+            for position in positions:
+                yield get(sequences[position])
+            return
+
+        ranges = []
+        for registered in self._classes_for(transaction_class):
+            index = self._time_index.get(registered)
+            if index is None:
+                continue
+            timestamps, positions = index
+            start, end = self._bounds(timestamps, since, until)
+            if start < end:
+                ranges.append(zip(timestamps[start:end], positions[start:end]))
+        selected = ranges[0] if len(ranges) == 1 else merge(*ranges)
+        for _, position in selected:
+            yield get(sequences[position])
+
+    def count_between(self, since: datetime = None, until: datetime = None) -> int:
+        """
+        Conta as transações com timestamp no período [since, until) em O(log n).
+
+        Args:
+            since (datetime, optional): Início do período (inclusivo).
+            until (datetime, optional): Fim do período (exclusivo).
+
+        Returns:
+            int: Quantidade de transações no período.
+        """
+        start, end = self._bounds(self._all_timestamps, since, until)
+        return end - start
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from enum import Enum
+from typing import NamedTuple
+
+class TransactionStatus(str, Enum):
+    """Situação final de uma transação."""
+    SUCCESS = 'success'
+    FAILED = 'failed'
+    DUPLICATE = 'duplicate'
+
+class TransactionReason(str, Enum):
+    """Motivo da falha de uma transação (OK quando bem-sucedida)."""
+    OK = 'ok'
+    INVALID_VALUE = 'invalid_value'
+    INSUFFICIENT_BALANCE = 'insufficient_balance'
+    SAME_ACCOUNT = 'same_account'
+    LIMIT_EXCEEDED = 'limit_exceeded'
+    IDEMPOTENCY_CONFLICT = 'idempotency_conflict'
+
+class TransactionResult(NamedTuple):
+    """
+    Resultado estruturado da execução de uma transação.
+
+    É verdadeiro em contexto booleano quando a transação foi (ou já havia
+    sido) aplicada, mantendo a compatibilidade com o antigo retorno bool.
+
+    Atributos:
+        status (TransactionStatus): Situação final.
+        reason (TransactionReason): Motivo da falha (OK em caso de sucesso).
+        balance (Decimal): Saldo da conta de origem após a tentativa.
+        timestamp (datetime): Momento da execução.
+        message (str): Descrição legível da falha (None em caso de sucesso).
+    """
+    status: TransactionStatus
+    reason: TransactionReason
+    balance: Decimal
+    timestamp: datetime
+    message: str = None
+
+    def __bool__(self) -> bool:
+        """Indica se a transação foi aplicada."""
+        return self.status is not TransactionStatus.FAILED
+
+    @property
+    def succeeded(self) -> bool:
+        """Indica se a transação foi aplicada (equivalente a bool(result))."""
+        return self.status is not TransactionStatus.FAILED
+
+class TransactionError(ValueError):
+    """
+    Erro lançado pelas operações da conta quando a transação falha.
+
+    Herda de ValueError para manter a compatibilidade com quem já tratava
+    as falhas dessa forma; o resultado completo fica em `result`.
+    """
+
+    def __init__(self, result: TransactionResult):
+        """
+        Inicializa o erro a partir do resultado da transação.
+
+        Args:
+            result (TransactionResult): Resultado com o motivo da falha.
+        """
+        super().__init__(result.message)
+        self.result = result
+
+    @property
+    def reason(self) -> TransactionReason:
+        """Retorna o motivo da falha."""
+        return self.result.reason
@@ -3,8 +3,9 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from src.entities import Transaction
-from src.decorators import transaction_logger
+from src.entities.Transaction import Transaction, RENDER_DEFAULT, RENDER_SOURCE, RENDER_DESTINATION
+from src.entities.TransactionResult import TransactionResult
+from src.decorators import transaction_logger, transaction_stage, STAGE_BALANCE
 
 if TYPE_CHECKING:
     from src.entities import Account
@@ -35,52 +36,40 @@ class Transfer(Transaction):
         return self._destination_account
     
     @transaction_logger
-    def execute(self) -> bool:
+    def execute(self) -> TransactionResult:
         """
         Executa a transferência entre as contas.
+
+        A validação e o débito na origem ficam em `Account.reserve`.
         
         Returns:
-            bool: True se a transferência foi realizada com sucesso, False caso contrário.
+            TransactionResult: Resultado da transferência (verdadeiro se realizada).
         """
-        try:
-            from src import round_decimal, clear_cmd_line
-            DEFAULT_DECIMAL_PLACES = 2
-            PROCESSING_WAITING_TIME_IN_SECONDS = 2
-            
-            # Validações específicas para transferência
-            if self.value <= 0:
-                raise ValueError("O valor é inválido para transferir")
-            elif self.value > self.account.balance:
-                raise ValueError(f"Saldo insuficiente... Seu saldo atual é de R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
-            elif self.account == self.destination_account:
-                raise ValueError("Não é possível transferir para a mesma conta")
-            
-            # Interface visual
-            operation_info = 'Processando a transferência... Aguarde um momento!'
-            print(operation_info, end='', flush=True)
-            
-            # Executa a transferência
-            self.account.sub_balance(self.value)
+        result = self.account.reserve(self)
+        if not result:
+            return result
+        
+        with transaction_stage(self, STAGE_BALANCE):
             self.destination_account.add_balance(self.value)
             
-            # Delay e limpeza de tela
-            import time
-            time.sleep(PROCESSING_WAITING_TIME_IN_SECONDS)
-            clear_cmd_line(len(operation_info))
-            print("Transferência realizada com sucesso!")
-            
-            # As transações serão registradas pelas classes Account
-            # A transação de origem será registrada quando o método transfer() da Account for chamado
-            # A transação de destino será registrada aqui
+            # A transação de origem será registrada quando o método transfer() da Account for chamado;
+            # a de destino é registrada aqui
             self.destination_account.add_transaction(self)
-            
-            print(f"O seu saldo atual é de: R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao realizar transferência: {e}")
-            return False
+        
+        return result
+    
+    @transaction_logger
+    def complete(self) -> TransactionResult:
+        """
+        Conclui uma transferência cujo valor já foi reservado com `Account.reserve`.
+
+        Usado quando o destino é creditado em outro lugar (ex.: transferências
+        entre shards, na confirmação), para que a conclusão passe pelo log.
+        
+        Returns:
+            TransactionResult: Resultado da transferência (sempre bem-sucedido).
+        """
+        return self._succeed()
     
     def __str__(self) -> str:
         """
@@ -89,9 +78,7 @@ class Transfer(Transaction):
         Returns:
             str: Descrição da transferência.
         """
-        from src import round_decimal
-        DEFAULT_DECIMAL_PLACES = 2
-        return f"Transferência de R$ {round_decimal(self.value, DEFAULT_DECIMAL_PLACES)} da conta {self.account.account_number} para {self.destination_account.account_number}"
+        return self._render(RENDER_DEFAULT, lambda: f"Transferência de R$ {self.formatted_value} da conta {self.account.account_number} para {self.destination_account.account_number}")
     
     def get_description_for_account(self, account: Account) -> str:
         """
@@ -103,14 +90,13 @@ class Transfer(Transaction):
         Returns:
             str: Descrição da transferência do ponto de vista da conta especificada.
         """
-        from src import round_decimal
-        DEFAULT_DECIMAL_PLACES = 2
-        
-        if account == self.account:
+        if account is self.account or account == self.account:
             # Conta de origem
-            return f"Você transferiu R$ {round_decimal(self.value, DEFAULT_DECIMAL_PLACES)} para {self.destination_account.client.name} (CPF: {self.destination_account.client.cpf} / Conta: {self.destination_account.account_number} / Agência: {self.destination_account.agency_number})"
-        elif account == self.destination_account:
+            destination = self.destination_account
+            return self._render(RENDER_SOURCE, lambda: f"Você transferiu R$ {self.formatted_value} para {destination.client.name} (CPF: {destination.client.cpf} / Conta: {destination.account_number} / Agência: {destination.agency_number})")
+        elif account is self.destination_account or account == self.destination_account:
             # Conta de destino
-            return f"Você recebeu R$ {round_decimal(self.value, DEFAULT_DECIMAL_PLACES)} de {self.account.client.name} (CPF: {self.account.client.cpf} / Conta: {self.account.account_number} / Agência: {self.account.agency_number})"
+            source = self.account
+            return self._render(RENDER_DESTINATION, lambda: f"Você recebeu R$ {self.formatted_value} de {source.client.name} (CPF: {source.client.cpf} / Conta: {source.account_number} / Agência: {source.agency_number})")
         else:
             return str(self)
@@ -3,12 +3,16 @@ from __future__ import annotations
 from decimal import Decimal
 from typing import TYPE_CHECKING
 
-from src.entities import Transaction
-from src.decorators import transaction_logger
+from src.Utils import round_decimal
+from src.entities.Transaction import Transaction, RENDER_DEFAULT
+from src.entities.TransactionResult import TransactionReason, TransactionResult
+from src.decorators import transaction_logger, transaction_stage, STAGE_VALIDATION, STAGE_BALANCE
 
 if TYPE_CHECKING:
     from src.entities import Account
 
+DEFAULT_DECIMAL_PLACES = 2
+
 class Withdraw(Transaction):
     """
     Representa uma transação de saque em uma conta bancária.
@@ -28,55 +32,32 @@ class Withdraw(Transaction):
         super().__init__(account, value)
     
     @transaction_logger
-    def execute(self) -> bool:
+    def execute(self) -> TransactionResult:
         """
         Executa o saque na conta.
+
+        Depois do valor e do saldo, verifica os limites da conta (transações
+        diárias, quantidade e valor dos saques).
         
         Returns:
-            bool: True se o saque foi realizado com sucesso, False caso contrário.
+            TransactionResult: Resultado do saque (verdadeiro se realizado).
         """
-        try:
-            from src import round_decimal
-            DEFAULT_DECIMAL_PLACES = 2
-            LIMIT_PER_WITHDRAWLS = Decimal('500.00')
-            MAX_WITHDRAWLS = 3
-            
-            # Validações específicas para saque
+        # Validações específicas para saque
+        with transaction_stage(self, STAGE_VALIDATION):
             if self.value <= 0:
-                raise ValueError("O valor é inválido para saque")
+                return self._fail(TransactionReason.INVALID_VALUE, "O valor é inválido para saque")
             elif self.value > self.account.balance:
-                raise ValueError(f"Saldo insuficiente... Seu saldo atual é de R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
-            elif self.value > LIMIT_PER_WITHDRAWLS:
-                raise ValueError(f"O valor do saque excede o limite de R$ {round_decimal(LIMIT_PER_WITHDRAWLS, DEFAULT_DECIMAL_PLACES)}")
-            elif self.account.total_withdrawl >= MAX_WITHDRAWLS:
-                raise ValueError(f"O total de saque excedeu o limite de {MAX_WITHDRAWLS} saques")
-            
-            # Interface visual
-            operation_info = 'Processando o saque... Aguarde um momento!'
-            print(operation_info, end='', flush=True)
-            
-            # Subtrai o valor do saldo da conta
+                return self._fail(TransactionReason.INSUFFICIENT_BALANCE,
+                                  f"Saldo insuficiente... Seu saldo atual é de R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
+            failure = self._check_limits()
+            if failure is not None:
+                return failure
+        
+        with transaction_stage(self, STAGE_BALANCE):
+            # Subtrai o valor do saldo da conta (a transação será registrada pela classe Account)
             self.account.sub_balance(self.value)
-            
-            # Incrementa o contador de saques
-            self.account.add_total_withdrawl()
-            
-            # Delay e limpeza de tela
-            import time
-            from src import clear_cmd_line
-            PROCESSING_WAITING_TIME_IN_SECONDS = 2
-            time.sleep(PROCESSING_WAITING_TIME_IN_SECONDS)
-            clear_cmd_line(len(operation_info))
-            print("Saque realizado com sucesso!")
-            
-            # A transação será registrada pela classe Account
-            print(f"O seu saldo atual é de: R$ {round_decimal(self.account.balance, DEFAULT_DECIMAL_PLACES)}")
-            
-            return True
-            
-        except Exception as e:
-            print(f"Erro ao realizar saque: {e}")
-            return False
+        
+        return self._succeed()
     
     def __str__(self) -> str:
         """
@@ -85,6 +66,4 @@ class Withdraw(Transaction):
         Returns:
             str: Descrição do saque.
         """
-        from src import round_decimal
-        DEFAULT_DECIMAL_PLACES = 2
-        return f"Saque de R$ {round_decimal(self.value, DEFAULT_DECIMAL_PLACES)} da conta {self.account.account_number}"
+        return self._render(RENDER_DEFAULT, lambda: f"Saque de R$ {self.formatted_value} da conta {self.account.account_number}")
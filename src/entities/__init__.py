@@ -1,17 +1,23 @@
 # Arquivo __init__.py para permitir importações simplificadas
 
-# Importando todas as classes para permitir importação simplificada
-from .Account import Account
+# Importando todas as classes para permitir importação simplificada.
+# A ordem segue as dependências: objetos de valor, transações e, por fim,
+# as classes que dependem delas. Os módulos importam uns aos outros pelos
+# submódulos (ex.: src.entities.Transaction), sem passar por este pacote.
 from .AccountNumber import AccountNumber
-from .Address import Address
 from .AgencyNumber import AgencyNumber
-from .Client import Client
+from .Address import Address
 from .CPF import CPF
 from .DateOfBirth import DateOfBirth
+from .TransactionResult import TransactionError, TransactionReason, TransactionResult, TransactionStatus
 from .Transaction import Transaction
 from .Deposit import Deposit
 from .Withdraw import Withdraw
 from .Transfer import Transfer
+from .TransactionHistory import TransactionHistory
+from .AccountSummary import AccountSummary
+from .Account import Account
+from .Client import Client
 from .AccountIterator import AccountIterator
 
 __all__ = [
@@ -23,8 +29,14 @@ __all__ = [
     'CPF',
     'DateOfBirth',
     'Transaction',
+    'TransactionError',
+    'TransactionReason',
+    'TransactionResult',
+    'TransactionStatus',
     'Deposit',
     'Withdraw',
     'Transfer',
+    'TransactionHistory',
+    'AccountSummary',
     'AccountIterator'
 ]
@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from collections import OrderedDict
+from decimal import Decimal
+from typing import Callable, NamedTuple, Tuple
+import json
+import os
+import time
+
+DEFAULT_MAX_ENTRIES = 100_000
+DEFAULT_TTL_SECONDS = 24 * 60 * 60
+
+class IdempotencyEntry(NamedTuple):
+    """
+    Registro de uma operação já aplicada.
+
+    Atributos:
+        expires_at (float): Momento (segundos desde a época) a partir do qual a chave é esquecida.
+        fingerprint (Tuple[str, ...]): Identificação da operação (tipo, conta, valor, destino).
+        sequence (int): Sequência da transação no livro-razão.
+        balance (Decimal): Saldo da conta de origem logo após a operação original.
+        timestamp (float): Momento (segundos desde a época) da operação original.
+    """
+    expires_at: float
+    fingerprint: Tuple[str, ...]
+    sequence: int
+    balance: Decimal
+    timestamp: float
+
+    def to_json(self, key: str) -> str:
+        """Serializa a entrada (com a sua chave) em uma linha JSON."""
+        return json.dumps([key, self.expires_at, list(self.fingerprint), self.sequence,
+                           str(self.balance), self.timestamp], ensure_ascii=False)
+
+    @classmethod
+    def from_json(cls, line: str) -> Tuple[str, IdempotencyEntry]:
+        """Lê uma linha gravada por `to_json`, devolvendo (chave, entrada)."""
+        key, expires_at, fingerprint, sequence, balance, timestamp = json.loads(line)
+        return key, cls(expires_at, tuple(fingerprint), sequence, Decimal(balance), timestamp)
+
+class IdempotencyCache:
+    """
+    Cache limitado de chaves de idempotência com expiração por tempo.
+
+    As entradas ficam em um OrderedDict na ordem de registro; como o prazo de
+    validade é o mesmo para todas, as mais antigas são também as primeiras a
+    expirar, e a limpeza remove entradas apenas do início (O(1) amortizado).
+    A consulta por chave é O(1).
+
+    Com `attach_file`, cada chave registrada é acrescentada a um arquivo
+    (uma linha JSON por chave), de modo que as chaves sobrevivem a um
+    reinício; ao reabrir, o arquivo é carregado e compactado.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.time):
+        """
+        Inicializa o cache.
+
+        Args:
+            max_entries (int): Número máximo de chaves guardadas (as mais antigas são descartadas).
+            ttl_seconds (float): Tempo, em segundos, durante o qual uma chave é lembrada.
+            clock (Callable[[], float]): Relógio em segundos desde a época (substituível em testes).
+
+        Raises:
+            ValueError: Se o limite ou o prazo forem inválidos.
+        """
+        if max_entries < 1:
+            raise ValueError("O número máximo de chaves deve ser maior que zero")
+        if ttl_seconds <= 0:
+            raise ValueError("O prazo de validade deve ser maior que zero")
+        self._max_entries = max_entries
+        self._ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, IdempotencyEntry] = OrderedDict()
+        self._journal = None
+
+    def __len__(self) -> int:
+        """Retorna o número de chaves guardadas (incluindo as ainda não removidas após expirar)."""
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        """Indica se a chave é conhecida e ainda válida."""
+        return self.get(key) is not None
+
+    def _evict(self, now: float):
+        """Remove as entradas expiradas e as excedentes, a partir das mais antigas."""
+        entries = self._entries
+        while entries:
+            key, entry = next(iter(entries.items()))
+            if entry.expires_at > now and len(entries) <= self._max_entries:
+                break
+            del entries[key]
+
+    def get(self, key: str) -> IdempotencyEntry:
+        """
+        Retorna a entrada da chave, ou None se desconhecida ou expirada.
+
+        Args:
+            key (str): Chave de idempotência.
+
+        Returns:
+            IdempotencyEntry: Entrada registrada.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            del self._entries[key]
+            return None
+        return entry
+
+    def check(self, key: str, fingerprint: Tuple[str, ...]) -> IdempotencyEntry:
+        """
+        Verifica se a operação já foi aplicada.
+
+        Args:
+            key (str): Chave de idempotência.
+            fingerprint (Tuple[str, ...]): Identificação da operação atual.
+
+        Raises:
+            ValueError: Se a chave já foi usada para uma operação diferente.
+
+        Returns:
+            IdempotencyEntry: Registro da operação original (com o saldo e o momento
+                dela), ou None se a chave é nova.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+        if entry.fingerprint != fingerprint:
+            raise ValueError(f"A chave de idempotência '{key}' já foi usada em outra operação")
+        return entry
+
+    def remember(self, key: str, fingerprint: Tuple[str, ...], sequence: int, balance: Decimal,
+                 registered_at: float = None):
+        """
+        Registra uma operação aplicada.
+
+        Args:
+            key (str): Chave de idempotência.
+            fingerprint (Tuple[str, ...]): Identificação da operação.
+            sequence (int): Sequência da transação no livro-razão.
+            balance (Decimal): Saldo da conta de origem logo após a operação.
+            registered_at (float, optional): Momento da operação (padrão: agora).
+        """
+        now = self._clock()
+        registered_at = now if registered_at is None else registered_at
+        entry = IdempotencyEntry(registered_at + self._ttl_seconds, tuple(fingerprint), sequence,
+                                 balance, registered_at)
+        if entry.expires_at <= now:
+            return
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        if self._journal is not None:
+            self._journal.write(entry.to_json(key) + '\n')
+            self._journal.flush()
+        self._evict(now)
+
+    def clear(self):
+        """Esquece todas as chaves."""
+        self._entries.clear()
+
+    def attach_file(self, path: str) -> int:
+        """
+        Passa a gravar as chaves registradas em um arquivo, carregando as já gravadas.
+
+        O arquivo existente é carregado e reescrito apenas com as chaves
+        válidas; depois, cada nova chave é acrescentada ao fim dele.
+
+        Args:
+            path (str): Caminho do arquivo.
+
+        Returns:
+            int: Número de chaves carregadas do arquivo.
+        """
+        self.close()
+        loaded = self.load(path) if os.path.exists(path) else 0
+        self.save(path)
+        self._journal = open(path, 'a', encoding='utf-8')
+        return loaded
+
+    def close(self):
+        """Fecha o arquivo associado por `attach_file` (as chaves continuam em memória)."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def save(self, path: str):
+        """
+        Grava as chaves válidas em um arquivo JSON (uma entrada por linha).
+
+        Args:
+            path (str): Caminho do arquivo.
+        """
+        self._evict(self._clock())
+        with open(path, 'w', encoding='utf-8') as cache_file:
+            for key, entry in self._entries.items():
+                cache_file.write(entry.to_json(key) + '\n')
+
+    def load(self, path: str) -> int:
+        """
+        Carrega chaves gravadas por `save`, descartando as expiradas.
+
+        Args:
+            path (str): Caminho do arquivo.
+
+        Returns:
+            int: Número de chaves carregadas.
+        """
+        now = self._clock()
+        loaded = 0
+        with open(path, 'r', encoding='utf-8') as cache_file:
+            for line in cache_file:
+                if not line.strip():
+                    continue
+                key, entry = IdempotencyEntry.from_json(line)
+                if entry.expires_at > now:
+                    self._entries[key] = entry
+                    self._entries.move_to_end(key)
+                    loaded += 1
+        self._evict(now)
+        return loaded
+
+def transaction_fingerprint(transaction) -> Tuple[str, ...]:
+    """
+    Identificação de uma transação para a verificação de idempotência.
+
+    Args:
+        transaction (Transaction): Depósito, saque ou transferência.
+
+    Returns:
+        Tuple[str, ...]: (tipo, conta, agência, valor[, conta destino, agência destino]).
+    """
+    account = transaction.account
+    fingerprint = [type(transaction).__name__.lower(), str(account.account_number),
+                   str(account.agency_number), str(transaction.value)]
+    destination = getattr(transaction, 'destination_account', None)
+    if destination is not None:
+        fingerprint += [str(destination.account_number), str(destination.agency_number)]
+    return tuple(fingerprint)
@@ -0,0 +1,671 @@
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left, bisect_right
+from decimal import Decimal
+from itertools import count, islice
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Tuple, TYPE_CHECKING
+import re
+import unicodedata
+
+if TYPE_CHECKING:
+    from src.entities import Account, Client
+
+# Sentinela maior que qualquer número de sequência, usada nas buscas por faixa
+_AFTER_ALL = float('inf')
+
+# Busca de clientes: tamanho dos n-gramas do nome e limite padrão de resultados
+NGRAM_SIZE = 3
+DEFAULT_SEARCH_LIMIT = 50
+
+# Maior caractere possível, usado como limite superior das buscas por prefixo
+_MAX_CHAR = chr(0x10FFFF)
+_NON_DIGITS = re.compile(r'\D')
+
+# Marca das chaves de início de palavra no índice de nomes (não ocorre em textos normalizados)
+_WORD_START = '\x00'
+
+class HashIndex:
+    """
+    Índice de igualdade: mapeia uma chave calculada a partir da conta para as contas com essa chave.
+
+    Usado para consultas como "todas as contas da cidade X".
+    """
+
+    def __init__(self, key_func: Callable[[Account], Hashable]):
+        """
+        Inicializa o índice.
+
+        Args:
+            key_func (Callable[[Account], Hashable]): Função que extrai a chave da conta.
+        """
+        self._key_func = key_func
+        self._buckets: Dict[Hashable, List[Account]] = {}
+        self._keys: Dict[int, Hashable] = {}
+
+    def add(self, account: Account):
+        """Indexa uma conta."""
+        key = self._key_func(account)
+        self._keys[id(account)] = key
+        self._buckets.setdefault(key, []).append(account)
+
+    def remove(self, account: Account):
+        """Remove uma conta do índice (ignora contas não indexadas)."""
+        key = self._keys.pop(id(account), None)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            return
+        bucket[:] = [item for item in bucket if item is not account]
+        if not bucket:
+            del self._buckets[key]
+
+    def lookup(self, key: Hashable) -> List[Account]:
+        """
+        Retorna as contas com a chave informada.
+
+        Args:
+            key (Hashable): Chave buscada.
+
+        Returns:
+            List[Account]: Contas encontradas (lista vazia se não houver).
+        """
+        return self._buckets.get(key, [])
+
+    def clear(self):
+        """Esvazia o índice."""
+        self._buckets.clear()
+        self._keys.clear()
+
+class SortedKeyList:
+    """
+    Lista ordenada de pares (chave, valor) dividida em blocos.
+
+    Cada bloco é uma pequena lista ordenada; a lista `_maxes` guarda a maior
+    chave de cada bloco. Localizar uma posição custa dois `bisect` (nos
+    máximos e dentro do bloco) e inserções/remoções movem apenas um bloco,
+    em vez da lista inteira. Percorrer k itens a partir de uma posição custa O(k).
+
+    Os tamanhos dos blocos são acumulados em uma árvore de Fenwick, de modo
+    que a posição absoluta de um item (e a contagem de uma faixa) custa
+    O(log n). A árvore é montada na primeira contagem, atualizada em O(log n)
+    a cada inserção/remoção e remontada apenas quando blocos são criados,
+    divididos ou removidos.
+    """
+
+    def __init__(self, load: int = 512):
+        """
+        Inicializa a lista.
+
+        Args:
+            load (int): Tamanho de referência dos blocos (blocos com o dobro são divididos).
+        """
+        self._load = load
+        self._keys: List[list] = []
+        self._values: List[list] = []
+        self._maxes: list = []
+        self._size = 0
+        # Árvore de Fenwick dos tamanhos dos blocos (índice 1..nº de blocos); None = a remontar
+        self._tree: List[int] = None
+
+    def __len__(self) -> int:
+        """Retorna o número de itens."""
+        return self._size
+
+    def add(self, key: Any, value: Any):
+        """
+        Insere um item mantendo a ordem das chaves.
+
+        Args:
+            key (Any): Chave comparável (deve ser única).
+            value (Any): Valor associado.
+        """
+        self._size += 1
+        if not self._maxes:
+            self._keys.append([key])
+            self._values.append([value])
+            self._maxes.append(key)
+            self._tree = None
+            return
+
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            # Maior que todas as chaves: acrescenta ao último bloco
+            block -= 1
+            self._keys[block].append(key)
+            self._values[block].append(value)
+            self._maxes[block] = key
+        else:
+            keys = self._keys[block]
+            position = bisect_left(keys, key)
+            keys.insert(position, key)
+            self._values[block].insert(position, value)
+
+        if len(self._keys[block]) > 2 * self._load:
+            self._split(block)
+        elif self._tree is not None:
+            self._tree_add(block, 1)
+
+    def _split(self, block: int):
+        """Divide um bloco grande em dois."""
+        keys = self._keys[block]
+        values = self._values[block]
+        half = len(keys) // 2
+        self._keys[block:block + 1] = [keys[:half], keys[half:]]
+        self._values[block:block + 1] = [values[:half], values[half:]]
+        self._maxes[block:block + 1] = [keys[half - 1], keys[-1]]
+        self._tree = None
+
+    def remove(self, key: Any) -> bool:
+        """
+        Remove o item com a chave informada.
+
+        Args:
+            key (Any): Chave do item.
+
+        Returns:
+            bool: True se o item existia.
+        """
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return False
+        keys = self._keys[block]
+        position = bisect_left(keys, key)
+        if position == len(keys) or keys[position] != key:
+            return False
+
+        del keys[position]
+        del self._values[block][position]
+        self._size -= 1
+        if not keys:
+            del self._keys[block]
+            del self._values[block]
+            del self._maxes[block]
+            self._tree = None
+            return True
+        if position == len(keys):
+            self._maxes[block] = keys[-1]
+        if self._tree is not None:
+            self._tree_add(block, -1)
+        return True
+
+    def _build_tree(self) -> List[int]:
+        """Monta a árvore de Fenwick dos tamanhos dos blocos em O(nº de blocos)."""
+        tree = [0]
+        tree.extend(len(keys) for keys in self._keys)
+        size = len(tree)
+        for index in range(1, size):
+            parent = index + (index & -index)
+            if parent < size:
+                tree[parent] += tree[index]
+        self._tree = tree
+        return tree
+
+    def _tree_add(self, block: int, delta: int):
+        """Soma `delta` ao tamanho registrado de um bloco."""
+        tree = self._tree
+        index = block + 1
+        size = len(tree)
+        while index < size:
+            tree[index] += delta
+            index += index & -index
+
+    def _locate_left(self, key: Any) -> Tuple[int, int]:
+        """Retorna (bloco, posição) do primeiro item com chave >= key."""
+        block = bisect_left(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, bisect_left(self._keys[block], key)
+
+    def _locate_right(self, key: Any) -> Tuple[int, int]:
+        """Retorna (bloco, posição) do primeiro item com chave > key."""
+        block = bisect_right(self._maxes, key)
+        if block == len(self._maxes):
+            return block, 0
+        return block, bisect_right(self._keys[block], key)
+
+    def _rank(self, location: Tuple[int, int]) -> int:
+        """Converte (bloco, posição) em posição absoluta."""
+        block, position = location
+        tree = self._tree if self._tree is not None else self._build_tree()
+        # Soma dos tamanhos dos blocos anteriores: O(log nº de blocos)
+        total = position
+        while block:
+            total += tree[block]
+            block &= block - 1
+        return total
+
+    def _iterate(self, start: Tuple[int, int], end: Tuple[int, int]):
+        """Percorre os valores de `start` (inclusivo) até `end` (exclusivo)."""
+        block, position = start
+        end_block, end_position = end
+        while block < end_block or (block == end_block and position < end_position):
+            values = self._values[block]
+            stop = end_position if block == end_block else len(values)
+            yield from values[position:stop]
+            block += 1
+            position = 0
+
+    def _bounds(self, low: Any, high: Any, locate_high: Callable) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+        """Localiza o início e o fim (exclusivo) de uma faixa de chaves."""
+        start = (0, 0) if low is None else self._locate_left(low)
+        end = (len(self._maxes), 0) if high is None else locate_high(high)
+        return start, end
+
+    def irange(self, low: Any = None, high: Any = None, high_inclusive: bool = False):
+        """
+        Percorre, em ordem crescente, os valores com low <= chave < high (ou <= high).
+
+        Args:
+            low (Any, optional): Menor chave (inclusiva); None = desde o início.
+            high (Any, optional): Maior chave; None = até o fim.
+            high_inclusive (bool): Se a chave `high` é incluída.
+
+        Yields:
+            Any: Valores na faixa.
+        """
+        locate = self._locate_right if high_inclusive else self._locate_left
+        start, end = self._bounds(low, high, locate)
+        return self._iterate(start, end)
+
+    def count(self, low: Any = None, high: Any = None, high_inclusive: bool = False) -> int:
+        """
+        Conta os itens na faixa sem percorrê-los.
+
+        Custa O(log n): as bordas são localizadas por `bisect` e convertidas
+        em posições absolutas pela árvore de Fenwick.
+        """
+        locate = self._locate_right if high_inclusive else self._locate_left
+        start, end = self._bounds(low, high, locate)
+        return max(0, self._rank(end) - self._rank(start))
+
+    def reversed_values(self):
+        """
+        Percorre os valores em ordem decrescente de chave.
+
+        Yields:
+            Any: Valores, do maior para o menor.
+        """
+        for values in reversed(self._values):
+            yield from reversed(values)
+
+    def clear(self):
+        """Esvazia a lista."""
+        self._keys.clear()
+        self._values.clear()
+        self._maxes.clear()
+        self._size = 0
+        self._tree = None
+
+class SortedIndex:
+    """
+    Índice ordenado por uma chave calculada a partir da conta.
+
+    As entradas ficam em uma SortedKeyList, permitindo consultas por faixa
+    em O(log n + k). Um número de sequência desempata contas com a mesma chave.
+    """
+
+    def __init__(self, key_func: Callable[[Account], Any]):
+        """
+        Inicializa o índice.
+
+        Args:
+            key_func (Callable[[Account], Any]): Função que extrai a chave (comparável) da conta.
+        """
+        self._key_func = key_func
+        self._sequence = count()
+        self._items = SortedKeyList()
+        self._entries: Dict[int, Tuple[Any, int]] = {}
+
+    def __len__(self) -> int:
+        """Retorna o número de contas indexadas."""
+        return len(self._items)
+
+    def add(self, account: Account):
+        """Indexa uma conta."""
+        entry = (self._key_func(account), next(self._sequence))
+        self._entries[id(account)] = entry
+        self._items.add(entry, account)
+
+    def remove(self, account: Account):
+        """Remove uma conta do índice (ignora contas não indexadas)."""
+        entry = self._entries.pop(id(account), None)
+        if entry is not None:
+            self._items.remove(entry)
+
+    def update(self, account: Account):
+        """Reposiciona a conta após mudança da chave."""
+        self.remove(account)
+        self.add(account)
+
+    @staticmethod
+    def _range_keys(low: Any, high: Any, include_low: bool, include_high: bool):
+        """Converte os limites da faixa em chaves (chave, sequência) comparáveis às entradas."""
+        low_key = None
+        if low is not None:
+            low_key = (low,) if include_low else (low, _AFTER_ALL)
+        high_key = None
+        if high is not None:
+            high_key = (high, _AFTER_ALL) if include_high else (high,)
+        return low_key, high_key
+
+    def count_range(self, low: Any = None, high: Any = None,
+                    include_low: bool = True, include_high: bool = True) -> int:
+        """
+        Conta as contas dentro da faixa sem materializá-las.
+
+        Args:
+            low (Any, optional): Limite inferior (None = sem limite).
+            high (Any, optional): Limite superior (None = sem limite).
+            include_low (bool): Se o limite inferior é inclusivo.
+            include_high (bool): Se o limite superior é inclusivo.
+
+        Returns:
+            int: Quantidade de contas na faixa.
+        """
+        low_key, high_key = self._range_keys(low, high, include_low, include_high)
+        return self._items.count(low_key, high_key)
+
+    def iterate_range(self, low: Any = None, high: Any = None,
+                      include_low: bool = True, include_high: bool = True):
+        """
+        Percorre as contas cuja chave está dentro da faixa, em ordem crescente.
+
+        Yields:
+            Account: Contas na faixa.
+        """
+        low_key, high_key = self._range_keys(low, high, include_low, include_high)
+        return self._items.irange(low_key, high_key)
+
+    def range(self, low: Any = None, high: Any = None,
+              include_low: bool = True, include_high: bool = True) -> List[Account]:
+        """
+        Retorna as contas cuja chave está dentro da faixa, em ordem crescente.
+
+        Args:
+            low (Any, optional): Limite inferior (None = sem limite).
+            high (Any, optional): Limite superior (None = sem limite).
+            include_low (bool): Se o limite inferior é inclusivo.
+            include_high (bool): Se o limite superior é inclusivo.
+
+        Returns:
+            List[Account]: Contas encontradas.
+        """
+        return list(self.iterate_range(low, high, include_low, include_high))
+
+    def largest(self, limit: int) -> List[Account]:
+        """
+        Retorna as `limit` contas com as maiores chaves, em ordem decrescente (O(log n + k)).
+
+        Args:
+            limit (int): Quantidade máxima de contas.
+
+        Returns:
+            List[Account]: Contas encontradas.
+        """
+        return list(islice(self._items.reversed_values(), max(0, limit)))
+
+    def clear(self):
+        """Esvazia o índice."""
+        self._items.clear()
+        self._entries.clear()
+
+class BalanceIndex(SortedIndex):
+    """
+    Índice ordenado pelo saldo, mantido a cada alteração de saldo.
+
+    É registrado como observador das contas indexadas e é notificado por
+    Account.add_balance. Cada alteração de saldo custa uma remoção e uma
+    inserção em O(log n) mais a movimentação de um único bloco.
+    """
+
+    def __init__(self):
+        super().__init__(lambda account: account.balance)
+
+    def balance_changed(self, account: Account, previous_balance: Decimal):
+        """
+        Reposiciona a conta após uma alteração de saldo.
+
+        Args:
+            account (Account): Conta alterada.
+            previous_balance (Decimal): Saldo anterior (não utilizado; a chave antiga fica no índice).
+        """
+        if id(account) in self._entries:
+            self.update(account)
+
+def normalize_text_key(text: str) -> str:
+    """
+    Normaliza textos usados como chave (ex.: cidade e estado) para buscas sem diferenciar maiúsculas.
+
+    Args:
+        text (str): Texto original.
+
+    Returns:
+        str: Texto sem espaços nas pontas e em caixa baixa.
+    """
+    return text.strip().casefold()
+
+def normalize_search_text(text: str) -> str:
+    """
+    Normaliza textos para busca sem diferenciar acentos nem maiúsculas.
+
+    Args:
+        text (str): Texto original (ex.: "  José  da Conceição").
+
+    Returns:
+        str: Texto sem acentos, em caixa baixa e com espaços simples ("jose da conceicao").
+    """
+    text = text.casefold()
+    if not text.isascii():
+        decomposed = unicodedata.normalize('NFKD', text)
+        text = ''.join(char for char in decomposed if not unicodedata.combining(char))
+    return ' '.join(text.split())
+
+def _cpf_digits(text: str) -> str:
+    """Mantém apenas os dígitos de um CPF (completo ou parcial)."""
+    return _NON_DIGITS.sub('', text)
+
+def _unique(values: Iterable[int]):
+    """Percorre os valores sem repetições, preservando a ordem."""
+    seen = set()
+    for value in values:
+        if value not in seen:
+            seen.add(value)
+            yield value
+
+class ClientSearchIndex:
+    """
+    Índice de busca de clientes por trecho do nome e por prefixo do CPF.
+
+    Os nomes são normalizados (sem acentos, caixa baixa) e decompostos em
+    n-gramas (trigramas, por padrão) por palavra; cada n-grama aponta para a
+    lista dos clientes que o contêm (índice invertido). Os inícios de palavra
+    menores que o n-grama ("j", "jo") também são chaves do índice, para os
+    termos curtos. Uma busca percorre apenas a lista da chave mais rara da
+    consulta e confirma cada candidato no nome normalizado. Os CPFs ficam em
+    uma lista ordenada, e a busca por prefixo é uma varredura de faixa.
+
+    A inclusão é incremental. Ao renomear um cliente (`update`), as chaves
+    antigas não são removidas das listas: a confirmação no nome atual
+    descarta as entradas obsoletas.
+    """
+
+    def __init__(self, ngram_size: int = NGRAM_SIZE):
+        """
+        Inicializa o índice vazio.
+
+        Args:
+            ngram_size (int): Tamanho dos n-gramas do nome.
+
+        Raises:
+            ValueError: Se o tamanho for menor que 1.
+        """
+        if ngram_size < 1:
+            raise ValueError("O tamanho do n-grama deve ser maior que zero")
+        self._ngram_size = ngram_size
+        self._clients: List[Client] = []
+        self._names: List[str] = []
+        self._cpfs: List[str] = []
+        self._ids: Dict[int, int] = {}
+        self._postings: Dict[str, array] = {}
+        self._word_keys: Dict[str, Tuple[str, ...]] = {}
+        self._cpf_prefixes = SortedKeyList()
+        # Após uma renomeação, as listas de chaves podem repetir clientes
+        self._renamed = False
+
+    def __len__(self) -> int:
+        """Retorna o número de clientes indexados."""
+        return len(self._clients)
+
+    def _keys_of_word(self, word: str) -> Tuple[str, ...]:
+        """Chaves de uma palavra: seus n-gramas e seus inícios menores que o n-grama (memorizadas)."""
+        keys = self._word_keys.get(word)
+        if keys is None:
+            size = self._ngram_size
+            ngrams = {word[start:start + size] for start in range(len(word) - size + 1)}
+            starts = {_WORD_START + word[:length] for length in range(1, min(size, len(word) + 1))}
+            keys = self._word_keys[word] = tuple(ngrams | starts)
+        return keys
+
+    def _keys(self, name: str) -> set:
+        """Chaves distintas de um nome normalizado."""
+        keys = set()
+        for word in name.split():
+            keys.update(self._keys_of_word(word))
+        return keys
+
+    def _term_keys(self, term: str) -> Iterable[str]:
+        """Chaves que um cliente precisa ter para conter o termo da consulta."""
+        size = self._ngram_size
+        if len(term) < size:
+            return (_WORD_START + term,)
+        return (term[start:start + size] for start in range(len(term) - size + 1))
+
+    def _index_name(self, client_id: int, name: str, previous: str = ''):
+        """Acrescenta às listas as chaves de `name` ausentes em `previous`."""
+        keys = self._keys(name)
+        if previous:
+            keys -= self._keys(previous)
+        postings = self._postings
+        for key in keys:
+            entries = postings.get(key)
+            if entries is None:
+                entries = postings[key] = array('l')
+            entries.append(client_id)
+
+    def add(self, client: Client):
+        """
+        Indexa um cliente (um cliente já indexado é atualizado).
+
+        Args:
+            client (Client): Cliente a indexar.
+        """
+        if id(client) in self._ids:
+            self.update(client)
+            return
+        client_id = len(self._clients)
+        name = normalize_search_text(client.name)
+        cpf = _cpf_digits(client.cpf.cpf)
+        self._ids[id(client)] = client_id
+        self._clients.append(client)
+        self._names.append(name)
+        self._cpfs.append(cpf)
+        self._index_name(client_id, name)
+        self._cpf_prefixes.add((cpf, client_id), client_id)
+
+    def update(self, client: Client):
+        """
+        Atualiza o índice após mudança do nome ou do CPF de um cliente indexado.
+
+        Args:
+            client (Client): Cliente alterado (clientes não indexados são incluídos).
+        """
+        client_id = self._ids.get(id(client))
+        if client_id is None:
+            self.add(client)
+            return
+        name = normalize_search_text(client.name)
+        if name != self._names[client_id]:
+            self._index_name(client_id, name, self._names[client_id])
+            self._names[client_id] = name
+            self._renamed = True
+        cpf = _cpf_digits(client.cpf.cpf)
+        if cpf != self._cpfs[client_id]:
+            self._cpf_prefixes.remove((self._cpfs[client_id], client_id))
+            self._cpf_prefixes.add((cpf, client_id), client_id)
+            self._cpfs[client_id] = cpf
+
+    def search_name(self, query: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Client]:
+        """
+        Busca clientes cujo nome contém todos os termos da consulta.
+
+        Termos com pelo menos `ngram_size` caracteres são procurados em
+        qualquer posição do nome; termos menores, no início de uma palavra.
+        A comparação ignora acentos e maiúsculas.
+
+        Args:
+            query (str): Consulta (ex.: "joao silv", "conceição").
+            limit (int): Máximo de clientes retornados.
+
+        Returns:
+            List[Client]: Clientes encontrados.
+        """
+        terms = normalize_search_text(query).split()
+        if not terms or limit <= 0:
+            return []
+        size = self._ngram_size
+        long_terms = [term for term in terms if len(term) >= size]
+        short_terms = [term for term in terms if len(term) < size]
+
+        # Percorre apenas a lista da chave mais rara da consulta
+        empty = array('l')
+        candidates = min((self._postings.get(key, empty) for term in terms for key in self._term_keys(term)),
+                         key=len)
+        if self._renamed:
+            candidates = _unique(candidates)
+
+        prefixes = [' ' + term for term in short_terms]
+        names = self._names
+        clients = self._clients
+        found = []
+        for client_id in candidates:
+            name = names[client_id]
+            for term in long_terms:
+                if term not in name:
+                    break
+            else:
+                if prefixes:
+                    padded = ' ' + name
+                    if not all(prefix in padded for prefix in prefixes):
+                        continue
+                found.append(clients[client_id])
+                if len(found) >= limit:
+                    break
+        return found
+
+    def search_cpf_prefix(self, prefix: str, limit: int = DEFAULT_SEARCH_LIMIT) -> List[Client]:
+        """
+        Busca clientes cujo CPF começa com os dígitos informados.
+
+        Args:
+            prefix (str): Início do CPF, com ou sem pontuação (ex.: "123.45").
+            limit (int): Máximo de clientes retornados.
+
+        Returns:
+            List[Client]: Clientes encontrados, em ordem de CPF.
+        """
+        digits = _cpf_digits(prefix)
+        if not digits or limit <= 0:
+            return []
+        ids = self._cpf_prefixes.irange((digits,), (digits + _MAX_CHAR,))
+        return [self._clients[client_id] for client_id in islice(ids, limit)]
+
+    def clear(self):
+        """Esvazia o índice."""
+        self._clients.clear()
+        self._names.clear()
+        self._cpfs.clear()
+        self._ids.clear()
+        self._postings.clear()
+        self._word_keys.clear()
+        self._cpf_prefixes.clear()
+        self._renamed = False
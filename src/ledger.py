@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+from array import array
+from typing import Iterator, List, NamedTuple, Tuple, TYPE_CHECKING
+
+from src.idempotency import IdempotencyCache, transaction_fingerprint
+
+if TYPE_CHECKING:
+    from src.entities import Transaction
+
+# Tamanho dos blocos do livro-razão (potência de 2 para localizar por deslocamento)
+CHUNK_BITS = 12
+CHUNK_SIZE = 1 << CHUNK_BITS
+CHUNK_MASK = CHUNK_SIZE - 1
+
+# Valor gravado na coluna de timestamps para transações ainda sem data/hora
+MISSING_TIMESTAMP = float('nan')
+
+class LedgerRecord(NamedTuple):
+    """
+    Registro do livro-razão entregue aos consumidores.
+
+    Atributos:
+        sequence (int): Número de sequência global (começa em 1).
+        timestamp (float): Data/hora da transação em segundos desde a época (NaN se ausente).
+        transaction (Transaction): Transação registrada.
+    """
+    sequence: int
+    timestamp: float
+    transaction: Transaction
+
+class Ledger:
+    """
+    Livro-razão global, somente de acréscimo, com números de sequência crescentes.
+
+    As transações são guardadas em blocos de tamanho fixo, acompanhados de uma
+    coluna compacta (`array('d')`) com os timestamps; localizar uma sequência
+    custa O(1). Os históricos das contas guardam apenas os números de sequência.
+
+    Uma transferência é registrada nas duas contas envolvidas, mas entra uma
+    única vez no livro-razão: a transação guarda a sua sequência e um novo
+    registro no mesmo livro-razão devolve a sequência existente.
+
+    As chaves de idempotência das transações registradas são guardadas no
+    cache `idempotency`, com o saldo e o momento da operação original; como
+    a chave viaja com a transação, o cache é reconstruído sempre que o
+    livro-razão é reproduzido (ex.: em uma réplica). Com `idempotency_path`,
+    as chaves também são gravadas em arquivo e recarregadas ao reabrir.
+    """
+
+    def __init__(self, idempotency: IdempotencyCache = None, idempotency_path: str = None):
+        """
+        Inicializa um livro-razão vazio.
+
+        Args:
+            idempotency (IdempotencyCache, optional): Cache de chaves de idempotência
+                (padrão: um cache com limites padrão).
+            idempotency_path (str, optional): Arquivo onde as chaves de idempotência são
+                gravadas e de onde são recarregadas (None = só em memória).
+        """
+        self._idempotency = idempotency if idempotency is not None else IdempotencyCache()
+        if idempotency_path is not None:
+            self._idempotency.attach_file(idempotency_path)
+        self._chunks: List[List[Transaction]] = []
+        self._timestamps: List[array] = []
+        self._size = 0
+        self._observers: list = []
+
+    def __len__(self) -> int:
+        """Retorna o número de transações registradas."""
+        return self._size
+
+    @property
+    def idempotency(self) -> IdempotencyCache:
+        """Retorna o cache de chaves de idempotência das transações registradas."""
+        return self._idempotency
+
+    @property
+    def last_sequence(self) -> int:
+        """Retorna a sequência da última transação registrada (0 se vazio)."""
+        return self._size
+
+    def close(self):
+        """Fecha o arquivo das chaves de idempotência, se houver."""
+        self._idempotency.close()
+
+    def add_observer(self, observer):
+        """
+        Registra um observador das transações registradas.
+
+        O observador deve implementar `transaction_appended(sequence, transaction)`.
+
+        Args:
+            observer: Objeto notificado a cada nova transação (ex.: o CDC).
+        """
+        if observer not in self._observers:
+            self._observers.append(observer)
+
+    def remove_observer(self, observer):
+        """Remove um observador previamente registrado."""
+        if observer in self._observers:
+            self._observers.remove(observer)
+
+    def append(self, transaction: Transaction) -> int:
+        """
+        Registra uma transação e devolve o seu número de sequência.
+
+        Args:
+            transaction (Transaction): Transação a registrar.
+
+        Returns:
+            int: Número de sequência (o mesmo, se a transação já estava registrada).
+        """
+        if transaction._ledger is self:
+            return transaction._sequence
+
+        if not self._size & CHUNK_MASK:
+            self._chunks.append([])
+            self._timestamps.append(array('d'))
+        timestamp = transaction._timestamp
+        self._chunks[-1].append(transaction)
+        self._timestamps[-1].append(timestamp.timestamp() if timestamp is not None else MISSING_TIMESTAMP)
+
+        self._size += 1
+        transaction._ledger = self
+        transaction._sequence = sequence = self._size
+        if transaction._idempotency_key is not None:
+            # Chamado logo após a execução: o saldo da origem é o resultado original da operação
+            self._idempotency.remember(transaction._idempotency_key, transaction_fingerprint(transaction), sequence,
+                                       transaction.account.balance,
+                                       timestamp.timestamp() if timestamp is not None else None)
+        for observer in self._observers:
+            observer.transaction_appended(sequence, transaction)
+        return sequence
+
+    def get(self, sequence: int) -> Transaction:
+        """
+        Retorna a transação com o número de sequência informado.
+
+        Args:
+            sequence (int): Número de sequência (1 a last_sequence).
+
+        Raises:
+            IndexError: Se a sequência não existir.
+
+        Returns:
+            Transaction: Transação registrada.
+        """
+        if not 0 < sequence <= self._size:
+            raise IndexError(f"Sequência inexistente no livro-razão: {sequence}")
+        index = sequence - 1
+        return self._chunks[index >> CHUNK_BITS][index & CHUNK_MASK]
+
+    def stream(self, since: int = 0) -> Iterator[LedgerRecord]:
+        """
+        Percorre as transações registradas depois da sequência `since`.
+
+        O gerador acompanha o crescimento do livro-razão: transações
+        registradas durante a iteração também são entregues.
+
+        Args:
+            since (int): Última sequência já consumida (0 = desde o início).
+
+        Yields:
+            LedgerRecord: Registros em ordem de sequência.
+        """
+        index = max(0, since)
+        while index < self._size:
+            chunk = index >> CHUNK_BITS
+            offset = index & CHUNK_MASK
+            transactions = self._chunks[chunk]
+            timestamps = self._timestamps[chunk]
+            end = min(len(transactions), offset + (self._size - index))
+            for position in range(offset, end):
+                index += 1
+                yield LedgerRecord(index, timestamps[position], transactions[position])
+
+    def read(self, since: int = 0, limit: int = CHUNK_SIZE) -> Tuple[List[LedgerRecord], int]:
+        """
+        Lê um lote de registros a partir de um cursor.
+
+        Args:
+            since (int): Cursor: última sequência já consumida (0 = desde o início).
+            limit (int): Quantidade máxima de registros no lote.
+
+        Raises:
+            ValueError: Se o cursor ou o limite forem inválidos.
+
+        Returns:
+            Tuple[List[LedgerRecord], int]: Registros lidos e o cursor para a próxima leitura.
+        """
+        if since < 0 or since > self._size:
+            raise ValueError(f"Cursor do livro-razão inválido: {since}")
+        if limit < 1:
+            raise ValueError("O limite deve ser maior que zero")
+        records = []
+        for record in self.stream(since):
+            records.append(record)
+            if len(records) >= limit:
+                break
+        next_cursor = records[-1].sequence if records else since
+        return records, next_cursor
@@ -0,0 +1,335 @@
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Deque, Dict, Iterable, List, NamedTuple, Tuple, TYPE_CHECKING
+import time
+
+if TYPE_CHECKING:
+    from src.entities import Transaction
+
+# Operações controladas
+OPERATION_DEPOSIT = 'deposit'
+OPERATION_WITHDRAW = 'withdraw'
+OPERATION_TRANSFER = 'transfer'
+OPERATIONS = (OPERATION_DEPOSIT, OPERATION_WITHDRAW, OPERATION_TRANSFER)
+
+# Tipos de limite
+KIND_DAILY = 'daily'
+KIND_SLIDING_WINDOW = 'sliding_window'
+KIND_TOKEN_BUCKET = 'token_bucket'
+KIND_MAX_VALUE = 'max_value'
+LIMIT_KINDS = (KIND_DAILY, KIND_SLIDING_WINDOW, KIND_TOKEN_BUCKET, KIND_MAX_VALUE)
+
+# Nomes das políticas padrão
+DAILY_TRANSACTIONS = 'daily_transactions'
+DAILY_WITHDRAWALS = 'daily_withdrawals'
+WITHDRAW_VALUE = 'withdraw_value'
+
+SECONDS_PER_DAY = 24 * 60 * 60
+
+class LimitPolicy(NamedTuple):
+    """
+    Regra de limite aplicada a cada conta.
+
+    Atributos:
+        name (str): Identificação da política (ex.: DAILY_TRANSACTIONS).
+        kind (str): Tipo do contador (ver LIMIT_KINDS).
+        limit (Decimal): Quantidade máxima de operações ou, em KIND_MAX_VALUE, valor máximo por operação.
+        operations (Tuple[str, ...]): Operações às quais a política se aplica.
+        window_seconds (float): Janela da KIND_SLIDING_WINDOW ou período de recarga
+            completa da KIND_TOKEN_BUCKET (ignorado nos demais tipos).
+        message (str): Mensagem de erro; aceita os campos `{limit}` e `{count}`.
+    """
+    name: str
+    kind: str
+    limit: Decimal
+    operations: Tuple[str, ...] = OPERATIONS
+    window_seconds: float = SECONDS_PER_DAY
+    message: str = "Limite '{name}' excedido ({limit})"
+
+DEFAULT_POLICIES: Tuple[LimitPolicy, ...] = (
+    LimitPolicy(DAILY_TRANSACTIONS, KIND_DAILY, 10, OPERATIONS,
+                message="Limite diário de transações excedido! Você já realizou {count} transações hoje. "
+                        "Limite máximo: {limit} transações por dia."),
+    LimitPolicy(DAILY_WITHDRAWALS, KIND_DAILY, 3, (OPERATION_WITHDRAW,),
+                message="O total de saques excedeu o limite de {limit} saques por dia"),
+    LimitPolicy(WITHDRAW_VALUE, KIND_MAX_VALUE, Decimal('500.00'), (OPERATION_WITHDRAW,),
+                message="O valor do saque excede o limite de R$ {limit:.2f}"),
+)
+
+class DailyCounter:
+    """
+    Contador de operações no dia corrente (horário local).
+
+    Guarda apenas o fim do dia atual e a contagem; ao passar da meia-noite a
+    contagem é zerada na próxima consulta, sem percorrer o histórico.
+    """
+    __slots__ = ('_limit', '_day_start', '_day_end', '_count')
+
+    def __init__(self, limit: int):
+        self._limit = limit
+        self._day_start = 0.0
+        self._day_end = 0.0
+        self._count = 0
+
+    def _roll(self, now: float):
+        """Inicia um novo dia quando `now` já passou do fim do dia atual."""
+        if now >= self._day_end:
+            start = datetime.combine(datetime.fromtimestamp(now).date(), datetime.min.time())
+            self._day_start = start.timestamp()
+            self._day_end = (start + timedelta(days=1)).timestamp()
+            self._count = 0
+
+    def used(self, now: float) -> int:
+        """Retorna o número de operações registradas no dia de `now`."""
+        self._roll(now)
+        return self._count
+
+    def allows(self, now: float, value: Decimal) -> bool:
+        """Indica se mais uma operação cabe no limite do dia."""
+        return self.used(now) < self._limit
+
+    def record(self, at: float):
+        """Contabiliza uma operação realizada em `at` (operações de dias anteriores são ignoradas)."""
+        self._roll(at)
+        if at >= self._day_start:
+            self._count += 1
+
+class SlidingWindowCounter:
+    """
+    Contador de operações nos últimos `window_seconds` segundos.
+
+    Os instantes ficam em uma fila em ordem cronológica; os que saem da janela
+    são descartados do início, com custo O(1) amortizado por operação.
+    """
+    __slots__ = ('_limit', '_window', '_times')
+
+    def __init__(self, limit: int, window_seconds: float):
+        self._limit = limit
+        self._window = window_seconds
+        self._times: Deque[float] = deque()
+
+    def used(self, now: float) -> int:
+        """Retorna o número de operações dentro da janela que termina em `now`."""
+        times = self._times
+        start = now - self._window
+        while times and times[0] <= start:
+            times.popleft()
+        return len(times)
+
+    def allows(self, now: float, value: Decimal) -> bool:
+        """Indica se mais uma operação cabe na janela."""
+        return self.used(now) < self._limit
+
+    def record(self, at: float):
+        """Contabiliza uma operação realizada em `at`."""
+        self._times.append(at)
+
+class TokenBucket:
+    """
+    Balde de fichas: comporta até `limit` operações seguidas e recarrega
+    `limit` fichas a cada `window_seconds`, de forma contínua.
+    """
+    __slots__ = ('_limit', '_rate', '_tokens', '_updated_at')
+
+    def __init__(self, limit: int, window_seconds: float):
+        self._limit = limit
+        self._rate = limit / window_seconds
+        self._tokens = float(limit)
+        self._updated_at = None
+
+    def _refill(self, now: float):
+        """Acrescenta as fichas recarregadas desde a última atualização."""
+        if self._updated_at is not None and now > self._updated_at:
+            self._tokens = min(float(self._limit), self._tokens + (now - self._updated_at) * self._rate)
+        if self._updated_at is None or now > self._updated_at:
+            self._updated_at = now
+
+    def used(self, now: float) -> int:
+        """Retorna o número de fichas consumidas e ainda não recarregadas."""
+        self._refill(now)
+        return self._limit - int(self._tokens)
+
+    def allows(self, now: float, value: Decimal) -> bool:
+        """Indica se há ao menos uma ficha disponível."""
+        self._refill(now)
+        return self._tokens >= 1
+
+    def record(self, at: float):
+        """Consome uma ficha (operações registradas sem verificação podem deixar o saldo negativo)."""
+        self._refill(at)
+        self._tokens -= 1
+
+class MaxValueRule:
+    """Limite de valor por operação (não acumula estado)."""
+    __slots__ = ('_limit',)
+
+    def __init__(self, limit: Decimal):
+        self._limit = limit
+
+    def used(self, now: float) -> int:
+        """Regras de valor não contam operações."""
+        return 0
+
+    def allows(self, now: float, value: Decimal) -> bool:
+        """Indica se o valor está dentro do limite."""
+        return value is None or value <= self._limit
+
+    def record(self, at: float):
+        """Regras de valor não contam operações."""
+
+def build_counter(policy: LimitPolicy):
+    """
+    Cria o contador correspondente ao tipo da política.
+
+    Args:
+        policy (LimitPolicy): Política a aplicar.
+
+    Raises:
+        ValueError: Se o tipo for desconhecido.
+    """
+    if policy.kind == KIND_DAILY:
+        return DailyCounter(policy.limit)
+    if policy.kind == KIND_SLIDING_WINDOW:
+        return SlidingWindowCounter(policy.limit, policy.window_seconds)
+    if policy.kind == KIND_TOKEN_BUCKET:
+        return TokenBucket(policy.limit, policy.window_seconds)
+    if policy.kind == KIND_MAX_VALUE:
+        return MaxValueRule(policy.limit)
+    raise ValueError(f"Tipo de limite inválido. Tipos válidos: {list(LIMIT_KINDS)}")
+
+def transaction_operation(transaction: Transaction) -> str:
+    """Retorna a operação (OPERATION_*) correspondente a uma transação."""
+    return type(transaction).__name__.lower()
+
+class AccountLimits:
+    """
+    Contadores de limite de uma conta, um por política.
+
+    `check` verifica, antes da execução, se a operação cabe em todas as
+    políticas que se aplicam a ela; `record` contabiliza a operação depois
+    de registrada no histórico. Ambas são O(1) por política.
+    """
+
+    def __init__(self, engine: LimitEngine):
+        """
+        Inicializa os contadores zerados.
+
+        Args:
+            engine (LimitEngine): Motor que define as políticas e o relógio.
+        """
+        self._engine = engine
+        self._counters = {policy.name: build_counter(policy) for policy in engine.policies}
+        self._by_operation: Dict[str, List[Tuple[LimitPolicy, object]]] = {
+            operation: [(policy, self._counters[policy.name]) for policy in engine.policies
+                        if operation in policy.operations]
+            for operation in OPERATIONS
+        }
+
+    @property
+    def engine(self) -> LimitEngine:
+        """Retorna o motor de limites que criou os contadores."""
+        return self._engine
+
+    def check(self, operation: str, value: Decimal = None):
+        """
+        Verifica se a operação pode ser realizada agora.
+
+        Args:
+            operation (str): Operação (OPERATION_*).
+            value (Decimal, optional): Valor da operação (usado pelos limites de valor).
+
+        Raises:
+            ValueError: Com a mensagem da primeira política excedida.
+        """
+        now = self._engine.clock()
+        for policy, counter in self._by_operation.get(operation, ()):
+            if not counter.allows(now, value):
+                raise ValueError(policy.message.format(name=policy.name, limit=policy.limit,
+                                                       count=counter.used(now)))
+
+    def record(self, operation: str, at: datetime = None):
+        """
+        Contabiliza uma operação realizada.
+
+        Args:
+            operation (str): Operação (OPERATION_*).
+            at (datetime, optional): Momento da operação (padrão: agora).
+        """
+        timestamp = at.timestamp() if at is not None else self._engine.clock()
+        for _, counter in self._by_operation.get(operation, ()):
+            counter.record(timestamp)
+
+    def record_transactions(self, transactions: Iterable[Transaction]):
+        """Contabiliza transações já existentes, em ordem cronológica (ex.: ao trocar de motor)."""
+        for transaction in transactions:
+            self.record(transaction_operation(transaction), transaction._timestamp)
+
+    def used(self, name: str) -> int:
+        """Retorna quantas operações a política `name` já contabilizou na janela atual."""
+        return self._counters[name].used(self._engine.clock())
+
+    def remaining(self, name: str) -> int:
+        """Retorna quantas operações ainda cabem na política `name`."""
+        return max(0, int(self._engine.policy(name).limit) - self.used(name))
+
+class LimitEngine:
+    """
+    Conjunto configurável de políticas de limite.
+
+    Cada conta recebe seus próprios contadores por meio de `for_account`;
+    as políticas e o relógio são compartilhados.
+    """
+
+    def __init__(self, policies: Iterable[LimitPolicy] = DEFAULT_POLICIES, clock: Callable[[], float] = time.time):
+        """
+        Inicializa o motor.
+
+        Args:
+            policies (Iterable[LimitPolicy]): Políticas aplicadas a cada conta.
+            clock (Callable[[], float]): Relógio em segundos desde a época (substituível em testes).
+
+        Raises:
+            ValueError: Se houver políticas com o mesmo nome ou parâmetros inválidos.
+        """
+        self._policies: Tuple[LimitPolicy, ...] = tuple(policies)
+        self._policies_by_name = {policy.name: policy for policy in self._policies}
+        if len(self._policies_by_name) != len(self._policies):
+            raise ValueError("Os nomes das políticas de limite devem ser únicos")
+        for policy in self._policies:
+            if policy.kind not in LIMIT_KINDS:
+                raise ValueError(f"Tipo de limite inválido. Tipos válidos: {list(LIMIT_KINDS)}")
+            if policy.limit <= 0 or policy.window_seconds <= 0:
+                raise ValueError(f"Parâmetros inválidos na política '{policy.name}'")
+        self._clock = clock
+
+    @property
+    def policies(self) -> Tuple[LimitPolicy, ...]:
+        """Retorna as políticas configuradas."""
+        return self._policies
+
+    @property
+    def lookback_seconds(self) -> float:
+        """Retorna o maior período que os contadores precisam conhecer do histórico."""
+        return max((policy.window_seconds for policy in self._policies), default=0)
+
+    def clock(self) -> float:
+        """Retorna o instante atual segundo o relógio do motor."""
+        return self._clock()
+
+    def policy(self, name: str) -> LimitPolicy:
+        """
+        Retorna a política pelo nome.
+
+        Raises:
+            KeyError: Se não houver política com esse nome.
+        """
+        return self._policies_by_name[name]
+
+    def for_account(self) -> AccountLimits:
+        """Cria contadores zerados para uma conta."""
+        return AccountLimits(self)
+
+DEFAULT_LIMIT_ENGINE = LimitEngine()
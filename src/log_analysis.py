@@ -0,0 +1,507 @@
+from __future__ import annotations
+
+from collections import Counter
+from datetime import datetime
+from operator import itemgetter
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+import json
+
+try:
+    import pandas as pd
+except ImportError:  # dependência opcional: sem ela, a análise usa o caminho em Python puro
+    pd = None
+
+from src.indexes import normalize_search_text
+from src.log_encoding import LOG_FIELDS, LOG_TIMESTAMP_FORMAT
+
+# Motores de análise
+BACKEND_PANDAS = 'pandas'
+BACKEND_PYTHON = 'python'
+BACKENDS = (BACKEND_PANDAS, BACKEND_PYTHON)
+
+STATUS_SUCCESS = 'Sucesso'
+UNKNOWN = 'Desconhecido'
+DEFAULT_PERCENTILES = (0.5, 0.9, 0.99)
+
+# Colunas de texto com poucos valores distintos, guardadas como categorias no DataFrame
+CATEGORY_COLUMNS = (
+    'function_name', 'transaction_type', 'status', 'account_number', 'client_name',
+    'destination_account', 'destination_client', 'failure_reason'
+)
+
+# Colunas tipadas acrescentadas pelo DataFrameLogAnalyzer (não fazem parte dos registros)
+DERIVED_COLUMNS = ('value', 'duration', 'started_at')
+
+def client_name_matcher(query: str):
+    """
+    Retorna um teste de nome que ignora acentos e maiúsculas.
+
+    O nome casa quando contém todos os termos da consulta ("joao silv"
+    encontra "João Silva"). Cada nome distinto é normalizado uma única vez.
+
+    Args:
+        query (str): Consulta com parte do nome.
+
+    Returns:
+        Callable[[str], bool]: Teste aplicado a cada nome de cliente.
+    """
+    terms = normalize_search_text(query).split()
+    verdicts: Dict[str, bool] = {}
+
+    def matches(name) -> bool:
+        verdict = verdicts.get(name)
+        if verdict is None:
+            normalized = normalize_search_text(name) if isinstance(name, str) else ''
+            verdict = verdicts[name] = all(term in normalized for term in terms)
+        return verdict
+
+    return matches
+
+def read_log_records(path: str) -> Tuple[List[dict], int]:
+    """
+    Lê um log em linhas JSON (formato padrão ou compacto dos destinos do log).
+
+    Args:
+        path (str): Caminho do arquivo.
+
+    Returns:
+        Tuple[List[dict], int]: Registros lidos e número de linhas inválidas ignoradas.
+
+    Raises:
+        FileNotFoundError: Se o arquivo não existir.
+    """
+    records = []
+    invalid = 0
+    with open(path, 'r', encoding='utf-8') as log_file:
+        for line in log_file:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                invalid += 1
+    return records, invalid
+
+def percentile(sorted_values: Sequence[float], fraction: float) -> float:
+    """
+    Percentil com interpolação linear (mesmo critério do pandas.Series.quantile).
+
+    Args:
+        sorted_values (Sequence[float]): Valores em ordem crescente.
+        fraction (float): Percentil entre 0 e 1.
+
+    Returns:
+        float: Valor do percentil (0.0 se não houver valores).
+    """
+    if not sorted_values:
+        return 0.0
+    position = (len(sorted_values) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(sorted_values) - 1)
+    return sorted_values[lower] + (sorted_values[upper] - sorted_values[lower]) * (position - lower)
+
+# Tamanho das datas no formato do log ('31/12/2025 às 23:59:59')
+LOG_TIMESTAMP_LENGTH = 22
+
+# Chave que reordena 'dd/mm/YYYY às HH:MM:SS' como (ano, mês, dia, hora), comparável como texto
+_timestamp_sort_key = itemgetter(slice(6, 10), slice(3, 5), slice(0, 2), slice(13, None))
+
+def _parse_timestamp(text) -> Optional[datetime]:
+    """Converte a data registrada no log (None se ausente ou inválida)."""
+    try:
+        return datetime.strptime(text, LOG_TIMESTAMP_FORMAT)
+    except (TypeError, ValueError):
+        return None
+
+def _parse_value(text) -> Optional[float]:
+    """Converte o valor da transação registrado como texto (None se ausente ou inválido)."""
+    try:
+        return float(text)
+    except (TypeError, ValueError):
+        return None
+
+class PythonLogAnalyzer:
+    """
+    Análise do log em Python puro sobre a lista de registros (dicts).
+
+    É o caminho usado quando o pandas não está instalado; as estatísticas
+    são calculadas em uma única passagem pelos registros.
+    """
+    backend = BACKEND_PYTHON
+
+    def __init__(self, records: List[dict], invalid_lines: int = 0):
+        """
+        Inicializa o analisador (os registros não são copiados).
+
+        Args:
+            records (List[dict]): Registros do log, em ordem cronológica.
+            invalid_lines (int): Linhas inválidas ignoradas na leitura.
+        """
+        self._records = records
+        self._invalid_lines = invalid_lines
+        self._timestamps: Optional[List[Optional[datetime]]] = None
+
+    @classmethod
+    def from_file(cls, path: str) -> 'PythonLogAnalyzer':
+        """Carrega o analisador a partir de um arquivo de log."""
+        return cls(*read_log_records(path))
+
+    @property
+    def records(self) -> List[dict]:
+        """Retorna os registros analisados."""
+        return self._records
+
+    @property
+    def invalid_lines(self) -> int:
+        """Retorna o número de linhas inválidas ignoradas na leitura."""
+        return self._invalid_lines
+
+    def __len__(self) -> int:
+        return len(self._records)
+
+    def timestamps(self) -> List[Optional[datetime]]:
+        """
+        Datas de início dos registros (None quando ausente ou inválida).
+
+        Cada texto distinto é convertido uma única vez e o resultado é guardado.
+        """
+        if self._timestamps is None:
+            parsed: Dict[str, Optional[datetime]] = {}
+            timestamps = []
+            for log in self._records:
+                text = log.get('timestamp')
+                if text not in parsed:
+                    parsed[text] = _parse_timestamp(text)
+                timestamps.append(parsed[text])
+            self._timestamps = timestamps
+        return self._timestamps
+
+    def stats(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """
+        Estatísticas do log (mesmas chaves em ambos os motores).
+
+        Args:
+            percentiles (Iterable[float]): Percentis da duração, entre 0 e 1.
+
+        Returns:
+            dict: Totais, contagens por tipo/status/conta/cliente, duração média e
+                percentis, valor total por tipo e período coberto ({} se não houver registros).
+        """
+        if not self._records:
+            return {}
+        records = self._records
+        # Uma lista por coluna e contagens com Counter (laço em C)
+        types = [log.get('transaction_type', UNKNOWN) for log in records]
+        by_status = dict(Counter([log.get('status', UNKNOWN) for log in records]))
+        value_by_type: Dict[str, float] = {}
+        for log in records:
+            transaction_type = log.get('transaction_type')
+            if transaction_type is not None:
+                value = _parse_value(log.get('transaction_value')) or 0.0
+                value_by_type[transaction_type] = value_by_type.get(transaction_type, 0.0) + value
+        durations = sorted([log.get('duration_seconds') or 0.0 for log in records])
+        total = len(records)
+        success = by_status.get(STATUS_SUCCESS, 0)
+
+        # Primeira e última datas comparadas como texto reordenado; só os extremos são convertidos
+        texts = [text for text in {log.get('timestamp') for log in records}
+                 if type(text) is str and len(text) == LOG_TIMESTAMP_LENGTH]
+        return {
+            'total_transacoes': total,
+            'por_tipo': dict(Counter(types)),
+            'por_status': by_status,
+            'por_conta': dict(Counter([log['account_number'] for log in records if 'account_number' in log])),
+            'por_cliente': dict(Counter([log['client_name'] for log in records if 'client_name' in log])),
+            'duracao_media': sum(durations) / total,
+            'transacoes_sucesso': success,
+            'transacoes_erro': total - success,
+            'duracao_percentis': {fraction: percentile(durations, fraction) for fraction in percentiles},
+            'valor_total_por_tipo': value_by_type,
+            'primeira_transacao': _parse_timestamp(min(texts, key=_timestamp_sort_key)) if texts else None,
+            'ultima_transacao': _parse_timestamp(max(texts, key=_timestamp_sort_key)) if texts else None
+        }
+
+    def group_stats(self, column: str) -> Dict[str, dict]:
+        """
+        Agregados por valor de uma coluna (ex.: 'transaction_type', 'account_number').
+
+        Returns:
+            Dict[str, dict]: {valor: {'quantidade', 'valor_total', 'duracao_media', 'duracao_maxima'}}.
+        """
+        groups: Dict[str, list] = {}
+        for log in self._records:
+            key = log.get(column)
+            if key is None:
+                continue
+            entry = groups.get(key)
+            if entry is None:
+                entry = groups[key] = [0, 0.0, 0.0, 0.0]
+            duration = log.get('duration_seconds') or 0.0
+            entry[0] += 1
+            entry[1] += _parse_value(log.get('transaction_value')) or 0.0
+            entry[2] += duration
+            entry[3] = max(entry[3], duration)
+        return {
+            str(key): {'quantidade': count, 'valor_total': value, 'duracao_media': duration / count,
+                       'duracao_maxima': longest}
+            for key, (count, value, duration, longest) in groups.items()
+        }
+
+    def filter_by_type(self, transaction_type: str) -> List[dict]:
+        """Registros de um tipo de transação ('Deposit', 'Withdraw', 'Transfer')."""
+        return [log for log in self._records if log.get('transaction_type') == transaction_type]
+
+    def filter_by_client(self, client_name: str, partial: bool = False) -> List[dict]:
+        """Registros de um cliente (nome exato ou, com `partial`, parte do nome sem acentos)."""
+        if partial:
+            matches = client_name_matcher(client_name)
+            return [log for log in self._records if matches(log.get('client_name'))]
+        return [log for log in self._records if log.get('client_name') == client_name]
+
+    def filter_by_account(self, account_number: str) -> List[dict]:
+        """Registros de uma conta de origem."""
+        return [log for log in self._records if log.get('account_number') == account_number]
+
+    def failures(self) -> List[dict]:
+        """Registros de transações que não terminaram com sucesso."""
+        return [log for log in self._records if log.get('status') != STATUS_SUCCESS]
+
+    def filter_by_period(self, start: datetime, end: datetime) -> List[dict]:
+        """Registros iniciados entre `start` e `end` (inclusive)."""
+        return [log for log, moment in zip(self._records, self.timestamps())
+                if moment is not None and start <= moment <= end]
+
+    def recent(self, quantity: int) -> List[dict]:
+        """Os `quantity` registros mais recentes."""
+        return self._records[-quantity:] if quantity > 0 else []
+
+def _parse_timestamps(series: 'pd.Series') -> 'pd.Series':
+    """
+    Converte os textos de data do log em datetime64 em uma passagem vetorizada.
+
+    Como as transações de um mesmo segundo repetem o texto, apenas os valores
+    distintos (categorias) são convertidos e o resultado é expandido pelos códigos.
+    """
+    categories = series.astype('category')
+    parsed = pd.to_datetime(categories.cat.categories, format=LOG_TIMESTAMP_FORMAT, errors='coerce')
+    if len(parsed) == 0:
+        return pd.Series(pd.NaT, index=series.index, dtype='datetime64[ns]')
+    codes = categories.cat.codes.to_numpy()
+    return pd.Series(parsed.take(codes), index=series.index).where(codes >= 0)
+
+def _typed_frame(frame: 'pd.DataFrame') -> 'pd.DataFrame':
+    """Acrescenta as colunas do esquema ausentes e converte as colunas para tipos de análise."""
+    columns = list(dict.fromkeys([*LOG_FIELDS, *frame.columns]))
+    frame = frame.reindex(columns=columns)
+    for column in CATEGORY_COLUMNS:
+        frame[column] = frame[column].astype('category')
+    frame['value'] = pd.to_numeric(frame['transaction_value'], errors='coerce')
+    frame['duration'] = pd.to_numeric(frame['duration_seconds'], errors='coerce').fillna(0.0)
+    frame['started_at'] = _parse_timestamps(frame['timestamp'])
+    return frame
+
+def _counts(series: 'pd.Series', missing_label: str = None) -> Dict[str, int]:
+    """Contagem por valor, na ordem das categorias; ausentes contam em `missing_label`, se informado."""
+    counts = {str(key): int(count) for key, count in series.value_counts(sort=False).items() if count}
+    if missing_label is not None:
+        missing = int(series.isna().sum())
+        if missing:
+            counts[missing_label] = counts.get(missing_label, 0) + missing
+    return counts
+
+def _to_datetime(value) -> Optional[datetime]:
+    """Converte um Timestamp do pandas em datetime (None para NaT)."""
+    return None if pd.isna(value) else value.to_pydatetime()
+
+class DataFrameLogAnalyzer:
+    """
+    Análise do log com pandas: os registros são carregados uma única vez em
+    colunas tipadas (categorias para textos repetidos, float para valor e
+    duração, datetime64 para as datas), e filtros, agrupamentos e
+    percentis são operações vetorizadas.
+
+    Oferece a mesma interface do PythonLogAnalyzer; os filtros devolvem
+    listas de registros (dicts) sem as colunas derivadas.
+    """
+    backend = BACKEND_PANDAS
+
+    def __init__(self, frame: 'pd.DataFrame', invalid_lines: int = 0):
+        """
+        Inicializa o analisador.
+
+        Args:
+            frame (pd.DataFrame): Registros do log, uma linha por transação.
+            invalid_lines (int): Linhas inválidas ignoradas na leitura.
+
+        Raises:
+            RuntimeError: Se o pandas não estiver instalado.
+        """
+        if pd is None:
+            raise RuntimeError("pandas não está instalado")
+        self._frame = _typed_frame(frame)
+        self._invalid_lines = invalid_lines
+
+    @classmethod
+    def from_records(cls, records: List[dict], invalid_lines: int = 0) -> 'DataFrameLogAnalyzer':
+        """Cria o analisador a partir de registros já carregados."""
+        if pd is None:
+            raise RuntimeError("pandas não está instalado")
+        return cls(pd.DataFrame.from_records(records), invalid_lines)
+
+    @classmethod
+    def from_file(cls, path: str) -> 'DataFrameLogAnalyzer':
+        """
+        Carrega o analisador a partir de um arquivo de log em linhas JSON.
+
+        A leitura é feita pelo leitor de JSON do pandas; se alguma linha for
+        inválida, o arquivo é relido linha a linha, ignorando as inválidas.
+        """
+        if pd is None:
+            raise RuntimeError("pandas não está instalado")
+        try:
+            frame = pd.read_json(path, lines=True, dtype=False, convert_dates=False, precise_float=True)
+        except ValueError:
+            return cls.from_records(*read_log_records(path))
+        return cls(frame)
+
+    @property
+    def frame(self) -> 'pd.DataFrame':
+        """Retorna o DataFrame tipado (inclui as colunas derivadas)."""
+        return self._frame
+
+    @property
+    def records(self) -> List[dict]:
+        """Retorna os registros analisados."""
+        return self._to_records(self._frame)
+
+    @property
+    def invalid_lines(self) -> int:
+        """Retorna o número de linhas inválidas ignoradas na leitura."""
+        return self._invalid_lines
+
+    def __len__(self) -> int:
+        return len(self._frame)
+
+    @staticmethod
+    def _to_records(frame: 'pd.DataFrame') -> List[dict]:
+        """Converte linhas do DataFrame em registros, sem colunas derivadas nem campos ausentes."""
+        columns = [column for column in frame.columns if column not in DERIVED_COLUMNS]
+        return [
+            {key: value for key, value in row.items() if value is not None and value == value}
+            for row in frame[columns].to_dict('records')
+        ]
+
+    def stats(self, percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> dict:
+        """
+        Estatísticas do log (mesmas chaves do PythonLogAnalyzer.stats).
+
+        Args:
+            percentiles (Iterable[float]): Percentis da duração, entre 0 e 1.
+
+        Returns:
+            dict: Estatísticas do log ({} se não houver registros).
+        """
+        frame = self._frame
+        total = len(frame)
+        if not total:
+            return {}
+        fractions = list(percentiles)
+        success = int((frame['status'] == STATUS_SUCCESS).sum())
+        durations = frame['duration']
+        quantiles = durations.quantile(fractions) if fractions else {}
+        value_by_type = frame.groupby('transaction_type', observed=True, sort=False)['value'].sum()
+        started = frame['started_at']
+        return {
+            'total_transacoes': total,
+            'por_tipo': _counts(frame['transaction_type'], UNKNOWN),
+            'por_status': _counts(frame['status'], UNKNOWN),
+            'por_conta': _counts(frame['account_number']),
+            'por_cliente': _counts(frame['client_name']),
+            'duracao_media': float(durations.mean()),
+            'transacoes_sucesso': success,
+            'transacoes_erro': total - success,
+            'duracao_percentis': {fraction: float(quantiles[fraction]) for fraction in fractions},
+            'valor_total_por_tipo': {str(key): float(value) for key, value in value_by_type.items()},
+            'primeira_transacao': _to_datetime(started.min()),
+            'ultima_transacao': _to_datetime(started.max())
+        }
+
+    def group_stats(self, column: str) -> Dict[str, dict]:
+        """
+        Agregados por valor de uma coluna (ex.: 'transaction_type', 'account_number').
+
+        Returns:
+            Dict[str, dict]: {valor: {'quantidade', 'valor_total', 'duracao_media', 'duracao_maxima'}}.
+        """
+        table = self._frame.groupby(column, observed=True, sort=False).agg(
+            quantidade=('duration', 'size'),
+            valor_total=('value', 'sum'),
+            duracao_media=('duration', 'mean'),
+            duracao_maxima=('duration', 'max')
+        )
+        return {
+            str(key): {'quantidade': int(row.quantidade), 'valor_total': float(row.valor_total),
+                       'duracao_media': float(row.duracao_media), 'duracao_maxima': float(row.duracao_maxima)}
+            for key, row in zip(table.index, table.itertuples(index=False))
+        }
+
+    def filter_by_type(self, transaction_type: str) -> List[dict]:
+        """Registros de um tipo de transação ('Deposit', 'Withdraw', 'Transfer')."""
+        return self._to_records(self._frame[self._frame['transaction_type'] == transaction_type])
+
+    def filter_by_client(self, client_name: str, partial: bool = False) -> List[dict]:
+        """Registros de um cliente (nome exato ou, com `partial`, parte do nome sem acentos)."""
+        names = self._frame['client_name']
+        if partial:
+            # Testa apenas os nomes distintos (categorias), não cada linha
+            matches = client_name_matcher(client_name)
+            selected = [name for name in names.cat.categories if matches(name)]
+            return self._to_records(self._frame[names.isin(selected)])
+        return self._to_records(self._frame[names == client_name])
+
+    def filter_by_account(self, account_number: str) -> List[dict]:
+        """Registros de uma conta de origem."""
+        return self._to_records(self._frame[self._frame['account_number'] == account_number])
+
+    def failures(self) -> List[dict]:
+        """Registros de transações que não terminaram com sucesso."""
+        return self._to_records(self._frame[self._frame['status'] != STATUS_SUCCESS])
+
+    def filter_by_period(self, start: datetime, end: datetime) -> List[dict]:
+        """Registros iniciados entre `start` e `end` (inclusive)."""
+        started = self._frame['started_at']
+        return self._to_records(self._frame[(started >= start) & (started <= end)])
+
+    def recent(self, quantity: int) -> List[dict]:
+        """Os `quantity` registros mais recentes."""
+        return self._to_records(self._frame.tail(quantity)) if quantity > 0 else []
+
+def available_backends() -> Tuple[str, ...]:
+    """Motores de análise disponíveis neste ambiente, do mais rápido ao mais lento."""
+    return BACKENDS if pd is not None else (BACKEND_PYTHON,)
+
+def load_log_analyzer(path: str, backend: str = None):
+    """
+    Carrega o log no motor de análise escolhido.
+
+    Args:
+        path (str): Caminho do arquivo de log.
+        backend (str, optional): BACKEND_PANDAS ou BACKEND_PYTHON; por padrão,
+            o pandas se estiver instalado e, caso contrário, Python puro.
+
+    Returns:
+        DataFrameLogAnalyzer | PythonLogAnalyzer: Analisador com os registros carregados.
+
+    Raises:
+        ValueError: Se o motor for inválido.
+        RuntimeError: Se o pandas for pedido sem estar instalado.
+        FileNotFoundError: Se o arquivo não existir.
+    """
+    if backend is None:
+        backend = available_backends()[0]
+    if backend not in BACKENDS:
+        raise ValueError(f"Motor de análise inválido. Motores válidos: {list(BACKENDS)}")
+    if backend == BACKEND_PANDAS:
+        return DataFrameLogAnalyzer.from_file(path)
+    return PythonLogAnalyzer.from_file(path)
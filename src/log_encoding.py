@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+from datetime import datetime
+from json.encoder import JSONEncoder, encode_basestring
+from typing import Callable, Dict
+
+try:
+    import orjson
+except ImportError:  # dependência opcional: sem ela, usa o codificador da biblioteca padrão
+    orjson = None
+
+LOG_TIMESTAMP_FORMAT = '%d/%m/%Y às %H:%M:%S'
+DEFAULT_CACHE_SIZE = 4096
+
+# Campos do registro do transaction_logger, na ordem em que são montados
+LOG_FIELDS = (
+    'timestamp', 'function_name', 'transaction_type', 'arguments', 'transaction_value',
+    'account_number', 'client_name', 'destination_account', 'destination_client',
+    'return_value', 'status', 'failure_reason', 'error_message', 'duration_seconds', 'end_timestamp'
+)
+
+# Valor de `arguments` quando execute() é chamado sem argumentos (caso comum)
+EMPTY_ARGUMENTS = {'args': [], 'kwargs': {}}
+
+class TimestampFormatter:
+    """
+    Formata datas no padrão do log reaproveitando o texto do último segundo.
+
+    Transações do mesmo segundo (a maioria, em alto volume) recebem o texto
+    já formatado, sem nova chamada a strftime.
+    """
+    __slots__ = ('_format', '_cached')
+
+    def __init__(self, date_format: str = LOG_TIMESTAMP_FORMAT):
+        """
+        Inicializa o formatador.
+
+        Args:
+            date_format (str): Formato aceito por strftime.
+        """
+        self._format = date_format
+        # (segundo, texto), substituído de uma vez para ser seguro entre threads
+        self._cached = (None, None)
+
+    def format(self, moment: datetime) -> str:
+        """
+        Retorna a data formatada.
+
+        Args:
+            moment (datetime): Data a formatar.
+
+        Returns:
+            str: Texto no formato configurado.
+        """
+        key = moment.replace(microsecond=0)
+        cached_key, text = self._cached
+        if key != cached_key:
+            text = key.strftime(self._format)
+            self._cached = (key, text)
+        return text
+
+class LogRecordEncoder:
+    """
+    Codificador JSON especializado no esquema fixo dos registros de log.
+
+    Produz exatamente o mesmo texto que `json.dumps(record, ensure_ascii=False)`,
+    mas com as chaves pré-codificadas, os textos repetidos (conta, cliente,
+    tipo, valor, datas) memorizados e o caso comum de `arguments` vazio como
+    texto constante. Campos fora do esquema são codificados normalmente.
+    """
+
+    def __init__(self, cache_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Inicializa o codificador.
+
+        Args:
+            cache_size (int): Máximo de textos memorizados (o cache é esvaziado ao atingir o limite).
+        """
+        self._cache_size = cache_size
+        self._keys: Dict[str, str] = {field: encode_basestring(field) + ': ' for field in LOG_FIELDS}
+        self._values: Dict[str, str] = {}
+        self._fallback = JSONEncoder(ensure_ascii=False).encode
+        self._empty_arguments = self._fallback(EMPTY_ARGUMENTS)
+
+    def _remember(self, cache: Dict[str, str], text: str, suffix: str = '') -> str:
+        """Codifica um texto e o memoriza, esvaziando o cache ao atingir o limite."""
+        if len(cache) >= self._cache_size:
+            cache.clear()
+        encoded = cache[text] = encode_basestring(text) + suffix
+        return encoded
+
+    def encode(self, record: dict) -> str:
+        """
+        Codifica o registro como uma linha JSON.
+
+        Args:
+            record (dict): Registro montado pelo transaction_logger.
+
+        Returns:
+            str: Texto JSON (sem quebra de linha).
+        """
+        keys = self._keys
+        values = self._values
+        parts = []
+        append = parts.append
+        for key, value in record.items():
+            prefix = keys.get(key)
+            if prefix is None:
+                prefix = self._remember(keys, key, ': ')
+            value_type = type(value)
+            if value_type is str:
+                encoded = values.get(value)
+                if encoded is None:
+                    encoded = self._remember(values, value)
+                append(prefix + encoded)
+            elif value is None:
+                append(prefix + 'null')
+            elif value_type is float and value - value == 0:
+                # Valores finitos (infinito e NaN seguem a representação do json)
+                append(prefix + float.__repr__(value))
+            elif value_type is dict and value == EMPTY_ARGUMENTS:
+                append(prefix + self._empty_arguments)
+            else:
+                append(prefix + self._fallback(value))
+        return '{' + ', '.join(parts) + '}'
+
+    __call__ = encode
+
+def orjson_serializer(record: dict) -> str:
+    """
+    Serializa o registro com orjson (JSON compacto, UTF-8 sem escapes).
+
+    Raises:
+        RuntimeError: Se o orjson não estiver instalado.
+    """
+    if orjson is None:
+        raise RuntimeError("orjson não está instalado")
+    return orjson.dumps(record, default=str).decode('utf-8')
+
+def default_fast_serializer() -> Callable[[dict], str]:
+    """
+    Retorna o serializador mais rápido disponível: orjson, se instalado;
+    caso contrário, o LogRecordEncoder (saída idêntica ao json.dumps).
+    """
+    return orjson_serializer if orjson is not None else LogRecordEncoder()
+
+fast_json_serializer = default_fast_serializer()
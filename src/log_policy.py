@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+from decimal import Decimal
+from typing import Callable, Dict, Tuple, TYPE_CHECKING
+import time
+
+from src.limits import TokenBucket
+
+if TYPE_CHECKING:
+    from src.entities import Transaction
+
+# Níveis dos registros de transação (mesmos valores do módulo logging)
+LEVEL_DEBUG = 10
+LEVEL_INFO = 20
+LEVEL_WARNING = 30
+LEVEL_ERROR = 40
+LEVEL_NAMES = {LEVEL_DEBUG: 'DEBUG', LEVEL_INFO: 'INFO', LEVEL_WARNING: 'WARNING', LEVEL_ERROR: 'ERROR'}
+
+# Nível de cada desfecho de transação
+LEVEL_SUCCESS = LEVEL_INFO
+LEVEL_FAILURE = LEVEL_WARNING    # recusada na validação (TransactionResult com falha)
+LEVEL_EXCEPTION = LEVEL_ERROR    # exceção inesperada durante a execução
+
+class RateSampler:
+    """
+    Amostragem determinística: aceita a fração `rate` das chamadas.
+
+    Acumula a fração a cada chamada e aceita quando o acúmulo atinge 1, sem
+    gerar números aleatórios (com rate=0.1, aceita exatamente uma a cada dez).
+    """
+    __slots__ = ('_rate', '_credit')
+
+    def __init__(self, rate: float = 1.0):
+        """
+        Inicializa o amostrador.
+
+        Args:
+            rate (float): Fração aceita, entre 0 e 1.
+
+        Raises:
+            ValueError: Se a fração estiver fora do intervalo.
+        """
+        if not 0 <= rate <= 1:
+            raise ValueError("A taxa de amostragem deve estar entre 0 e 1")
+        self._rate = rate
+        self._credit = 0.0
+
+    @property
+    def rate(self) -> float:
+        """Retorna a fração aceita."""
+        return self._rate
+
+    def accept(self) -> bool:
+        """Decide se a chamada atual entra na amostra."""
+        if self._rate >= 1:
+            return True
+        self._credit += self._rate
+        if self._credit >= 1:
+            self._credit -= 1
+            return True
+        return False
+
+class LogPolicy:
+    """
+    Decide, antes de montar o registro, se uma transação será registrada.
+
+    A decisão usa apenas o desfecho (nível), o tipo, o valor e a conta da
+    transação, na ordem:
+        1. desfechos abaixo de `level` são descartados;
+        2. falhas e erros (nível WARNING ou acima) são sempre registrados;
+        3. transferências com valor a partir de `transfer_threshold` são sempre registradas;
+        4. o limite por conta (`max_records_per_account` a cada `per_seconds`) descarta o excesso;
+        5. os sucessos restantes são amostrados com `success_sample_rate`.
+    """
+
+    def __init__(self, level: int = LEVEL_DEBUG, success_sample_rate: float = 1.0,
+                 transfer_threshold: Decimal = None, max_records_per_account: int = None,
+                 per_seconds: float = 60.0, clock: Callable[[], float] = time.monotonic):
+        """
+        Inicializa a política.
+
+        Args:
+            level (int): Nível mínimo registrado (LEVEL_*).
+            success_sample_rate (float): Fração dos sucessos registrada, entre 0 e 1.
+            transfer_threshold (Decimal, optional): Valor a partir do qual transferências
+                bem-sucedidas são sempre registradas.
+            max_records_per_account (int, optional): Máximo de sucessos registrados por conta
+                a cada `per_seconds` (balde de fichas; None = sem limite).
+            per_seconds (float): Janela do limite por conta, em segundos.
+            clock (Callable[[], float]): Relógio em segundos (substituível em testes).
+
+        Raises:
+            ValueError: Se a taxa de amostragem ou o limite por conta forem inválidos.
+        """
+        if max_records_per_account is not None and (max_records_per_account < 1 or per_seconds <= 0):
+            raise ValueError("O limite de registros por conta deve ser maior que zero")
+        self._level = level
+        self._sampler = RateSampler(success_sample_rate)
+        self._transfer_threshold = transfer_threshold
+        self._max_records_per_account = max_records_per_account
+        self._per_seconds = per_seconds
+        self._clock = clock
+        # Baldes por (agência, número da conta): estáveis entre instâncias e sem ids reaproveitados
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+
+    @property
+    def level(self) -> int:
+        """Retorna o nível mínimo registrado."""
+        return self._level
+
+    def _within_account_rate(self, transaction: Transaction) -> bool:
+        """Consome uma ficha do balde da conta de origem, se houver ficha disponível."""
+        account = transaction.account
+        key = (account.agency_number.agency_number, account.account_number.account_number)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = TokenBucket(self._max_records_per_account, self._per_seconds)
+        now = self._clock()
+        if not bucket.allows(now, None):
+            return False
+        bucket.record(now)
+        return True
+
+    def allows(self, transaction: Transaction, level: int) -> bool:
+        """
+        Indica se a transação deve ser registrada.
+
+        Args:
+            transaction (Transaction): Transação executada.
+            level (int): Nível do desfecho (LEVEL_SUCCESS, LEVEL_FAILURE ou LEVEL_EXCEPTION).
+
+        Returns:
+            bool: True se o registro deve ser montado e entregue aos destinos.
+        """
+        if level < self._level:
+            return False
+        if level >= LEVEL_WARNING:
+            return True
+        threshold = self._transfer_threshold
+        if threshold is not None and transaction.value >= threshold and \
+                getattr(transaction, 'destination_account', None) is not None:
+            return True
+        if self._max_records_per_account is not None and not self._within_account_rate(transaction):
+            return False
+        return self._sampler.accept()
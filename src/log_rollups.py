@@ -0,0 +1,364 @@
+from __future__ import annotations
+
+from bisect import bisect_left
+from typing import Dict, Iterable, List, Optional, Tuple
+import json
+import os
+
+from src.log_encoding import orjson
+from src.log_sinks import DEFAULT_LOG_FILE
+
+# Granularidades dos agregados e duração de cada intervalo, em segundos
+GRANULARITY_MINUTE = 'minute'
+GRANULARITY_HOUR = 'hour'
+GRANULARITY_DAY = 'day'
+GRANULARITIES = (GRANULARITY_MINUTE, GRANULARITY_HOUR, GRANULARITY_DAY)
+BUCKET_SECONDS = {GRANULARITY_MINUTE: 60, GRANULARITY_HOUR: 3600, GRANULARITY_DAY: 86400}
+
+# Limites superiores (em segundos) das faixas do histograma de latência; a última faixa é aberta
+LATENCY_BOUNDS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STATUS_SUCCESS = 'Sucesso'
+ROLLUP_FORMAT_VERSION = 1
+
+_loads = orjson.loads if orjson is not None else json.loads
+
+def bucket_keys(timestamp: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Chaves de minuto, hora e dia de uma data no formato do log.
+
+    As chaves ('YYYY-mm-dd HH:MM', 'YYYY-mm-dd HH:00', 'YYYY-mm-dd') são
+    obtidas por fatiamento do texto, sem conversão para datetime, e ficam
+    em ordem cronológica quando comparadas como texto.
+
+    Args:
+        timestamp (str): Data no formato 'dd/mm/YYYY às HH:MM:SS'.
+
+    Returns:
+        Tuple[str, str, str]: Chaves (minuto, hora, dia), ou None se a data for inválida.
+    """
+    if type(timestamp) is not str or len(timestamp) != 22:
+        return None
+    day = f'{timestamp[6:10]}-{timestamp[3:5]}-{timestamp[0:2]}'
+    hour = timestamp[14:16]
+    return f'{day} {hour}:{timestamp[17:19]}', f'{day} {hour}:00', day
+
+class RollupBucket:
+    """
+    Agregado de um intervalo de tempo: vazão, erros, valor e latência.
+
+    A latência é guardada como soma, máximo e histograma por faixas fixas
+    (LATENCY_BOUNDS), de modo que agregados podem ser somados entre si e os
+    percentis estimados sem guardar as durações individuais.
+    """
+    __slots__ = ('count', 'errors', 'duration_total', 'duration_max', 'value_total', 'histogram')
+
+    def __init__(self):
+        self.count = 0
+        self.errors = 0
+        self.duration_total = 0.0
+        self.duration_max = 0.0
+        self.value_total = 0.0
+        self.histogram = [0] * (len(LATENCY_BOUNDS) + 1)
+
+    def add(self, duration: float, failed: bool, value: float):
+        """
+        Contabiliza uma transação.
+
+        Args:
+            duration (float): Duração em segundos.
+            failed (bool): Se a transação não terminou com sucesso.
+            value (float): Valor da transação.
+        """
+        self.count += 1
+        if failed:
+            self.errors += 1
+        self.duration_total += duration
+        if duration > self.duration_max:
+            self.duration_max = duration
+        self.value_total += value
+        self.histogram[bisect_left(LATENCY_BOUNDS, duration)] += 1
+
+    def merge(self, other: 'RollupBucket'):
+        """Soma outro agregado a este."""
+        self.count += other.count
+        self.errors += other.errors
+        self.duration_total += other.duration_total
+        self.duration_max = max(self.duration_max, other.duration_max)
+        self.value_total += other.value_total
+        self.histogram = [mine + theirs for mine, theirs in zip(self.histogram, other.histogram)]
+
+    @property
+    def error_rate(self) -> float:
+        """Fração das transações que não terminaram com sucesso."""
+        return self.errors / self.count if self.count else 0.0
+
+    @property
+    def mean_duration(self) -> float:
+        """Duração média, em segundos."""
+        return self.duration_total / self.count if self.count else 0.0
+
+    def throughput(self, seconds: float) -> float:
+        """Transações por segundo em um intervalo de `seconds` segundos."""
+        return self.count / seconds
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Estimativa de um percentil da duração pelo histograma.
+
+        Args:
+            fraction (float): Percentil entre 0 e 1.
+
+        Returns:
+            float: Limite superior da faixa que contém o percentil (no máximo,
+                a maior duração observada).
+        """
+        if not self.count:
+            return 0.0
+        target = fraction * self.count
+        cumulative = 0
+        for bound, quantity in zip(LATENCY_BOUNDS, self.histogram):
+            cumulative += quantity
+            if cumulative >= target and cumulative:
+                return min(bound, self.duration_max)
+        return self.duration_max
+
+    def to_list(self) -> list:
+        """Representação compacta usada nos arquivos de agregados."""
+        return [self.count, self.errors, self.duration_total, self.duration_max, self.value_total, self.histogram]
+
+    @classmethod
+    def from_list(cls, data: list) -> 'RollupBucket':
+        """Recria o agregado a partir de `to_list`."""
+        bucket = cls()
+        (bucket.count, bucket.errors, bucket.duration_total, bucket.duration_max,
+         bucket.value_total, histogram) = data
+        bucket.histogram = list(histogram)
+        return bucket
+
+class LogRollups:
+    """
+    Agregados por minuto, hora e dia do log de transações.
+
+    `update` lê apenas as linhas acrescentadas ao log desde a última
+    atualização (a posição lida fica gravada com os agregados), em uma única
+    passagem que alimenta as três granularidades. Os agregados ficam em
+    arquivos ao lado do log (`log.txt.rollup-minute.json` etc.), de modo que
+    relatórios históricos não precisam reler as linhas do log.
+
+    Se o log encolher (rotacionado ou truncado), os agregados são refeitos.
+    """
+
+    def __init__(self, log_path: str = DEFAULT_LOG_FILE, granularities: Iterable[str] = GRANULARITIES):
+        """
+        Inicializa os agregados (vazios até `load` ou `update`).
+
+        Args:
+            log_path (str): Caminho do log de transações.
+            granularities (Iterable[str]): Granularidades mantidas (GRANULARITY_*).
+
+        Raises:
+            ValueError: Se alguma granularidade for inválida.
+        """
+        granularities = tuple(granularities)
+        for granularity in granularities:
+            if granularity not in GRANULARITIES:
+                raise ValueError(f"Granularidade inválida. Granularidades válidas: {list(GRANULARITIES)}")
+        self._log_path = log_path
+        self._granularities = granularities
+        self._buckets: Dict[str, Dict[str, RollupBucket]] = {granularity: {} for granularity in granularities}
+        self._offset = 0
+        self._loaded = False
+        self._invalid_lines = 0
+
+    @property
+    def log_path(self) -> str:
+        """Retorna o caminho do log agregado."""
+        return self._log_path
+
+    @property
+    def offset(self) -> int:
+        """Retorna a posição (em bytes) do log já agregada."""
+        return self._offset
+
+    @property
+    def invalid_lines(self) -> int:
+        """Retorna o número de linhas inválidas ignoradas desde a criação."""
+        return self._invalid_lines
+
+    def rollup_path(self, granularity: str) -> str:
+        """Caminho do arquivo de agregados de uma granularidade (ao lado do log)."""
+        return f'{self._log_path}.rollup-{granularity}.json'
+
+    def _reset(self):
+        """Descarta os agregados em memória."""
+        self._buckets = {granularity: {} for granularity in self._granularities}
+        self._offset = 0
+
+    def load(self) -> bool:
+        """
+        Carrega os agregados gravados.
+
+        Os arquivos só são aceitos se todas as granularidades existirem e
+        registrarem a mesma posição do log; caso contrário, os agregados
+        começam vazios e o próximo `update` relê o log desde o início.
+
+        Returns:
+            bool: True se os agregados gravados foram carregados.
+        """
+        self._loaded = True
+        self._reset()
+        offsets = set()
+        buckets = {}
+        try:
+            for granularity in self._granularities:
+                with open(self.rollup_path(granularity), 'r', encoding='utf-8') as rollup_file:
+                    header = json.loads(rollup_file.readline())
+                    if header.get('version') != ROLLUP_FORMAT_VERSION or header.get('granularity') != granularity:
+                        return False
+                    offsets.add(header['offset'])
+                    buckets[granularity] = {
+                        key: RollupBucket.from_list(data)
+                        for key, data in (json.loads(line) for line in rollup_file if line.strip())
+                    }
+        except (OSError, ValueError, KeyError, TypeError):
+            return False
+        if len(offsets) != 1:
+            return False
+        self._buckets = buckets
+        self._offset = offsets.pop()
+        return True
+
+    def save(self):
+        """
+        Grava os agregados, um arquivo por granularidade.
+
+        Cada arquivo é escrito em um temporário e renomeado, para que leitores
+        nunca vejam um arquivo pela metade.
+        """
+        for granularity in self._granularities:
+            path = self.rollup_path(granularity)
+            temporary = f'{path}.tmp'
+            with open(temporary, 'w', encoding='utf-8') as rollup_file:
+                rollup_file.write(json.dumps({'version': ROLLUP_FORMAT_VERSION, 'granularity': granularity,
+                                              'offset': self._offset}) + '\n')
+                for key in sorted(self._buckets[granularity]):
+                    rollup_file.write(json.dumps([key, self._buckets[granularity][key].to_list()]) + '\n')
+            os.replace(temporary, path)
+
+    def update(self, save: bool = True) -> int:
+        """
+        Agrega as linhas acrescentadas ao log desde a última atualização.
+
+        Linhas incompletas no fim do arquivo (ainda sendo escritas) ficam para
+        a próxima atualização.
+
+        Args:
+            save (bool): Se os agregados devem ser gravados ao final.
+
+        Returns:
+            int: Número de transações agregadas nesta atualização.
+
+        Raises:
+            FileNotFoundError: Se o log não existir.
+        """
+        if not self._loaded:
+            self.load()
+        if os.path.getsize(self._log_path) < self._offset:
+            self._reset()
+
+        minutes = self._buckets.get(GRANULARITY_MINUTE)
+        hours = self._buckets.get(GRANULARITY_HOUR)
+        days = self._buckets.get(GRANULARITY_DAY)
+        offset = self._offset
+        processed = 0
+        last_timestamp = None
+        current = ()
+
+        with open(self._log_path, 'rb') as log_file:
+            log_file.seek(offset)
+            for line in log_file:
+                if not line.endswith(b'\n'):
+                    break
+                offset += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    record = _loads(line)
+                    timestamp = record['timestamp']
+                    if timestamp != last_timestamp:
+                        # Transações do mesmo segundo reaproveitam os agregados já localizados
+                        keys = bucket_keys(timestamp)
+                        if keys is None:
+                            raise ValueError(timestamp)
+                        current = []
+                        for buckets, key in ((minutes, keys[0]), (hours, keys[1]), (days, keys[2])):
+                            if buckets is not None:
+                                bucket = buckets.get(key)
+                                if bucket is None:
+                                    bucket = buckets[key] = RollupBucket()
+                                current.append(bucket)
+                        last_timestamp = timestamp
+                    duration = float(record.get('duration_seconds') or 0.0)
+                    failed = record.get('status') != STATUS_SUCCESS
+                    value = float(record.get('transaction_value') or 0.0)
+                except (ValueError, KeyError, TypeError):
+                    self._invalid_lines += 1
+                    continue
+                for bucket in current:
+                    bucket.add(duration, failed, value)
+                processed += 1
+
+        self._offset = offset
+        if save:
+            self.save()
+        return processed
+
+    def rebuild(self, save: bool = True) -> int:
+        """
+        Descarta os agregados e relê o log inteiro.
+
+        Returns:
+            int: Número de transações agregadas.
+        """
+        self._loaded = True
+        self._reset()
+        return self.update(save)
+
+    def series(self, granularity: str, start: str = None, end: str = None) -> List[Tuple[str, RollupBucket]]:
+        """
+        Agregados de uma granularidade em ordem cronológica.
+
+        Args:
+            granularity (str): GRANULARITY_MINUTE, GRANULARITY_HOUR ou GRANULARITY_DAY.
+            start (str, optional): Primeira chave incluída (ex.: '2025-08-31 08:00').
+            end (str, optional): Última chave incluída.
+
+        Returns:
+            List[Tuple[str, RollupBucket]]: Pares (chave, agregado).
+
+        Raises:
+            ValueError: Se a granularidade não for mantida por estes agregados.
+        """
+        if granularity not in self._buckets:
+            raise ValueError(f"Granularidade não mantida. Granularidades: {list(self._granularities)}")
+        buckets = self._buckets[granularity]
+        return [(key, buckets[key]) for key in sorted(buckets)
+                if (start is None or key >= start) and (end is None or key <= end)]
+
+def load_rollups(log_path: str = DEFAULT_LOG_FILE) -> LogRollups:
+    """
+    Carrega os agregados gravados ao lado do log e agrega as linhas novas.
+
+    Args:
+        log_path (str): Caminho do log de transações.
+
+    Returns:
+        LogRollups: Agregados atualizados.
+
+    Raises:
+        FileNotFoundError: Se o log não existir.
+    """
+    rollups = LogRollups(log_path)
+    rollups.update()
+    return rollups
@@ -0,0 +1,557 @@
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from collections import deque
+from typing import Callable, Deque, Iterable, List
+import json
+import os
+import socket
+import sys
+import threading
+
+from src.log_encoding import fast_json_serializer
+from src.log_policy import LEVEL_SUCCESS, LogPolicy, RateSampler
+
+DEFAULT_LOG_FILE = 'log.txt'
+DEFAULT_RING_CAPACITY = 10_000
+DEFAULT_ROTATE_BYTES = 10 * 1024 * 1024
+DEFAULT_BACKUP_COUNT = 5
+DEFAULT_SYSLOG_PATH = '/dev/log'
+
+# Facilidade e severidades no formato do syslog (RFC 3164)
+SYSLOG_FACILITY_LOCAL0 = 16
+SYSLOG_SEVERITY_ERROR = 3
+SYSLOG_SEVERITY_INFO = 6
+
+Serializer = Callable[[dict], str]
+
+def json_serializer(record: dict) -> str:
+    """
+    Serializa o registro com json.dumps, no formato histórico do log.txt.
+
+    Os destinos usam por padrão o `fast_json_serializer` (src.log_encoding),
+    que produz JSON equivalente com menor custo.
+    """
+    return json.dumps(record, ensure_ascii=False)
+
+def compact_json_serializer(record: dict) -> str:
+    """Serializa o registro como JSON sem espaços entre os separadores."""
+    return json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+
+def key_value_serializer(record: dict) -> str:
+    """Serializa os campos de primeiro nível como `chave=valor` (estilo syslog)."""
+    return ' '.join(f"{key}={json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value}"
+                    for key, value in record.items())
+
+class LogSink(ABC):
+    """
+    Destino de registros de log.
+
+    Cada destino tem seu próprio serializador e taxa de amostragem: com
+    `sample_rate=0.1`, apenas um a cada dez registros é serializado e
+    gravado. A amostragem é determinística (acúmulo de frações), sem custo
+    de geração de números aleatórios.
+
+    Classe abstrata: subclasses implementam `emit(line)`.
+    """
+
+    def __init__(self, serializer: Serializer = fast_json_serializer, sample_rate: float = 1.0):
+        """
+        Inicializa o destino.
+
+        Args:
+            serializer (Serializer): Converte o registro (dict) em texto.
+            sample_rate (float): Fração dos registros gravados, entre 0 e 1.
+
+        Raises:
+            ValueError: Se a taxa de amostragem estiver fora do intervalo.
+        """
+        self._serializer = serializer
+        self._sampler = RateSampler(sample_rate)
+        self._written = 0
+        self._skipped = 0
+        self._errors = 0
+
+    @property
+    def serializer(self) -> Serializer:
+        """Retorna o serializador do destino."""
+        return self._serializer
+
+    @property
+    def sample_rate(self) -> float:
+        """Retorna a fração dos registros gravados."""
+        return self._sampler.rate
+
+    @property
+    def written(self) -> int:
+        """Retorna o número de registros gravados."""
+        return self._written
+
+    @property
+    def skipped(self) -> int:
+        """Retorna o número de registros descartados pela amostragem."""
+        return self._skipped
+
+    @property
+    def errors(self) -> int:
+        """Retorna o número de falhas de gravação."""
+        return self._errors
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se o destino grava algum registro."""
+        return self._sampler.rate > 0
+
+    def handle(self, record: dict):
+        """
+        Serializa e grava o registro, se ele entrar na amostra.
+
+        Falhas de gravação não interrompem a transação: são contabilizadas em
+        `errors` e avisadas na saída de erro.
+
+        Args:
+            record (dict): Registro montado pelo transaction_logger.
+        """
+        if not self._sampler.accept():
+            self._skipped += 1
+            return
+        try:
+            self.emit(self._serializer(record))
+            self._written += 1
+        except (OSError, ValueError, TypeError) as error:
+            self._errors += 1
+            print(f"⚠️  Erro ao salvar log em {type(self).__name__}: {error}", file=sys.stderr)
+
+    @abstractmethod
+    def emit(self, line: str):
+        """Grava uma linha já serializada."""
+        pass
+
+    def flush(self):
+        """Garante que as linhas aceitas foram gravadas."""
+
+    def close(self):
+        """Libera os recursos do destino."""
+        self.flush()
+
+class NullSink(LogSink):
+    """Descarta todos os registros (desliga o log sem alterar o código das transações)."""
+
+    def __init__(self):
+        super().__init__(sample_rate=0)
+
+    def emit(self, line: str):
+        """Não grava nada."""
+
+class ConsoleSink(LogSink):
+    """Escreve os registros na saída padrão (ou em outro fluxo de texto)."""
+
+    def __init__(self, stream=None, serializer: Serializer = fast_json_serializer, sample_rate: float = 1.0):
+        """
+        Inicializa o destino.
+
+        Args:
+            stream (TextIO, optional): Fluxo de saída (padrão: sys.stdout no momento da escrita).
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+        """
+        super().__init__(serializer, sample_rate)
+        self._stream = stream
+
+    def emit(self, line: str):
+        """Escreve a linha no fluxo."""
+        print(line, file=self._stream or sys.stdout)
+
+class FileSink(LogSink):
+    """
+    Acrescenta cada registro a um arquivo de texto, de forma síncrona.
+
+    O arquivo é aberto a cada gravação e um caminho relativo é resolvido no
+    diretório atual, como o log.txt sempre foi gravado.
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_FILE, serializer: Serializer = fast_json_serializer,
+                 sample_rate: float = 1.0):
+        """
+        Inicializa o destino.
+
+        Args:
+            path (str): Caminho do arquivo de log.
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+        """
+        super().__init__(serializer, sample_rate)
+        self._path = path
+
+    @property
+    def path(self) -> str:
+        """Retorna o caminho do arquivo de log."""
+        return self._path
+
+    def emit(self, line: str):
+        """Acrescenta a linha ao arquivo."""
+        with open(self._path, 'a', encoding='utf-8') as log_file:
+            log_file.write(line + '\n')
+
+class RotatingFileSink(FileSink):
+    """
+    Arquivo de log com rotação por tamanho.
+
+    Ao ultrapassar `max_bytes`, o arquivo atual passa a `<arquivo>.1`, o
+    `.1` passa a `.2` e assim por diante, mantendo até `backup_count` cópias.
+    O arquivo fica aberto entre as gravações.
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_FILE, max_bytes: int = DEFAULT_ROTATE_BYTES,
+                 backup_count: int = DEFAULT_BACKUP_COUNT, serializer: Serializer = fast_json_serializer,
+                 sample_rate: float = 1.0):
+        """
+        Inicializa o destino.
+
+        Args:
+            path (str): Caminho do arquivo de log.
+            max_bytes (int): Tamanho a partir do qual o arquivo é rotacionado.
+            backup_count (int): Número de arquivos antigos mantidos (0 = apenas trunca).
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+
+        Raises:
+            ValueError: Se o tamanho ou o número de cópias forem inválidos.
+        """
+        if max_bytes < 1 or backup_count < 0:
+            raise ValueError("Parâmetros de rotação inválidos")
+        super().__init__(os.path.abspath(path), serializer, sample_rate)
+        self._max_bytes = max_bytes
+        self._backup_count = backup_count
+        self._file = None
+        self._size = 0
+
+    def _open(self):
+        """Abre o arquivo atual para acréscimo."""
+        self._file = open(self._path, 'a', encoding='utf-8')
+        self._size = self._file.tell()
+
+    def _rotate(self):
+        """Fecha o arquivo atual e desloca as cópias antigas."""
+        self._file.close()
+        for index in range(self._backup_count - 1, 0, -1):
+            source = f"{self._path}.{index}"
+            if os.path.exists(source):
+                os.replace(source, f"{self._path}.{index + 1}")
+        if self._backup_count:
+            os.replace(self._path, f"{self._path}.1")
+        else:
+            os.remove(self._path)
+        self._open()
+
+    def emit(self, line: str):
+        """Grava a linha, rotacionando o arquivo quando necessário."""
+        if self._file is None:
+            self._open()
+        data = line + '\n'
+        size = len(data.encode('utf-8'))
+        if self._size and self._size + size > self._max_bytes:
+            self._rotate()
+        self._file.write(data)
+        self._size += size
+
+    def flush(self):
+        """Descarrega o buffer do arquivo."""
+        if self._file is not None:
+            self._file.flush()
+
+    def close(self):
+        """Fecha o arquivo."""
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+class AsyncFileSink(FileSink):
+    """
+    Arquivo de log gravado em segundo plano.
+
+    A transação apenas enfileira a linha; uma thread grava as linhas em
+    lotes, com uma única chamada de escrita por lote. `flush` aguarda a
+    fila esvaziar e `close` encerra a thread.
+    """
+
+    def __init__(self, path: str = DEFAULT_LOG_FILE, batch_size: int = 512, flush_interval: float = 0.2,
+                 serializer: Serializer = fast_json_serializer, sample_rate: float = 1.0):
+        """
+        Inicializa o destino e inicia a thread de gravação.
+
+        Args:
+            path (str): Caminho do arquivo de log (resolvido no diretório atual da criação).
+            batch_size (int): Máximo de linhas gravadas por escrita.
+            flush_interval (float): Espera máxima, em segundos, antes de gravar um lote incompleto.
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+        """
+        super().__init__(os.path.abspath(path), serializer, sample_rate)
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._pending: Deque[str] = deque()
+        self._condition = threading.Condition()
+        self._writing = False
+        self._flush_requested = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='async-log-sink', daemon=True)
+        self._thread.start()
+
+    def emit(self, line: str):
+        """Enfileira a linha para gravação."""
+        with self._condition:
+            if self._closed:
+                raise ValueError("Destino de log encerrado")
+            self._pending.append(line)
+            if len(self._pending) >= self._batch_size:
+                self._condition.notify_all()
+
+    def _run(self):
+        """Laço da thread de gravação."""
+        try:
+            log_file = open(self._path, 'a', encoding='utf-8')
+        except OSError as error:
+            self._errors += 1
+            print(f"⚠️  Erro ao salvar log em {type(self).__name__}: {error}", file=sys.stderr)
+            with self._condition:
+                self._closed = True
+                self._pending.clear()
+                self._condition.notify_all()
+            return
+        with log_file:
+            while True:
+                with self._condition:
+                    self._condition.wait_for(lambda: self._closed or self._flush_requested or
+                                             len(self._pending) >= self._batch_size, self._flush_interval)
+                    if not self._pending:
+                        self._flush_requested = False
+                        self._condition.notify_all()
+                        if self._closed:
+                            return
+                        continue
+                    count = min(len(self._pending), self._batch_size)
+                    batch = [self._pending.popleft() for _ in range(count)]
+                    self._writing = True
+                try:
+                    log_file.write('\n'.join(batch) + '\n')
+                    log_file.flush()
+                except OSError as error:
+                    self._errors += 1
+                    print(f"⚠️  Erro ao salvar log em {type(self).__name__}: {error}", file=sys.stderr)
+                with self._condition:
+                    self._writing = False
+                    self._condition.notify_all()
+
+    def flush(self):
+        """Aguarda a gravação de todas as linhas enfileiradas."""
+        with self._condition:
+            self._flush_requested = True
+            self._condition.notify_all()
+            self._condition.wait_for(lambda: self._closed or (not self._pending and not self._writing))
+
+    def close(self):
+        """Grava as linhas pendentes e encerra a thread."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+class RingBufferSink(LogSink):
+    """
+    Mantém em memória os últimos `capacity` registros (útil em testes).
+    """
+
+    def __init__(self, capacity: int = DEFAULT_RING_CAPACITY, serializer: Serializer = fast_json_serializer,
+                 sample_rate: float = 1.0):
+        """
+        Inicializa o destino.
+
+        Args:
+            capacity (int): Número máximo de linhas mantidas (as mais antigas são descartadas).
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+        """
+        super().__init__(serializer, sample_rate)
+        self._lines: Deque[str] = deque(maxlen=capacity)
+
+    @property
+    def lines(self) -> List[str]:
+        """Retorna as linhas mantidas, da mais antiga para a mais recente."""
+        return list(self._lines)
+
+    def records(self) -> List[dict]:
+        """Retorna as linhas mantidas decodificadas como JSON."""
+        return [json.loads(line) for line in self._lines]
+
+    def emit(self, line: str):
+        """Guarda a linha na memória."""
+        self._lines.append(line)
+
+    def clear(self):
+        """Esquece as linhas mantidas."""
+        self._lines.clear()
+
+class SyslogSocketSink(LogSink):
+    """
+    Envia os registros a um socket Unix de datagramas no formato do syslog
+    (`<prioridade>identificador: mensagem`), como o /dev/log local.
+
+    Sem serviço escutando, os registros são descartados e contabilizados em
+    `errors`, sem interromper as transações.
+    """
+
+    def __init__(self, path: str = DEFAULT_SYSLOG_PATH, ident: str = 'banco',
+                 facility: int = SYSLOG_FACILITY_LOCAL0, serializer: Serializer = compact_json_serializer,
+                 sample_rate: float = 1.0):
+        """
+        Inicializa o destino (o socket é aberto no primeiro envio).
+
+        Args:
+            path (str): Caminho do socket de datagramas.
+            ident (str): Identificador do programa nas mensagens.
+            facility (int): Facilidade do syslog (padrão: local0).
+            serializer (Serializer): Converte o registro em texto.
+            sample_rate (float): Fração dos registros gravados.
+        """
+        super().__init__(serializer, sample_rate)
+        self._path = path
+        self._ident = ident
+        self._facility = facility
+        self._severity = SYSLOG_SEVERITY_INFO
+        self._socket = None
+
+    def handle(self, record: dict):
+        """Grava o registro com severidade de erro quando a transação não foi bem-sucedida."""
+        self._severity = SYSLOG_SEVERITY_INFO if record.get('status') == 'Sucesso' else SYSLOG_SEVERITY_ERROR
+        super().handle(record)
+
+    def emit(self, line: str):
+        """Envia a linha como um datagrama."""
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_DGRAM)
+        priority = self._facility * 8 + self._severity
+        self._socket.sendto(f"<{priority}>{self._ident}: {line}".encode('utf-8'), self._path)
+
+    def close(self):
+        """Fecha o socket."""
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+class LogPipeline:
+    """
+    Conjunto de destinos que recebem cada registro do transaction_logger.
+
+    Quando nenhum destino está ativo (lista vazia ou apenas NullSink), o
+    decorador nem chega a montar o registro. A política de log (LogPolicy),
+    se configurada, é consultada pelo decorador antes da montagem.
+    """
+
+    def __init__(self, sinks: Iterable[LogSink] = (), policy: LogPolicy = None):
+        """
+        Inicializa o pipeline.
+
+        Args:
+            sinks (Iterable[LogSink]): Destinos iniciais.
+            policy (LogPolicy, optional): Política de níveis e amostragem (None registra tudo).
+        """
+        self._sinks: List[LogSink] = []
+        self._enabled = False
+        self._policy = policy
+        self._filtered = 0
+        for sink in sinks:
+            self.add_sink(sink)
+
+    @property
+    def sinks(self) -> List[LogSink]:
+        """Retorna uma cópia da lista de destinos."""
+        return list(self._sinks)
+
+    @property
+    def enabled(self) -> bool:
+        """Indica se algum destino grava registros."""
+        return self._enabled
+
+    @property
+    def policy(self) -> LogPolicy:
+        """Retorna a política de log (None registra todas as transações)."""
+        return self._policy
+
+    @policy.setter
+    def policy(self, policy: LogPolicy):
+        """Substitui a política de log."""
+        self._policy = policy
+
+    @property
+    def filtered(self) -> int:
+        """Retorna o número de transações descartadas pela política antes da montagem do registro."""
+        return self._filtered
+
+    def should_log(self, transaction, level: int = LEVEL_SUCCESS) -> bool:
+        """
+        Indica se o registro da transação deve ser montado.
+
+        Args:
+            transaction (Transaction): Transação executada.
+            level (int): Nível do desfecho (LEVEL_*).
+
+        Returns:
+            bool: True se há destinos ativos e a política aceita a transação.
+        """
+        if not self._enabled:
+            return False
+        policy = self._policy
+        if policy is None or policy.allows(transaction, level):
+            return True
+        self._filtered += 1
+        return False
+
+    def _refresh(self):
+        """Atualiza o indicador usado pelo decorador para pular a montagem do registro."""
+        self._enabled = any(sink.enabled for sink in self._sinks)
+
+    def add_sink(self, sink: LogSink) -> LogSink:
+        """Acrescenta um destino e o devolve."""
+        self._sinks.append(sink)
+        self._refresh()
+        return sink
+
+    def remove_sink(self, sink: LogSink):
+        """Remove um destino (sem fechá-lo)."""
+        if sink in self._sinks:
+            self._sinks.remove(sink)
+        self._refresh()
+
+    def configure(self, sinks: Iterable[LogSink]) -> List[LogSink]:
+        """
+        Substitui os destinos, fechando os anteriores.
+
+        Returns:
+            List[LogSink]: Destinos anteriores (já fechados).
+        """
+        previous = self._sinks
+        self._sinks = list(sinks)
+        self._refresh()
+        for sink in previous:
+            if sink not in self._sinks:
+                sink.close()
+        return previous
+
+    def emit(self, record: dict):
+        """Entrega o registro a todos os destinos."""
+        for sink in self._sinks:
+            sink.handle(record)
+
+    def flush(self):
+        """Descarrega todos os destinos."""
+        for sink in self._sinks:
+            sink.flush()
+
+    def close(self):
+        """Fecha todos os destinos."""
+        for sink in self._sinks:
+            sink.close()
+
+# Pipeline usado pelo transaction_logger; por padrão grava log.txt no diretório atual
+log_pipeline = LogPipeline([FileSink(DEFAULT_LOG_FILE)])
@@ -0,0 +1,113 @@
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Dict, Tuple
+import time
+
+from src.decorators import (STAGE_PRESENTATION, register_transaction_hook, transaction_stage,
+                            unregister_transaction_hook)
+from src.entities import TransactionResult
+from src.Utils import round_decimal, clear_cmd_line
+
+DEFAULT_DECIMAL_PLACES = 2
+TIMESTAMP_FORMAT = '%d/%m/%Y às %H:%M:%S'
+
+# Textos por tipo de transação: (processamento, sucesso)
+MESSAGES: Dict[str, Tuple[str, str]] = {
+    'Deposit': ('Processando o depósito... Aguarde um momento!', 'O valor foi depositado com sucesso!'),
+    'Withdraw': ('Processando o saque... Aguarde um momento!', 'Saque realizado com sucesso!'),
+    'Transfer': ('Processando a transferência... Aguarde um momento!', 'Transferência realizada com sucesso!')
+}
+DEFAULT_MESSAGES = ('Processando... Aguarde um momento!', 'Operação realizada com sucesso!')
+
+def format_result(result: TransactionResult) -> str:
+    """
+    Descrição legível do resultado de uma transação.
+
+    Args:
+        result (TransactionResult): Resultado a descrever.
+
+    Returns:
+        str: Mensagem de falha ou o saldo após a operação.
+    """
+    if not result:
+        return result.message
+    return f"O seu saldo atual é de: R$ {round_decimal(result.balance, DEFAULT_DECIMAL_PLACES)}"
+
+class ConsolePresenter:
+    """
+    Exibe no console o andamento das transações do menu interativo.
+
+    É instalado como um conjunto de hooks de transação (como o
+    ProfilingSampler); enquanto não estiver instalado, as transações não
+    escrevem nada no console. O tempo gasto na exibição é medido no estágio
+    STAGE_PRESENTATION.
+    """
+
+    def install(self) -> 'ConsolePresenter':
+        """Registra o apresentador nos hooks de transação."""
+        register_transaction_hook(before=self._before, after=self._after, error=self._error)
+        return self
+
+    def uninstall(self) -> None:
+        """Remove o apresentador dos hooks de transação."""
+        unregister_transaction_hook(before=self._before, after=self._after, error=self._error)
+
+    def _before(self, transaction: Any) -> None:
+        with transaction_stage(transaction, STAGE_PRESENTATION):
+            self._show_start(transaction)
+
+    def _show_start(self, transaction: Any) -> None:
+        """Exibe o cabeçalho da transação e a mensagem de processamento."""
+        transaction_type = type(transaction).__name__
+        print(f"\n{'='*60}")
+        print(f"🕐 INÍCIO DA TRANSAÇÃO: {transaction_type}")
+        print(f"📅 Data/Hora: {transaction._timestamp.strftime(TIMESTAMP_FORMAT)}")
+        print(f"💰 Valor: R$ {transaction.value}")
+        print(f"🏦 Conta: {transaction.account.account_number}")
+        print(f"👤 Cliente: {transaction.account.client.name}")
+
+        # Para transferências, mostra informações da conta de destino
+        destination = getattr(transaction, 'destination_account', None)
+        if destination is not None:
+            print(f"🎯 Conta Destino: {destination.account_number}")
+            print(f"👤 Cliente Destino: {destination.client.name}")
+        print(f"{'='*60}")
+
+        processing, _ = MESSAGES.get(transaction_type, DEFAULT_MESSAGES)
+        print(processing, end='', flush=True)
+
+    def _finish(self, transaction: Any, title: str, status: str) -> None:
+        """Exibe o rodapé da transação com a duração e a situação final."""
+        end_time = datetime.now()
+        duration = end_time - transaction._timestamp
+        print(f"\n{'='*60}")
+        print(title)
+        print(f"📅 Data/Hora: {end_time.strftime(TIMESTAMP_FORMAT)}")
+        print(f"⏱️  Duração: {duration.total_seconds():.2f} segundos")
+        print(status)
+        print(f"{'='*60}\n")
+
+    def _after(self, transaction: Any, result: TransactionResult, stages: Dict[str, float]) -> None:
+        with transaction_stage(transaction, STAGE_PRESENTATION):
+            self._show_result(transaction, result)
+
+    def _show_result(self, transaction: Any, result: TransactionResult) -> None:
+        """Exibe a conclusão da transação (mensagem de sucesso ou de falha)."""
+        transaction_type = type(transaction).__name__
+        processing, success = MESSAGES.get(transaction_type, DEFAULT_MESSAGES)
+        if result:
+            time.sleep(transaction.processing_waiting_time_in_seconds)
+        clear_cmd_line(len(processing))
+        if result:
+            print(success)
+            print(format_result(result))
+        self._finish(transaction, f"✅ TRANSAÇÃO CONCLUÍDA: {transaction_type}",
+                     f"🎯 Status: {'Sucesso' if result else 'Falha'}")
+
+    def _error(self, transaction: Any, error: Exception, stages: Dict[str, float]) -> None:
+        transaction_type = type(transaction).__name__
+        processing, _ = MESSAGES.get(transaction_type, DEFAULT_MESSAGES)
+        with transaction_stage(transaction, STAGE_PRESENTATION):
+            clear_cmd_line(len(processing))
+            self._finish(transaction, f"❌ ERRO NA TRANSAÇÃO: {transaction_type}", f"🚨 Erro: {error}")
@@ -0,0 +1,340 @@
+#!/usr/bin/env python3
+"""
+Réplica somente leitura do Bank, alimentada pelos eventos do CDC.
+
+Um processo seguidor aplica, em ordem, os eventos gravados por um FileSink
+(acompanhando o arquivo) ou enviados por um UnixSocketSink (escutando o
+socket). Consultas pesadas, extratos e listagens podem então ser atendidos
+pela réplica sem disputar o processo que executa as transações.
+
+Uso:
+    python -m src.replica --file cdc.jsonl
+    python -m src.replica --socket /tmp/banco-cdc.sock --report-interval 5
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from typing import Dict, Iterable, List, Tuple
+import argparse
+import os
+import socket
+import sys
+import threading
+import time
+
+from src.Bank import Bank
+from src.cdc import (ACCOUNT_CREATED, BALANCE_CHANGED, CLIENT_REGISTERED, TRANSACTION_APPENDED,
+                     ChangeEvent, decode_event)
+from src.entities import (Account, AccountNumber, Address, AgencyNumber, CPF, Client, DateOfBirth,
+                          Deposit, Transfer, Withdraw)
+
+READ_ONLY_MESSAGE = "Réplica somente leitura: operações devem ser feitas no banco principal"
+
+class ReadOnlyAccount(Account):
+    """
+    Conta mantida por uma réplica.
+
+    Saldo e histórico são alterados apenas pela aplicação de eventos;
+    depósitos, saques e transferências são recusados.
+    """
+
+    def withdraw(self, value: Decimal, idempotency_key: str = None) -> Decimal:
+        """Recusa o saque (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def deposit(self, value: Decimal, idempotency_key: str = None):
+        """Recusa o depósito (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def transfer(self, value: Decimal, account_of_receipt: Account, idempotency_key: str = None) -> bool:
+        """Recusa a transferência (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+class ReplicaBank(Bank):
+    """
+    Banco seguidor que reproduz as alterações do banco principal.
+
+    Os eventos devem ser aplicados na ordem de publicação; eventos já
+    aplicados (sequência repetida) são ignorados, o que permite reprocessar
+    um arquivo desde o início. Cadastros e operações diretas são recusados.
+    """
+
+    def __init__(self, strict: bool = True):
+        """
+        Inicializa a réplica vazia.
+
+        Args:
+            strict (bool): Se True, uma lacuna na sequência de eventos (ex.: eventos
+                descartados pelo buffer do CDC) interrompe a aplicação com ValueError;
+                se False, a lacuna é contabilizada em `gaps`.
+        """
+        super().__init__()
+        self._strict = strict
+        self._last_sequence = 0
+        self._gaps = 0
+        self._accounts_by_key: Dict[Tuple[str, str], Account] = {}
+        self._clients_by_cpf: Dict[str, Client] = {}
+        self._file_offset = 0
+        self._apply_lock = threading.Lock()
+
+    @property
+    def last_sequence(self) -> int:
+        """Retorna a sequência do último evento aplicado."""
+        return self._last_sequence
+
+    @property
+    def gaps(self) -> int:
+        """Retorna o número de lacunas encontradas na sequência de eventos."""
+        return self._gaps
+
+    def register_client(self, client: Client) -> bool:
+        """Recusa o cadastro (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def register_account(self, client: Client, account: Account):
+        """Recusa o cadastro (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def create_account(self, client: Client, agency_number: AgencyNumber = None) -> bool:
+        """Recusa a criação de conta (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def create_checking_account(self, client: Client, agency_number: AgencyNumber = None) -> bool:
+        """Recusa a criação de conta (réplica somente leitura)."""
+        raise ValueError(READ_ONLY_MESSAGE)
+
+    def _find_account(self, account: str, agency: str) -> Account:
+        """Localiza uma conta replicada pelo número e agência formatados."""
+        try:
+            return self._accounts_by_key[(account, agency)]
+        except KeyError:
+            raise ValueError(f"Conta {account} da agência {agency} não existe na réplica")
+
+    def _apply_client_registered(self, data: dict):
+        """Cria o cliente replicado."""
+        client = Client(
+            name=data['name'],
+            cpf=CPF(data['cpf']),
+            date_of_birth=DateOfBirth(data['date_of_birth']),
+            address=Address(data['street'], data['number'], data['district'], data['city'], data['state'])
+        )
+        self._clients_by_cpf[str(client.cpf)] = client
+        self.clients.append(client)
+        for observer in self._observers:
+            observer.client_registered(client)
+
+    def _apply_account_created(self, data: dict):
+        """Cria a conta replicada com o saldo informado e a indexa."""
+        client = self._clients_by_cpf.get(data['cpf'])
+        if client is None:
+            raise ValueError(f"Cliente {data['cpf']} não existe na réplica")
+        account = ReadOnlyAccount(AccountNumber(data['account']), AgencyNumber(data['agency']), client)
+        account.balance = Decimal(data['balance'])
+        client.add_account(account=account)
+        self._accounts_by_key[(data['account'], data['agency'])] = account
+        self.accounts.append(account)
+        for observer in self._observers:
+            observer.account_registered(account)
+        self._index_account(account)
+
+    def _apply_balance_changed(self, data: dict):
+        """Ajusta o saldo da conta para o valor publicado."""
+        account = self._find_account(data['account'], data['agency'])
+        # add_balance mantém o índice de saldo e notifica os observadores da réplica
+        account.add_balance(Decimal(data['balance']) - account.balance)
+
+    def _apply_transaction_appended(self, data: dict):
+        """Registra a transação no histórico das contas envolvidas, sem executá-la."""
+        account = self._find_account(data['account'], data['agency'])
+        value = Decimal(data['value'])
+        kind = data['kind']
+        destination = None
+        if kind == 'deposit':
+            transaction = Deposit(account, value)
+        elif kind == 'withdraw':
+            transaction = Withdraw(account, value)
+        elif kind == 'transfer':
+            destination = self._accounts_by_key.get((data['destination_account'], data['destination_agency']))
+            transaction = Transfer(account, destination, value)
+        else:
+            raise ValueError(f"Tipo de transação desconhecido: {kind}")
+        if data['at'] is not None:
+            transaction._timestamp = datetime.fromtimestamp(data['at'])
+        # A chave volta ao cache de idempotência do livro-razão da réplica
+        transaction.idempotency_key = data.get('idempotency_key')
+
+        account.add_transaction(transaction)
+        if destination is not None:
+            destination.add_transaction(transaction)
+
+    def apply(self, event: ChangeEvent) -> bool:
+        """
+        Aplica um evento do CDC.
+
+        Args:
+            event (ChangeEvent): Evento a aplicar.
+
+        Raises:
+            ValueError: Se o evento referenciar dados inexistentes ou, no modo
+                estrito, se houver lacuna na sequência.
+
+        Returns:
+            bool: True se aplicado, False se já havia sido aplicado antes.
+        """
+        with self._apply_lock:
+            if event.sequence <= self._last_sequence:
+                return False
+            if event.sequence != self._last_sequence + 1:
+                if self._strict:
+                    raise ValueError(f"Lacuna na replicação: esperado evento {self._last_sequence + 1}, "
+                                     f"recebido {event.sequence}")
+                self._gaps += 1
+
+            if event.type == CLIENT_REGISTERED:
+                self._apply_client_registered(event.data)
+            elif event.type == ACCOUNT_CREATED:
+                self._apply_account_created(event.data)
+            elif event.type == BALANCE_CHANGED:
+                self._apply_balance_changed(event.data)
+            elif event.type == TRANSACTION_APPENDED:
+                self._apply_transaction_appended(event.data)
+            self._last_sequence = event.sequence
+            return True
+
+    def apply_lines(self, lines: Iterable[str | bytes]) -> int:
+        """
+        Aplica eventos serializados (um JSON por linha), ignorando linhas vazias.
+
+        Args:
+            lines (Iterable[str | bytes]): Linhas produzidas pelos destinos do CDC.
+
+        Returns:
+            int: Número de eventos aplicados.
+        """
+        applied = 0
+        for line in lines:
+            if line.strip() and self.apply(decode_event(line)):
+                applied += 1
+        return applied
+
+    def catch_up_file(self, path: str) -> int:
+        """
+        Aplica os eventos gravados no arquivo desde a última leitura.
+
+        Apenas linhas completas são consumidas; uma linha ainda em gravação é
+        lida na próxima chamada.
+
+        Args:
+            path (str): Arquivo gravado por um FileSink.
+
+        Returns:
+            int: Número de eventos aplicados.
+        """
+        if not os.path.exists(path):
+            return 0
+        with open(path, 'rb') as event_file:
+            event_file.seek(self._file_offset)
+            data = event_file.read()
+        end = data.rfind(b'\n') + 1
+        if end == 0:
+            return 0
+        self._file_offset += end
+        return self.apply_lines(data[:end].splitlines())
+
+    def follow_file(self, path: str, poll_interval: float = 0.1, stop: threading.Event = None):
+        """
+        Acompanha o arquivo de eventos, aplicando-os conforme são gravados.
+
+        Args:
+            path (str): Arquivo gravado por um FileSink.
+            poll_interval (float): Intervalo, em segundos, entre leituras sem novidades.
+            stop (threading.Event, optional): Evento que encerra o acompanhamento.
+        """
+        stop = stop or threading.Event()
+        while not stop.is_set():
+            if not self.catch_up_file(path):
+                stop.wait(poll_interval)
+
+    def serve_unix_socket(self, path: str, stop: threading.Event = None, accept_timeout: float = 0.5):
+        """
+        Escuta um socket Unix e aplica os eventos enviados por um UnixSocketSink.
+
+        As conexões são atendidas uma de cada vez; ao cair uma conexão, a
+        réplica volta a aguardar o reenvio do banco principal.
+
+        Args:
+            path (str): Caminho do socket a criar.
+            stop (threading.Event, optional): Evento que encerra o serviço.
+            accept_timeout (float): Intervalo, em segundos, para verificar `stop`.
+        """
+        stop = stop or threading.Event()
+        if os.path.exists(path):
+            os.unlink(path)
+        server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        server.bind(path)
+        server.listen(1)
+        server.settimeout(accept_timeout)
+        try:
+            while not stop.is_set():
+                try:
+                    connection, _ = server.accept()
+                except socket.timeout:
+                    continue
+                with connection:
+                    connection.settimeout(accept_timeout)
+                    pending = b''
+                    while not stop.is_set():
+                        try:
+                            data = connection.recv(65536)
+                        except socket.timeout:
+                            continue
+                        if not data:
+                            break
+                        pending += data
+                        end = pending.rfind(b'\n') + 1
+                        if end:
+                            self.apply_lines(pending[:end].splitlines())
+                            pending = pending[end:]
+        finally:
+            server.close()
+            if os.path.exists(path):
+                os.unlink(path)
+
+def summarize(bank: ReplicaBank) -> str:
+    """Resumo do estado da réplica para acompanhamento."""
+    total_balance = sum((account.balance for account in bank.accounts), Decimal('0'))
+    return (f"eventos aplicados: {bank.last_sequence} | clientes: {len(bank.clients)} | "
+            f"contas: {len(bank.accounts)} | transações: {len(bank.ledger)} | saldo total: R$ {total_balance:.2f}")
+
+def main(argv: List[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Réplica somente leitura do banco")
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument('--file', help="Arquivo de eventos gravado por um FileSink")
+    source.add_argument('--socket', help="Socket Unix onde escutar um UnixSocketSink")
+    parser.add_argument('--report-interval', type=float, default=5.0,
+                        help="Intervalo, em segundos, entre resumos do estado")
+    parser.add_argument('--lenient', action='store_true', help="Tolera lacunas na sequência de eventos")
+    args = parser.parse_args(argv)
+
+    replica = ReplicaBank(strict=not args.lenient)
+    stop = threading.Event()
+    if args.file:
+        target, source_args = replica.follow_file, (args.file, 0.1, stop)
+    else:
+        target, source_args = replica.serve_unix_socket, (args.socket, stop)
+    follower = threading.Thread(target=target, args=source_args, daemon=True)
+    follower.start()
+    try:
+        while follower.is_alive():
+            time.sleep(args.report_interval)
+            print(summarize(replica), flush=True)
+    except KeyboardInterrupt:
+        stop.set()
+        follower.join()
+    print(summarize(replica))
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,475 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal
+from itertools import count
+from multiprocessing.connection import Connection
+from typing import Any, Dict, List, Sequence, Tuple
+import multiprocessing
+import os
+
+from src.Bank import AGENCY_NUMBER, Bank
+from src.account_numbers import AccountNumberAllocator
+from src.cdc import client_data
+from src.entities import (Account, AccountNumber, Address, AgencyNumber, CPF, Client, DateOfBirth,
+                          TransactionStatus, Transfer)
+
+# Comandos aceitos pelos processos de shard
+COMMAND_CREATE_ACCOUNT = 'create_account'
+COMMAND_DEPOSIT = 'deposit'
+COMMAND_WITHDRAW = 'withdraw'
+COMMAND_TRANSFER = 'transfer'
+COMMAND_SEARCH_ACCOUNT = 'search_account'
+COMMAND_SIGNIN = 'signin'
+COMMAND_PREPARE_DEBIT = 'prepare_debit'
+COMMAND_PREPARE_CREDIT = 'prepare_credit'
+COMMAND_COMMIT = 'commit'
+COMMAND_ABORT = 'abort'
+COMMAND_BATCH = 'batch'
+COMMAND_STOP = 'stop'
+
+# Comandos executados pelo ShardWorker (os demais são tratados pelo laço do processo)
+WORKER_COMMANDS = (COMMAND_CREATE_ACCOUNT, COMMAND_DEPOSIT, COMMAND_WITHDRAW, COMMAND_TRANSFER,
+                   COMMAND_SEARCH_ACCOUNT, COMMAND_SIGNIN, COMMAND_PREPARE_DEBIT,
+                   COMMAND_PREPARE_CREDIT, COMMAND_COMMIT, COMMAND_ABORT)
+
+STATUS_OK = 'ok'
+STATUS_ERROR = 'error'
+
+def shard_for(account_number: int, shards: int) -> int:
+    """
+    Retorna o shard dono de uma conta.
+
+    Args:
+        account_number (int): Número da conta.
+        shards (int): Quantidade de shards.
+
+    Returns:
+        int: Índice do shard (0 a shards - 1).
+    """
+    return hash(int(account_number)) % shards
+
+class RemoteAccountReference:
+    """
+    Referência a uma conta de outro shard, usada nas transferências entre shards.
+
+    Oferece os atributos usados pelas descrições e pelo extrato (número,
+    agência e nome/CPF do cliente), sem acesso ao saldo.
+    """
+
+    class _ClientReference:
+        """Nome e CPF do titular da conta remota."""
+
+        def __init__(self, name: str, cpf: str):
+            self.name = name
+            self.cpf = cpf
+
+    def __init__(self, account_number: str, agency_number: str, client_name: str, client_cpf: str):
+        """
+        Args:
+            account_number (str): Número da conta remota.
+            agency_number (str): Número da agência remota.
+            client_name (str): Nome do titular.
+            client_cpf (str): CPF formatado do titular.
+        """
+        self.account_number = AccountNumber(account_number)
+        self.agency_number = AgencyNumber(agency_number)
+        self.client = self._ClientReference(client_name, client_cpf)
+
+def account_summary(account) -> dict:
+    """Informações de uma conta devolvidas pelos shards (serializáveis entre processos)."""
+    return {
+        'account_number': str(account.account_number),
+        'agency_number': str(account.agency_number),
+        'client_name': account.client.name,
+        'client_cpf': str(account.client.cpf),
+        'balance': str(account.balance),
+        'total_transactions': len(account.transactions)
+    }
+
+class ShardWorker:
+    """
+    Estado de um shard: um Bank com as contas cujo número pertence ao shard.
+
+    Executa os comandos recebidos do roteador. Transferências entre shards
+    seguem duas fases: `prepare_debit` reserva o valor na origem e
+    `prepare_credit` valida o destino; `commit` efetiva e registra a
+    transferência no histórico e `abort` desfaz a reserva.
+    """
+
+    def __init__(self, shard_id: int):
+        """
+        Args:
+            shard_id (int): Índice do shard.
+        """
+        self._shard_id = shard_id
+        self._bank = Bank()
+        self._accounts_by_number: Dict[int, Account] = {}
+        self._clients_by_cpf: Dict[str, Client] = {}
+        # Transferências preparadas: id -> (papel, conta local, transferência)
+        self._pending: Dict[str, Tuple[str, Account, Transfer]] = {}
+
+    @property
+    def bank(self) -> Bank:
+        """Retorna o Bank local do shard."""
+        return self._bank
+
+    def _account(self, account_number: int) -> Account:
+        """Retorna a conta local ou lança ValueError."""
+        account = self._accounts_by_number.get(int(account_number))
+        if account is None:
+            raise ValueError(f"Conta {account_number} não encontrada no shard {self._shard_id}")
+        return account
+
+    def create_account(self, client_info: dict, account_number: int) -> dict:
+        """Cadastra (ou reaproveita) o cliente e cria a conta com o número alocado pelo roteador."""
+        client = self._clients_by_cpf.get(client_info['cpf'])
+        if client is None:
+            client = Client(
+                name=client_info['name'],
+                cpf=CPF(client_info['cpf']),
+                date_of_birth=DateOfBirth(client_info['date_of_birth']),
+                address=Address(client_info['street'], client_info['number'], client_info['district'],
+                                client_info['city'], client_info['state'])
+            )
+            self._clients_by_cpf[client_info['cpf']] = client
+            self._bank.register_client(client)
+        account = Account(AccountNumber(account_number), AgencyNumber(AGENCY_NUMBER), client)
+        self._bank.register_account(client, account)
+        self._accounts_by_number[int(account_number)] = account
+        return account_summary(account)
+
+    def deposit(self, account_number: int, value: str, idempotency_key: str = None) -> str:
+        """Realiza um depósito e devolve o novo saldo."""
+        account = self._account(account_number)
+        account.deposit(Decimal(value), idempotency_key)
+        return str(account.balance)
+
+    def withdraw(self, account_number: int, value: str, idempotency_key: str = None) -> str:
+        """Realiza um saque e devolve o novo saldo."""
+        account = self._account(account_number)
+        account.withdraw(Decimal(value), idempotency_key)
+        return str(account.balance)
+
+    def transfer(self, source_number: int, destination_number: int, value: str,
+                 idempotency_key: str = None) -> str:
+        """Transferência entre contas do mesmo shard (caminho normal do Account.transfer)."""
+        source = self._account(source_number)
+        source.transfer(Decimal(value), self._account(destination_number), idempotency_key)
+        return str(source.balance)
+
+    def search_account(self, account_number: int) -> dict:
+        """Devolve as informações da conta (ou None)."""
+        account = self._accounts_by_number.get(int(account_number))
+        return account_summary(account) if account is not None else None
+
+    def signin(self, cpf: str, account_number: int) -> dict:
+        """Devolve as informações da conta se o CPF for do titular (ou None)."""
+        account = self._accounts_by_number.get(int(account_number))
+        if account is None or str(account.client.cpf) != cpf:
+            return None
+        return account_summary(account)
+
+    def prepare_debit(self, transfer_id: str, account_number: int, value: str, counterpart: dict,
+                      idempotency_key: str = None) -> dict:
+        """
+        Fase 1 na origem: valida a transferência e reserva o valor (`Account.reserve`).
+
+        Se a chave de idempotência já corresponder a uma transferência
+        efetivada, nada é reservado e o resultado indica `duplicate`, com o
+        saldo da transferência original.
+
+        Raises:
+            ValueError: Se o valor for inválido, o saldo insuficiente, o limite diário atingido
+                ou a chave de idempotência já tiver sido usada em outra operação.
+        """
+        account = self._account(account_number)
+        transaction = Transfer(account, RemoteAccountReference(**counterpart), Decimal(value))
+        result = account.reserve(transaction, idempotency_key)
+        if not result:
+            raise ValueError(result.message)
+        duplicate = result.status is TransactionStatus.DUPLICATE
+        if not duplicate:
+            self._pending[transfer_id] = ('debit', account, transaction)
+        return dict(account_summary(account), balance=str(result.balance), duplicate=duplicate)
+
+    def prepare_credit(self, transfer_id: str, account_number: int, value: str, counterpart: dict) -> dict:
+        """Fase 1 no destino: valida a conta e registra a transferência pendente."""
+        account = self._account(account_number)
+        transaction = Transfer(RemoteAccountReference(**counterpart), account, Decimal(value))
+        self._pending[transfer_id] = ('credit', account, transaction)
+        return account_summary(account)
+
+    def commit(self, transfer_id: str) -> bool:
+        """
+        Fase 2: efetiva a transferência preparada e a registra no histórico.
+
+        Na origem, a conclusão passa pelo log (`Transfer.complete`); no
+        destino, apenas o crédito é aplicado, para que cada transferência
+        apareça uma única vez no log.
+        """
+        pending = self._pending.pop(transfer_id, None)
+        if pending is None:
+            return False
+        role, account, transaction = pending
+        if role == 'debit':
+            transaction.complete()
+        else:
+            account.add_balance(transaction.value)
+            transaction._timestamp = datetime.now()
+        account.add_transaction(transaction)
+        return True
+
+    def abort(self, transfer_id: str) -> bool:
+        """Fase 2 (falha): desfaz a reserva da transferência preparada."""
+        pending = self._pending.pop(transfer_id, None)
+        if pending is None:
+            return False
+        role, account, transaction = pending
+        if role == 'debit':
+            account.add_balance(transaction.value)
+        return True
+
+    def handle(self, command: str, args: Sequence) -> Tuple[str, Any]:
+        """
+        Executa um comando e devolve (status, resultado ou mensagem de erro).
+
+        Lotes (`batch`) devolvem a lista de respostas de cada comando.
+        """
+        try:
+            if command == COMMAND_BATCH:
+                return STATUS_OK, [self.handle(inner, inner_args) for inner, inner_args in args]
+            if command not in WORKER_COMMANDS:
+                return STATUS_ERROR, f"Comando desconhecido: {command}"
+            return STATUS_OK, getattr(self, command)(*args)
+        except ValueError as error:
+            return STATUS_ERROR, str(error)
+        except Exception as error:
+            # Mensagens malformadas (argumentos errados, chaves ausentes) não derrubam o shard
+            return STATUS_ERROR, f"{type(error).__name__}: {error}"
+
+def _serve_shard(shard_id: int, connection: Connection):
+    """Laço principal do processo de shard."""
+    worker = ShardWorker(shard_id)
+    while True:
+        message = connection.recv()
+        try:
+            command, args = message
+        except (TypeError, ValueError):
+            connection.send((STATUS_ERROR, f"Mensagem inválida: {message!r}"))
+            continue
+        if command == COMMAND_STOP:
+            connection.send((STATUS_OK, None))
+            break
+        connection.send(worker.handle(command, args))
+    connection.close()
+
+class ShardedBank:
+    """
+    Banco particionado entre processos: cada shard é um processo com o seu
+    próprio Bank, dono das contas cujo número pertence a ele (`shard_for`).
+
+    O roteador aloca os números de conta, encaminha cada operação ao shard
+    dono e coordena as transferências entre shards em duas fases
+    (preparação na origem e no destino, depois confirmação ou cancelamento).
+    `execute_batch` envia lotes a todos os shards ao mesmo tempo, de modo que
+    a vazão cresce com o número de núcleos.
+    """
+
+    def __init__(self, shards: int = None, start_method: str = None):
+        """
+        Inicializa o roteador e inicia os processos.
+
+        Args:
+            shards (int, optional): Quantidade de shards (padrão: número de CPUs).
+            start_method (str, optional): Método de início do multiprocessing ('fork', 'spawn', ...).
+
+        Raises:
+            ValueError: Se a quantidade de shards for menor que 1.
+        """
+        shards = shards or os.cpu_count() or 1
+        if shards < 1:
+            raise ValueError("A quantidade de shards deve ser maior que zero")
+        context = multiprocessing.get_context(start_method)
+        self._shards = shards
+        self._connections: List[Connection] = []
+        self._processes = []
+        self._account_numbers = AccountNumberAllocator()
+        self._transfer_ids = count(1)
+        for shard_id in range(shards):
+            parent, child = context.Pipe()
+            process = context.Process(target=_serve_shard, args=(shard_id, child),
+                                      name=f'bank-shard-{shard_id}', daemon=True)
+            process.start()
+            child.close()
+            self._connections.append(parent)
+            self._processes.append(process)
+
+    @property
+    def shards(self) -> int:
+        """Retorna a quantidade de shards."""
+        return self._shards
+
+    def __enter__(self) -> ShardedBank:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _call(self, shard: int, command: str, *args) -> Any:
+        """Envia um comando a um shard e devolve o resultado (ou lança ValueError)."""
+        connection = self._connections[shard]
+        connection.send((command, args))
+        status, result = connection.recv()
+        if status == STATUS_ERROR:
+            raise ValueError(result)
+        return result
+
+    def _route(self, account_number) -> int:
+        """Shard dono do número de conta (int, str ou AccountNumber)."""
+        return shard_for(int(str(account_number)), self._shards)
+
+    def create_account(self, client: Client) -> int:
+        """
+        Cria uma conta para o cliente no shard dono do número alocado.
+
+        Args:
+            client (Client): Cliente dono da conta.
+
+        Raises:
+            ValueError: Se os números de conta se esgotaram.
+
+        Returns:
+            int: Número da conta criada.
+        """
+        account_number = self._account_numbers.allocate_int()
+        self._call(self._route(account_number), COMMAND_CREATE_ACCOUNT, client_data(client), account_number)
+        return account_number
+
+    def deposit(self, account_number: int, value: Decimal, idempotency_key: str = None) -> Decimal:
+        """Realiza um depósito e devolve o novo saldo (repetições com a mesma chave não são reaplicadas)."""
+        return Decimal(self._call(self._route(account_number), COMMAND_DEPOSIT, int(str(account_number)),
+                                  str(value), idempotency_key))
+
+    def withdraw(self, account_number: int, value: Decimal, idempotency_key: str = None) -> Decimal:
+        """Realiza um saque e devolve o novo saldo (repetições com a mesma chave não são reaplicadas)."""
+        return Decimal(self._call(self._route(account_number), COMMAND_WITHDRAW, int(str(account_number)),
+                                  str(value), idempotency_key))
+
+    def search_account(self, account_number: int) -> dict:
+        """Busca uma conta e devolve suas informações (ou None)."""
+        return self._call(self._route(account_number), COMMAND_SEARCH_ACCOUNT, int(str(account_number)))
+
+    def signin_account(self, cpf, account_number: int) -> dict:
+        """Autentica o acesso do cliente à conta e devolve suas informações (ou None)."""
+        return self._call(self._route(account_number), COMMAND_SIGNIN, str(cpf), int(str(account_number)))
+
+    def transfer(self, source_number: int, destination_number: int, value: Decimal,
+                 idempotency_key: str = None) -> bool:
+        """
+        Transfere entre contas, possivelmente em shards diferentes.
+
+        No mesmo shard, usa o Account.transfer do shard. Entre shards:
+            1. prepara o débito na origem (valida e reserva o valor);
+            2. prepara o crédito no destino;
+            3. confirma nos dois shards ou, se alguma preparação falhar,
+               cancela as já preparadas.
+
+        Com chave de idempotência, uma repetição é detectada na preparação
+        da origem e nenhuma fase seguinte é executada.
+
+        Raises:
+            ValueError: Se a transferência for recusada por algum shard.
+
+        Returns:
+            bool: True se bem-sucedida.
+        """
+        source_number, destination_number = int(str(source_number)), int(str(destination_number))
+        if source_number == destination_number:
+            raise ValueError("Não é possível transferir para a mesma conta")
+        source_shard = self._route(source_number)
+        destination_shard = self._route(destination_number)
+        if source_shard == destination_shard:
+            self._call(source_shard, COMMAND_TRANSFER, source_number, destination_number, str(value),
+                       idempotency_key)
+            return True
+
+        transfer_id = f"tx{next(self._transfer_ids)}"
+        source = self._call(source_shard, COMMAND_SEARCH_ACCOUNT, source_number)
+        destination = self._call(destination_shard, COMMAND_SEARCH_ACCOUNT, destination_number)
+        if source is None or destination is None:
+            raise ValueError("Conta de origem ou de destino não encontrada")
+
+        prepared = self._call(source_shard, COMMAND_PREPARE_DEBIT, transfer_id, source_number, str(value),
+                              self._counterpart(destination), idempotency_key)
+        if prepared['duplicate']:
+            return True
+        try:
+            self._call(destination_shard, COMMAND_PREPARE_CREDIT, transfer_id, destination_number, str(value),
+                       self._counterpart(source))
+        except ValueError:
+            self._call(source_shard, COMMAND_ABORT, transfer_id)
+            raise
+        self._call(source_shard, COMMAND_COMMIT, transfer_id)
+        self._call(destination_shard, COMMAND_COMMIT, transfer_id)
+        return True
+
+    @staticmethod
+    def _counterpart(summary: dict) -> dict:
+        """Dados da conta remota enviados na preparação."""
+        return {
+            'account_number': summary['account_number'],
+            'agency_number': summary['agency_number'],
+            'client_name': summary['client_name'],
+            'client_cpf': summary['client_cpf']
+        }
+
+    def execute_batch(self, operations: Sequence[Tuple[str, int, Decimal]]) -> List[Tuple[str, Any]]:
+        """
+        Executa depósitos e saques em paralelo nos shards.
+
+        As operações são agrupadas por shard e enviadas de uma vez a todos os
+        shards antes de aguardar as respostas.
+
+        Args:
+            operations (Sequence[Tuple[str, int, Decimal]]): Operações
+                ('deposit' ou 'withdraw', número da conta, valor).
+
+        Raises:
+            ValueError: Se alguma operação não for depósito ou saque.
+
+        Returns:
+            List[Tuple[str, Any]]: Para cada operação, na ordem recebida,
+                ('ok', novo saldo) ou ('error', mensagem).
+        """
+        batches: Dict[int, list] = {}
+        positions: Dict[int, List[int]] = {}
+        for position, (command, account_number, value) in enumerate(operations):
+            if command not in (COMMAND_DEPOSIT, COMMAND_WITHDRAW):
+                raise ValueError(f"Operação não suportada em lote: {command}")
+            shard = self._route(account_number)
+            batches.setdefault(shard, []).append((command, (int(str(account_number)), str(value))))
+            positions.setdefault(shard, []).append(position)
+
+        for shard, batch in batches.items():
+            self._connections[shard].send((COMMAND_BATCH, batch))
+        results: List[Tuple[str, Any]] = [None] * len(operations)
+        for shard in batches:
+            _, responses = self._connections[shard].recv()
+            for position, (status, result) in zip(positions[shard], responses):
+                results[position] = (status, Decimal(result) if status == STATUS_OK else result)
+        return results
+
+    def close(self):
+        """Encerra os processos de shard."""
+        for connection in self._connections:
+            try:
+                connection.send((COMMAND_STOP, ()))
+                connection.recv()
+            except (EOFError, OSError):
+                pass
+            connection.close()
+        for process in self._processes:
+            process.join()
+        self._connections.clear()
+        self._processes.clear()